@@ -0,0 +1,61 @@
+"""Cost of validating request body with `http.bind_model`.
+
+Compares parsing JSON into Python objects before validating them (two passes)
+with validating straight from bytes (`model_validate_json`, pydantic v2 only) on
+1 KB, 100 KB and 10 MB payloads. With pydantic v1 stdlib based `parse_raw` is
+measured instead of the single pass.
+
+Run from the repository root with `PYTHONPATH=. python benchmarks/http_bind_model.py`.
+"""
+import timeit
+
+import orjson
+from pydantic import BaseModel
+
+from moona.http.request_body import PYDANTIC_V2
+
+
+class Item(BaseModel):
+    """Item of the payload."""
+
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+
+
+class Payload(BaseModel):
+    """Request body."""
+
+    items: list[Item]
+
+
+def payload(size: int) -> bytes:
+    """JSON payload of about `size` bytes."""
+    item = {"id": 1, "name": "item", "price": 9.99, "tags": ["a", "b", "c"]}
+    count = max(1, size // len(orjson.dumps(item)))
+    return orjson.dumps({"items": [item] * count})
+
+
+def two_pass(data: bytes) -> Payload:
+    """Validate the way `bind_model` did before."""
+    return Payload.parse_obj(orjson.loads(data))
+
+
+def single_pass(data: bytes) -> Payload:
+    """Validate straight from bytes."""
+    match PYDANTIC_V2:
+        case True:
+            return Payload.model_validate_json(data)
+        case False:
+            return Payload.parse_raw(data)
+
+
+if __name__ == "__main__":
+    single = "model_validate_json" if PYDANTIC_V2 else "parse_raw"
+    for name, size in [("1 KB", 1024), ("100 KB", 100 * 1024), ("10 MB", 10 << 20)]:
+        data = payload(size)
+        number = max(1, (1 << 20) // size)
+        for func_name, func in [("loads+parse_obj", two_pass), (single, single_pass)]:
+            seconds = min(timeit.repeat(lambda: func(data), number=number, repeat=3))
+            print(f"{name:>6} {func_name:>19}: {seconds / number * 1000:.3f} ms")
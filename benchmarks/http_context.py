@@ -0,0 +1,80 @@
+"""Per-request cost of `HTTPContext` construction.
+
+Compares constructing context for an endpoint that does not look at the scope
+(health check) with one that touches every scope-derived field. The latter is
+the amount of work `HTTPContext.__init__` did eagerly before fields became lazy.
+
+Run from the repository root with `PYTHONPATH=. python benchmarks/http_context.py`.
+"""
+import timeit
+import tracemalloc
+
+from moona.http import HTTPContext
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.3"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/health/",
+    "raw_path": b"/health/",
+    "query_string": b"",
+    "root_path": "",
+    "client": ("127.0.0.1", 51234),
+    "server": ("127.0.0.1", 8000),
+    "headers": [
+        (b"Host", b"localhost:8000"),
+        (b"User-Agent", b"curl/8.0.1"),
+        (b"Accept", b"*/*"),
+        (b"Accept-Encoding", b"gzip, deflate, br"),
+        (b"Connection", b"keep-alive"),
+        (b"X-Request-Id", b"7b6d2f0c-5d33-4c1b-9f2f-3b0f4d2b8a61"),
+        (b"X-Forwarded-For", b"10.0.0.1"),
+        (b"X-Forwarded-Proto", b"https"),
+    ],
+}
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(_):
+    return None
+
+
+def lazy() -> HTTPContext:
+    """Construct context without touching scope-derived fields."""
+    return HTTPContext(SCOPE, _receive, _send)
+
+
+def eager() -> HTTPContext:
+    """Construct context and touch every scope-derived field."""
+    ctx = HTTPContext(SCOPE, _receive, _send)
+    ctx.request_headers
+    ctx.request_path
+    ctx.client
+    ctx.server
+    return ctx
+
+
+def allocated(func, n: int = 10_000) -> float:
+    """Average number of bytes allocated by `func` per call."""
+    contexts = []
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(n):
+        contexts.append(func())
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / n
+
+
+if __name__ == "__main__":
+    for name, func in [("eager (before)", eager), ("lazy (after)", lazy)]:
+        seconds = min(timeit.repeat(func, number=100_000, repeat=5))
+        print(
+            f"{name:>15}: {seconds * 10:.3f} us/request, "
+            f"{allocated(func):.0f} B/request"
+        )
@@ -0,0 +1,68 @@
+"""Per-request cost of responding with a constant body.
+
+Compares composing setters with `start >> respond`, which sets body, encodes
+header and builds both ASGI messages on every request, with `http.text` that
+sends messages built once when handler is created.
+
+Run from the repository root with `PYTHONPATH=. python benchmarks/http_response.py`.
+"""
+import asyncio
+import time
+import tracemalloc
+
+from moona.http import HTTPContext, end, respond, set_text, start, text
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.3"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [],
+}
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(_):
+    return None
+
+
+composed = (set_text("Hello, World!!!") >> start >> respond).compile(end)
+template = text("Hello, World!!!").compile(end)
+
+
+async def measure(app, n: int = 100_000) -> tuple[float, float]:
+    """Average time and peak memory allocated per request."""
+    started = time.perf_counter()
+    for _ in range(n):
+        await app(HTTPContext(SCOPE, _receive, _send))
+    seconds = time.perf_counter() - started
+
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(n // 100):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        await app(HTTPContext(SCOPE, _receive, _send))
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before
+    tracemalloc.stop()
+    return seconds / n * 1e6, allocated / (n // 100)
+
+
+async def main():
+    """Print results for both ways of responding."""
+    for name, app in [("composed (before)", composed), ("template (after)", template)]:
+        us, allocated = await measure(app)
+        print(f"{name:>17}: {us:.3f} us/request, {allocated:.0f} B/request peak")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,2 +1,3 @@
 from moona.http import HTTPContext, HTTPHandler
 from moona.lifespan import LifespanContext, LifespanHandler
+from moona.websocket import WebsocketContext, WebsocketHandler
@@ -1,4 +1,6 @@
-from moona import http, lifespan
+from typing import Any
+
+from moona import http, lifespan, websocket
 from moona.context import ASGIApp, Receive, Scope, Send
 
 
@@ -9,8 +11,11 @@ async def _handle_lifespan(
     *,
     startup_handler: lifespan.LifespanHandler = None,
     shutdown_handler: lifespan.LifespanHandler = None,
+    state: dict[str, Any] | None = None,
 ) -> None:
     ctx = lifespan.LifespanContext(scope, receive, send)
+    if state is not None:
+        ctx.state = state
     while True:
         match await ctx.receive():
             case {"type": "lifespan.startup"}:
@@ -38,37 +43,116 @@ async def _handle_http(
     receive: Receive,
     send: Send,
     *,
-    http_handler: http.HTTPHandler = None,
+    http_func: http.HTTPFunc = None,
+    max_body_size: int | None = None,
+    state: dict[str, Any] | None = None,
 ):
     ctx = http.HTTPContext(scope, receive, send)
-    await http_handler(http.end, ctx)
+    ctx.max_body_size = max_body_size
+    if state is not None:
+        ctx.state = state
+    await http_func(ctx)
+
+
+_default_websocket_handler = websocket.close()
+
+
+async def _handle_websocket(
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    *,
+    websocket_func: websocket.WebsocketFunc = None,
+    max_queue: int = websocket.DEFAULT_MAX_QUEUE,
+    state: dict[str, Any] | None = None,
+) -> None:
+    match await receive():
+        case {"type": "websocket.connect"}:
+            pass
+        case _:
+            return
+    ctx = websocket.WebsocketContext(scope, receive, send, max_queue)
+    if state is not None:
+        ctx.state = state
+    try:
+        await websocket_func(ctx)
+    except Exception:
+        await websocket.close_connection(ctx, websocket.INTERNAL_ERROR)
+        raise
+    await websocket.close_connection(ctx)
+
+
+def _compile_http(http_handler: http.HTTPHandler) -> http.HTTPFunc:
+    match http_handler:
+        case http.HTTPHandler():
+            return http_handler.compile(http.end)
+        case _:
+            return http.HTTPHandler(http_handler).compile(http.end)
+
+
+def _compile_websocket(
+    websocket_handler: websocket.WebsocketHandler,
+) -> websocket.WebsocketFunc:
+    match websocket_handler:
+        case websocket.WebsocketHandler():
+            return websocket_handler.compile(websocket.end)
+        case _:
+            return websocket.WebsocketHandler(websocket_handler).compile(websocket.end)
 
 
 def create(
     *,
     http_handler: http.HTTPHandler = _default_http_handler,
+    websocket_handler: websocket.WebsocketHandler = _default_websocket_handler,
     startup_handler: lifespan.LifespanHandler = None,
     shutdown_handler: lifespan.LifespanHandler = None,
+    max_body_size: int | None = None,
+    head_as_get: bool = False,
+    websocket_max_queue: int = websocket.DEFAULT_MAX_QUEUE,
+    state: dict[str, Any] | None = None,
 ) -> ASGIApp:
     """Constructs ASGI Server function from passed handler.
 
-    Supports 2 types of request scopes: "http" and "lifetime". For "http" scope
-    `HTTPContext` is created and used as an argument for the `handler` (via `future`).
-    For "lifetime" `LifetimeContext` is created and also used as argument for `handler`.
+    Supports 3 types of request scopes: "http", "websocket" and "lifetime". For "http"
+    scope `HTTPContext` is created and used as an argument for the `handler` (via
+    `future`). For "websocket" `WebsocketContext` is created once "websocket.connect"
+    is received, after the handler finishes messages left in the outbox are sent and
+    connection is closed (or rejected if it was not accepted), on error it is closed
+    with 1011 code. For "lifetime" `LifetimeContext` is created and also used as
+    argument for `handler`.
+
+    `http_handler` and `websocket_handler` are compiled once (see
+    `HTTPHandler.compile`) so composition of handlers is not rebuilt on each request.
 
     Notes:
         * https://asgi.readthedocs.io/en/latest/specs/main.html#applications
 
     Args:
         http_handler (HTTPHandler): optional argument for handling "http" requests.
+        websocket_handler (WebsocketHandler): optional argument for handling
+        "websocket" connections. By default connections are rejected.
         on_startup_handler (LifespanHandler): optional for handlers to be executed on
         server startup
         on_shutdown_handler (LifespanHandler): optional for handlers to be executed on
         server shutdown
+        max_body_size (int | None): optional limit of request body size in bytes.
+        Larger bodies are rejected with 413 Payload Too Large.
+        head_as_get (bool): handle HEAD requests with GET handlers sending only
+        response headers (see `http.head_as_get`).
+        websocket_max_queue (int): size of outbound message queue of each websocket
+        connection.
+        state (dict[str, Any] | None): state of the application (for example shared
+        `websocket.Hub`) available to all the handlers as `ctx.state`. By default
+        state provided by the server in the scope is used.
 
     Returns:
         ASGIApp: ASGI function based on ASGI Specification.
     """
+    match head_as_get:
+        case True:
+            http_handler = http.head_as_get >> http_handler
+    http_func = _compile_http(http_handler)
+    websocket_func = _compile_websocket(websocket_handler)
 
     async def _asgi(scope: Scope, receive: Receive, send: Send) -> None:
         match scope:
@@ -79,13 +163,25 @@ def create(
                     send,
                     startup_handler=startup_handler,
                     shutdown_handler=shutdown_handler,
+                    state=state,
                 )
             case {"type": "http"}:
                 await _handle_http(
                     scope,
                     receive,
                     send,
-                    http_handler=http_handler,
+                    http_func=http_func,
+                    max_body_size=max_body_size,
+                    state=state,
+                )
+            case {"type": "websocket"}:
+                await _handle_websocket(
+                    scope,
+                    receive,
+                    send,
+                    websocket_func=websocket_func,
+                    max_queue=websocket_max_queue,
+                    state=state,
                 )
 
     return _asgi
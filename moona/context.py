@@ -16,7 +16,7 @@ class BaseContext(Protocol):
     Mainly there are 3 kinds:
     * `HTTPContext` for "http" request scopes
     * `LifespanContext` for "lifetime" request scopes
-    * `WebsocketContext` (not implemented)
+    * `WebsocketContext` for "websocket" connection scopes
     """
 
     send: Send
@@ -1,11 +1,23 @@
-from .context import HTTPContext
-from .events import receive, respond, start
+from .cache import ResponseCache, cache
+from .compression import compress
+from .conditional import etag, if_none_match, not_modified, weak_etag
+from .context import Headers, HTTPContext, parse_query
+from .events import (
+    PayloadTooLarge,
+    iter_body,
+    receive,
+    respond,
+    respond_stream,
+    respond_with,
+    start,
+)
 from .handlers import (
     HTTPFunc,
     HTTPHandler,
     choose,
     compose,
     end,
+    guard,
     handle_func,
     handle_func_sync,
     handler,
@@ -14,8 +26,27 @@ from .handlers import (
     handler3,
     skip,
 )
-from .request_body import bind_dict, bind_int, bind_model, bind_raw, bind_text
-from .request_headers import has_header
+from .request_body import (
+    bind_dict,
+    bind_int,
+    bind_model,
+    bind_ndjson,
+    bind_ndjson_model,
+    bind_raw,
+    bind_stream,
+    bind_text,
+    iter_lines,
+    max_body_size,
+)
+from .request_headers import (
+    accepted_media_types,
+    choose_encoding,
+    etag_matches,
+    has_header,
+    host,
+    matches_header,
+    parse_qvalues,
+)
 from .request_method import (
     CONNECT,
     DELETE,
@@ -26,9 +57,11 @@ from .request_method import (
     POST,
     PUT,
     TRACE,
+    head_as_get,
     method,
 )
 from .request_route import (
+    bind,
     bind_params,
     bind_query,
     route,
@@ -36,8 +69,24 @@ from .request_route import (
     subroute,
     subroute_ci,
 )
-from .response_body import json, negotiate, raw, set_json, set_raw, set_text, text
+from .response_body import (
+    json,
+    negotiate,
+    raw,
+    register_serializer,
+    serialize,
+    serialize_csv,
+    serialize_msgpack,
+    serialized,
+    set_json,
+    set_raw,
+    set_text,
+    stream,
+    text,
+)
+from .response_file import file, iter_file
 from .response_headers import (
+    add_header,
     content_length,
     content_type,
     content_type_application_json,
@@ -62,6 +111,7 @@ from .response_status import (
     not_found,
     not_implemented,
     ok,
+    payload_too_large,
     precondition_required,
     service_unavailable,
     set_accepted,
@@ -81,6 +131,7 @@ from .response_status import (
     set_not_found,
     set_not_implemented,
     set_ok,
+    set_payload_too_large,
     set_precondition_required,
     set_response_status,
     set_service_unavailable,
@@ -94,3 +145,6 @@ from .response_status import (
     unprocessable_entity,
     unsupported_media_type,
 )
+from .router import router
+from .sse import ReplayBuffer, ServerSentEvent, format_event, sse
+from .static import static
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Hashable, Iterable, NamedTuple
+
+from moona.context import Message, Send
+from moona.http.context import Headers, HTTPContext
+from moona.http.events import EMPTY_BODY
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler
+from moona.utils import LRUCache
+
+CachedResponse = NamedTuple(
+    "CachedResponse",
+    [
+        ("status", int),
+        ("headers", list[tuple[bytes, bytes]]),
+        ("body", bytes),
+        ("expires", float),
+    ],
+)
+
+
+def _sizeof(response: CachedResponse) -> int:
+    return len(response.body) + sum(
+        len(name) + len(value) for name, value in response.headers
+    )
+
+
+@dataclass(slots=True, init=False)
+class ResponseCache:
+    """In-memory storage for `cache` handler.
+
+    Entries live for `ttl` seconds and are evicted in LRU order when there are more
+    than `max_entries` of them or their total size exceeds `max_size` bytes.
+    `hits` and `misses` count lookups.
+    """
+
+    ttl: float
+    hits: int
+    misses: int
+    _entries: LRUCache[Hashable, CachedResponse]
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 1024,
+        max_size: int | None = 64 * 1024 * 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = LRUCache(max_entries, max_size, _sizeof)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted to stay within the bounds."""
+        return self._entries.evictions
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Returns response stored for the `key` if it has not expired yet."""
+        match self._entries.get(key):
+            case CachedResponse(expires=expires) as response if (
+                expires > time.monotonic()
+            ):
+                self.hits += 1
+                return response
+            case CachedResponse():
+                self._entries.pop(key)
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: Hashable,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        """Stores response for the `key`."""
+        expires = time.monotonic() + self.ttl
+        self._entries.put(key, CachedResponse(status, headers, body, expires))
+
+    def clear(self) -> None:
+        """Removes all stored responses."""
+        self._entries.clear()
+
+
+@dataclass(slots=True)
+class _RecordingSend:
+    """ASGI `send` wrapper that keeps response sent in a single body message."""
+
+    send: Send
+    start: Message | None = None
+    body: bytes | None = None
+
+    async def __call__(self, msg: Message) -> None:
+        match msg:
+            case {"type": "http.response.start"}:
+                self.start = msg
+            case {"type": "http.response.body", "more_body": True}:
+                self.start = None
+            case {"type": "http.response.body"} if self.start is not None:
+                self.body = msg.get("body", b"")
+            case _:
+                self.start = None
+        await self.send(msg)
+
+
+def _storable(start: Message, vary: tuple[bytes, ...]) -> bool:
+    match start.get("status", None):
+        case 200:
+            pass
+        case _:
+            return False
+    for name, value in start.get("headers", []):
+        match name.lower():
+            case b"set-cookie":
+                return False
+            case b"cache-control" if b"no-store" in value or b"private" in value:
+                return False
+            case b"vary" if any(
+                header.strip().lower() not in vary for header in value.split(b",")
+            ):
+                # response depends on request headers that are not part of the key
+                return False
+    return True
+
+
+def cache(
+    ttl: float = 60.0,
+    max_entries: int = 1024,
+    vary: Iterable[str] = (),
+    max_size: int | None = 64 * 1024 * 1024,
+    store: ResponseCache | None = None,
+) -> HTTPHandler:
+    """Cache responses for GET and HEAD requests in memory.
+
+    Responses are keyed by request method, path, query string and values of request
+    headers listed in `vary`. On a hit stored status, headers and body are sent
+    right away and the rest of the pipeline is not executed. On a miss the pipeline
+    is executed and response is stored if it was sent with a single body message
+    (as `respond` does), has 200 status, neither sets cookies nor forbids storing
+    with "Cache-Control" and its "Vary" header lists only headers from `vary` (so
+    responses of `compress` are stored only when "Accept-Encoding" is among them).
+    Bodyless responses to HEAD requests are never stored,
+    but HEAD requests handled as GET ones (see `head_as_get`) are answered with
+    headers of stored GET responses.
+
+    Pass own `store` to inspect `hits` and `misses` counters or to share the
+    storage between handlers, otherwise `ttl`, `max_entries` and `max_size` are
+    used to create one.
+
+    Args:
+        ttl (float): seconds response is kept for.
+        max_entries (int): maximum number of stored responses.
+        vary (Iterable[str]): request headers which values are part of the key.
+        max_size (int | None): maximum total size of stored responses in bytes.
+        store (ResponseCache | None): storage to use.
+    """
+    store = store if store is not None else ResponseCache(ttl, max_entries, max_size)
+    vary = tuple(name.lower().encode("UTF-8") for name in vary)
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        match ctx.request_method:
+            case "GET" | "HEAD":
+                pass
+            case _:
+                return await nxt(ctx)
+
+        headers = ctx.request_headers
+        key = (
+            ctx.request_method,
+            ctx.request_path,
+            ctx.request_query_string,
+            tuple(headers.get(name, None) for name in vary),
+        )
+        match store.get(key):
+            case CachedResponse(status, headers, body):
+                ctx.response_status = status
+                ctx.response_headers = Headers(headers)
+                ctx.response_body = body
+                ctx.started = True
+                ctx.closed = True
+                match ctx.skip_body:
+                    case True:
+                        length = str(len(body)).encode("UTF-8")
+                        ctx.response_headers.setdefault(b"content-length", length)
+                        headers, message = ctx.response_headers, EMPTY_BODY
+                    case False:
+                        message = {"type": "http.response.body", "body": body}
+                await ctx.send(
+                    {
+                        "type": "http.response.start",
+                        "status": status,
+                        "headers": headers,
+                    }
+                )
+                await ctx.send(message)
+                return ctx
+
+        match ctx.skip_body:
+            case True:
+                return await nxt(ctx)
+
+        ctx.send = recorder = _RecordingSend(ctx.send)
+        result = await nxt(ctx)
+        match recorder:
+            case _RecordingSend(start=dict() as start, body=bytes() as body) if (
+                _storable(start, vary)
+            ):
+                store.put(key, start["status"], list(start.get("headers", [])), body)
+        return result
+
+    return _handler
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, NamedTuple
+
+from fundom import future
+
+from moona.context import Message, Send
+from moona.http.context import Headers, HTTPContext
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler
+from moona.http.request_headers import choose_encoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+Encoder = NamedTuple(
+    "Encoder",
+    [
+        ("compress", Callable[[bytes], bytes]),
+        ("flush", Callable[[], bytes]),
+        ("finish", Callable[[], bytes]),
+    ],
+)
+
+
+def _zlib_encoder(wbits: int, level: int) -> Encoder:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+    return Encoder(
+        compressor.compress,
+        partial(compressor.flush, zlib.Z_SYNC_FLUSH),
+        compressor.flush,
+    )
+
+
+def _brotli_encoder(level: int) -> Encoder:
+    compressor = brotli.Compressor(quality=level)
+    return Encoder(compressor.process, compressor.flush, compressor.finish)
+
+
+def _zstd_encoder(level: int) -> Encoder:
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return Encoder(
+        compressor.compress,
+        partial(compressor.flush, zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        compressor.flush,
+    )
+
+
+ENCODERS: dict[str, Callable[[int], Encoder]] = {
+    **({"br": _brotli_encoder} if brotli is not None else {}),
+    **({"zstd": _zstd_encoder} if zstandard is not None else {}),
+    "gzip": partial(_zlib_encoder, 31),
+    "deflate": partial(_zlib_encoder, 15),
+}
+
+COMPRESSED_TYPES = (
+    b"image/",
+    b"audio/",
+    b"video/",
+    b"font/woff",
+    b"application/zip",
+    b"application/gzip",
+    b"application/x-gzip",
+    b"application/zstd",
+    b"application/x-7z-compressed",
+    b"application/x-bzip2",
+    b"application/x-rar-compressed",
+    b"application/x-xz",
+)
+
+
+def _compressible(headers: Headers) -> bool:
+    match headers.get(b"content-encoding"), headers.get(b"content-type"):
+        case bytes(), _:
+            return False
+        case None, bytes() as content_type:
+            content_type = content_type.lower()
+            return content_type.startswith(b"image/svg") or not content_type.startswith(
+                COMPRESSED_TYPES
+            )
+        case _:
+            return True
+
+
+def _vary(value: bytes | None) -> bytes:
+    match value:
+        case None | b"":
+            return b"accept-encoding"
+        case value if b"accept-encoding" in value.lower():
+            return value
+        case value:
+            return value + b", accept-encoding"
+
+
+@dataclass(slots=True)
+class _CompressingSend:
+    """ASGI `send` wrapper that compresses response body."""
+
+    send: Send
+    encoding: str
+    min_size: int
+    level: int
+    skip_body: bool
+    start: Message | None = None
+    encoder: Encoder | None = None
+
+    async def __call__(self, msg: Message) -> None:
+        match msg:
+            case {"type": "http.response.start"}:
+                self.start = msg
+            case {"type": "http.response.body"} if self.start is not None:
+                await self._send_first(msg)
+            case {"type": "http.response.body"} if self.encoder is not None:
+                more_body = msg.get("more_body", False)
+                body = self.encoder.compress(msg.get("body", b""))
+                match more_body:
+                    case True:
+                        body += self.encoder.flush()
+                    case False:
+                        body += self.encoder.finish()
+                await self.send(
+                    {"type": "http.response.body", "body": body, "more_body": more_body}
+                )
+            case _ if self.start is not None:
+                start, self.start = self.start, None
+                await self.send(start)
+                await self.send(msg)
+            case _:
+                await self.send(msg)
+
+    async def _send_first(self, msg: Message) -> None:
+        start, self.start = self.start, None
+        body = msg.get("body", b"")
+        more_body = msg.get("more_body", False)
+        headers = Headers(start.get("headers", []))
+        match self.skip_body:
+            case True:
+                # body is not produced, decide by its declared size as for GET
+                length = headers.get(b"content-length", b"")
+                size = int(length) if length.isdigit() else None
+                compressed = size is None or size >= self.min_size
+            case False:
+                compressed = more_body or len(body) >= self.min_size
+        match _compressible(headers) and compressed:
+            case False:
+                await self.send(start)
+                await self.send(msg)
+                return
+
+        headers.pop_all(b"content-length")
+        headers.add(b"content-encoding", self.encoding.encode("UTF-8"))
+        headers.set(b"vary", _vary(headers.get(b"vary")))
+        match self.skip_body:
+            case True:
+                await self.send({**start, "headers": headers})
+                await self.send(msg)
+                return
+
+        self.encoder = ENCODERS[self.encoding](self.level)
+        match more_body:
+            case True:
+                body = self.encoder.compress(body) + self.encoder.flush()
+            case False:
+                body = self.encoder.compress(body) + self.encoder.finish()
+                headers.add(b"content-length", str(len(body)).encode("UTF-8"))
+
+        await self.send({**start, "headers": headers})
+        await self.send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+
+def compress(min_size: int = 500, level: int = 6) -> HTTPHandler:
+    """Compress response body with the best content coding client accepts.
+
+    Handler must be placed before handlers that respond. It intercepts messages sent
+    to the client: for single-message bodies whole body is compressed and
+    "Content-Length" is adjusted, streamed bodies are compressed chunk by chunk (each
+    chunk is flushed so client receives data without delay). "Content-Encoding" and
+    "Vary" headers are set.
+
+    Bodies smaller than `min_size` bytes, bodies that already have
+    "Content-Encoding" and bodies of already compressed media types (images, audio,
+    video, archives) are sent as is.
+
+    When `HTTPContext.skip_body` is set (HEAD requests) the decision is made from
+    declared "Content-Length" and "Content-Type", so headers match the ones sent for
+    GET, except for "Content-Length" that is dropped as size of the compressed body
+    is not known.
+
+    "gzip" and "deflate" are always available, "br" and "zstd" are preferred when
+    `brotli` and `zstandard` packages are installed.
+
+    Args:
+        min_size (int): minimal body size to compress.
+        level (int): compression level passed to the compressor.
+    """
+    available = tuple(ENCODERS)
+
+    @handler
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        accept_encoding = ctx.request_headers.get(b"accept-encoding", b"")
+        match choose_encoding(accept_encoding, available):
+            case str() as encoding:
+                ctx.send = _CompressingSend(
+                    ctx.send, encoding, min_size, level, ctx.skip_body
+                )
+        return nxt(ctx)
+
+    return _handler
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+from moona.context import Message, Send
+from moona.http.context import Headers, HTTPContext
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler
+from moona.http.request_headers import etag_matches
+from moona.http.response_status import NOT_MODIFIED
+
+# headers that describe the body and must not be sent with 304 Not Modified
+BODY_HEADERS = (b"content-length", b"content-type", b"content-encoding")
+
+
+def weak_etag(body: bytes) -> bytes:
+    """Returns weak entity tag for the response `body`.
+
+    Args:
+        body (bytes): response body.
+
+    Returns:
+        bytes: quoted weak entity tag.
+    """
+    digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+    return b'W/"' + digest.encode("ascii") + b'"'
+
+
+def _modified_since(value: bytes, last_modified: bytes) -> bool:
+    try:
+        since = parsedate_to_datetime(value.decode("latin-1"))
+        modified = parsedate_to_datetime(last_modified.decode("latin-1"))
+        return modified > since
+    except (TypeError, ValueError):
+        return True
+
+
+def not_modified(
+    request_headers: Headers, etag: bytes | None, last_modified: bytes | None
+) -> bool:
+    """Checks if request validators match the response ones.
+
+    "If-None-Match" is checked against `etag` and, when it is absent,
+    "If-Modified-Since" is checked against `last_modified`.
+
+    Args:
+        request_headers (Headers): request headers.
+        etag (bytes | None): response entity tag.
+        last_modified (bytes | None): response "Last-Modified" header value.
+
+    Returns:
+        bool: client's copy is up to date.
+    """
+    match request_headers.get(b"if-none-match", None), etag:
+        case bytes() as value, bytes():
+            return etag_matches(value, etag)
+        case bytes() as value, None:
+            return value.strip() == b"*"
+    match request_headers.get(b"if-modified-since", None), last_modified:
+        case bytes() as value, bytes():
+            return not _modified_since(value, last_modified)
+    return False
+
+
+def _not_modified_start(start: Message, headers: Headers) -> Message:
+    for name in BODY_HEADERS:
+        headers.pop_all(name)
+    return {**start, "status": NOT_MODIFIED, "headers": headers}
+
+
+@dataclass(slots=True)
+class _ConditionalSend:
+    """ASGI `send` wrapper that replaces responses client already has with 304."""
+
+    send: Send
+    ctx: HTTPContext
+    start: Message | None = None
+    suppress: bool = False
+
+    async def __call__(self, msg: Message) -> None:
+        match msg:
+            case _ if self.suppress:
+                pass
+            case {"type": "http.response.start", "status": 200}:
+                headers = Headers(msg.get("headers", []))
+                match headers.get(b"etag", None) is None:
+                    case True:
+                        self.start = msg
+                    case False:
+                        await self._send_start(msg, headers)
+            case {"type": "http.response.body"} if self.start is not None:
+                await self._send_first(msg)
+            case _:
+                await self.send(msg)
+
+    async def _send_start(self, start: Message, headers: Headers) -> None:
+        etag, last_modified = headers.get(b"etag", None), headers.get(
+            b"last-modified", None
+        )
+        match not_modified(self.ctx.request_headers, etag, last_modified):
+            case True:
+                self.suppress = True
+                await self.send(_not_modified_start(start, headers))
+                await self.send({"type": "http.response.body", "body": b""})
+            case False:
+                await self.send(start)
+
+    async def _send_first(self, msg: Message) -> None:
+        start, self.start = self.start, None
+        headers = Headers(start.get("headers", []))
+        match msg.get("more_body", False), self.ctx.skip_body:
+            case False, False:
+                headers.add(b"etag", weak_etag(msg.get("body", b"")))
+            case False, True:
+                # body is not sent, but it is known when its length is declared
+                match self.ctx.response_body, headers.get(b"content-length", None):
+                    case bytes() as body, bytes() as length if (
+                        length == str(len(body)).encode("UTF-8")
+                    ):
+                        headers.add(b"etag", weak_etag(body))
+        await self._send_start({**start, "headers": headers}, headers)
+        if not self.suppress:
+            await self.send(msg)
+
+
+@handler
+async def etag(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+    """Answer conditional GET and HEAD requests with 304 Not Modified.
+
+    Handler must be placed before handlers that respond (and before `cache` to
+    answer cache hits with 304 too). For 200 responses that are sent with a single
+    body message and have no "ETag" header, weak entity tag is computed from the
+    body and added to the response. ETag set by the handler (for example with
+    `if_none_match`) is used as is and is checked before any body is sent, so
+    streamed responses are supported too. When request's "If-None-Match" (or
+    "If-Modified-Since" checked against "Last-Modified") matches, bodyless 304 is
+    sent instead of the response.
+
+    When `HTTPContext.skip_body` is set (HEAD requests) the body is not sent, so the
+    tag is computed from `HTTPContext.response_body` only when declared
+    "Content-Length" matches it (as `respond` and `respond_with` declare). Bodies
+    streamed by the handler get no tag for HEAD. Place `etag` after `compress` so
+    the tag is computed from the same uncompressed body for GET and HEAD.
+
+    Args:
+        nxt (HTTPFunc): to execute next.
+        ctx (HTTPContext): context of the request.
+    """
+    match ctx.request_method:
+        case "GET" | "HEAD":
+            ctx.send = _ConditionalSend(ctx.send, ctx)
+    return await nxt(ctx)
+
+
+def if_none_match(version: Callable[[HTTPContext], str | None]) -> HTTPHandler:
+    """Respond 304 Not Modified before doing any work if client's copy is current.
+
+    `version` must cheaply compute version token of the resource (revision number,
+    update timestamp and so on). Token is sent as weak "ETag" header, when request's
+    "If-None-Match" matches it, bodyless 304 is sent and the rest of the pipeline is
+    not executed. When `version` returns `None` request is passed on unchanged.
+
+    Args:
+        version (Callable[[HTTPContext], str | None]): computes resource version.
+    """
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        match ctx.request_method, version(ctx):
+            case ("GET" | "HEAD"), str() as token:
+                tag = b'W/"' + token.encode("UTF-8") + b'"'
+                ctx.response_headers.set(b"etag", tag)
+            case _:
+                return await nxt(ctx)
+
+        match etag_matches(ctx.request_headers.get(b"if-none-match", b""), tag):
+            case False:
+                return await nxt(ctx)
+
+        headers = ctx.response_headers
+        for name in BODY_HEADERS:
+            headers.pop_all(name)
+        ctx.response_status = NOT_MODIFIED
+        ctx.response_body = b""
+        ctx.started = True
+        ctx.closed = True
+        await ctx.send(
+            {"type": "http.response.start", "status": NOT_MODIFIED, "headers": headers}
+        )
+        await ctx.send({"type": "http.response.body", "body": b""})
+        return ctx
+
+    return _handler
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import NamedTuple, TypeVar
+from typing import Any, Iterable, NamedTuple, TypeVar
+from urllib.parse import parse_qsl
 
 from fundom import future, hof1, hof2
 from toolz import keymap
@@ -12,6 +13,134 @@ T = TypeVar("T")
 
 ClientInfo = NamedTuple("ClientInfo", [("host", str), ("port", int)])
 ServerInfo = NamedTuple("ServerInfo", [("host", str), ("port", int | None)])
+Header = tuple[bytes, bytes]
+
+
+class Headers(list[Header]):
+    """Response headers stored as encoded `(name, value)` pairs.
+
+    It is a plain list, so it can be passed to ASGI "http.response.start" message
+    without copying, and the same name may occur several times (e.g. "set-cookie").
+    Besides that it supports mapping-like access by lowercased encoded name: getting
+    returns the last value, setting replaces all values with the single one.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):  # noqa
+        match key:
+            case bytes():
+                for name, value in reversed(self):
+                    if name == key:
+                        return value
+                raise KeyError(key)
+            case _:
+                return list.__getitem__(self, key)
+
+    def __setitem__(self, key, value) -> None:  # noqa
+        match key:
+            case bytes():
+                self.set(key, value)
+            case _:
+                list.__setitem__(self, key, value)
+
+    def __delitem__(self, key) -> None:  # noqa
+        match key:
+            case bytes():
+                if self.pop_all(key) == []:
+                    raise KeyError(key)
+            case _:
+                list.__delitem__(self, key)
+
+    def __contains__(self, key) -> bool:  # noqa
+        match key:
+            case bytes():
+                return any(name == key for name, _ in self)
+            case _:
+                return list.__contains__(self, key)
+
+    def get(self, name: bytes, default: bytes | None = None) -> bytes | None:
+        """Returns last value of the header `name` or `default`."""
+        for _name, value in reversed(self):
+            if _name == name:
+                return value
+        return default
+
+    def get_all(self, name: bytes) -> list[bytes]:
+        """Returns all values of the header `name`."""
+        return [value for _name, value in self if _name == name]
+
+    def add(self, name: bytes, value: bytes) -> None:
+        """Adds one more value for the header `name`."""
+        self.append((name, value))
+
+    def set(self, name: bytes, value: bytes) -> None:  # noqa
+        """Sets the only value for the header `name` keeping its position."""
+        position = next((i for i, (_name, _) in enumerate(self) if _name == name), None)
+        match position:
+            case None:
+                self.append((name, value))
+            case position:
+                rest = [header for header in self[position:] if header[0] != name]
+                del self[position:]
+                self.append((name, value))
+                self.extend(rest)
+
+    def setdefault(self, name: bytes, value: bytes) -> bytes:
+        """Sets header `name` to `value` if it is not set and returns its value."""
+        match self.get(name):
+            case None:
+                self.append((name, value))
+                return value
+            case current:
+                return current
+
+    def pop_all(self, name: bytes) -> list[bytes]:
+        """Removes all values of the header `name` and returns them."""
+        values = self.get_all(name)
+        if values:
+            self[:] = [header for header in self if header[0] != name]
+        return values
+
+    def update(self, headers: Iterable[Header] | dict[bytes, bytes]) -> None:  # noqa
+        """Sets headers from `headers` replacing current values with the same names."""
+        match headers:
+            case dict():
+                headers = headers.items()
+        for name, value in headers:
+            self.set(name, value)
+
+    def items(self) -> Headers:
+        """Returns `(name, value)` pairs, that is headers themselves."""
+        return self
+
+
+def parse_query(query_string: bytes) -> dict[str, list[str]]:
+    """Parses query string to parameters with all their values.
+
+    "+" is decoded to space and "%xx" sequences are decoded as UTF-8 (invalid ones
+    are replaced), parameters without "=" get empty string value.
+
+    Args:
+        query_string (bytes): raw query string.
+
+    Returns:
+        dict[str, list[str]]: parameters.
+    """
+    query: dict[str, list[str]] = {}
+    match query_string:
+        case b"":
+            return query
+    pairs = parse_qsl(
+        query_string.decode("latin-1"), keep_blank_values=True, errors="replace"
+    )
+    for name, value in pairs:
+        match query.get(name):
+            case None:
+                query[name] = [value]
+            case values:
+                values.append(value)
+    return query
 
 
 @dataclass(slots=True)
@@ -22,6 +151,16 @@ class HTTPContext(BaseContext):
     It contains information on both request and response and also functions for sending
     and receiving information.
 
+    Fields that require processing of the scope (`request_path`, `request_headers`,
+    `request_query`, `client` and `server`) are computed on first access and cached,
+    so handlers that never look at them do not pay for it.
+
+    `state` is the state of the application shared with all the contexts (see
+    `asgi.create`).
+
+    `skip_body` is set for HEAD requests: handlers that send response body send only
+    its headers (with "Content-Length" when it is known) and an empty body instead.
+
     Note:
         https://asgi.readthedocs.io/en/latest/specs/www.html#
     """
@@ -32,51 +171,143 @@ class HTTPContext(BaseContext):
     asgi_spec_version: str
     http_version: str
     scheme: str
-    server: ServerInfo
-    client: ClientInfo
+    _server: ServerInfo | None
+    _client: ClientInfo | None
 
     # request info
     request_method: str
-    request_path: str
-    request_headers: dict[bytes, bytes]
+    _request_path: str | None
+    _request_headers: dict[bytes, bytes] | None
     request_body: bytes
-    request_query_string: bytes
+    _request_query_string: bytes
+    _request_query: dict[str, list[str]] | None
+    max_body_size: int | None
 
     # response info
     response_status: int
     response_body: bytes | None
-    response_headers: dict[bytes, bytes]
+    response_headers: Headers
 
     # context state
     received: bool
     started: bool
     closed: bool
+    skip_body: bool
+
+    state: dict[str, Any]
+
+    _scope: Scope
 
     def __init__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._scope = scope
         self.scope_type = scope["type"]
         self.asgi_version = scope["asgi"]["version"]
         self.asgi_spec_version = scope["asgi"].get("spec_version", "2.0")
         self.http_version = scope.get("http_version", "1.1")
-        self.scheme = scope.get("http_version", "http")
-        self.client = ClientInfo(scope["client"][0], scope["client"][1])
-        self.server = ServerInfo(scope["server"][0], scope["server"][1])
+        self.scheme = scope.get("scheme", "http")
+        self._client = None
+        self._server = None
 
         self.receive = receive
         self.send = send
 
         self.request_method = scope["method"]
-        self.request_path = scope["path"].strip("/")
-        self.request_query_string = scope["query_string"]
-        self.request_headers = keymap(bytes.lower, dict(scope.get("headers", [])))
+        self._request_path = None
+        self._request_query_string = scope["query_string"]
+        self._request_query = None
+        self._request_headers = None
         self.request_body = b""
+        self.max_body_size = None
 
         self.response_body = None
-        self.response_headers = {}
+        self.response_headers = Headers()
         self.response_status = 200
 
         self.received = False
         self.started = False
         self.closed = False
+        self.skip_body = self.request_method == "HEAD"
+
+        state = scope.get("state", None)
+        self.state = {} if state is None else state
+
+    @property
+    def client(self) -> ClientInfo:
+        """Host and port of the client."""
+        match self._client:
+            case None:
+                host, port = self._scope["client"]
+                self._client = ClientInfo(host, port)
+        return self._client
+
+    @client.setter
+    def client(self, value: ClientInfo) -> None:
+        self._client = value
+
+    @property
+    def server(self) -> ServerInfo:
+        """Host and port of the server."""
+        match self._server:
+            case None:
+                host, port = self._scope["server"]
+                self._server = ServerInfo(host, port)
+        return self._server
+
+    @server.setter
+    def server(self, value: ServerInfo) -> None:
+        self._server = value
+
+    @property
+    def request_path(self) -> str:
+        """Request path stripped from leading and trailing "/"."""
+        match self._request_path:
+            case None:
+                self._request_path = self._scope["path"].strip("/")
+        return self._request_path
+
+    @request_path.setter
+    def request_path(self, value: str) -> None:
+        self._request_path = value
+
+    @property
+    def extensions(self) -> dict[str, dict]:
+        """ASGI extensions supported by the server."""
+        return self._scope.get("extensions") or {}
+
+    @property
+    def request_headers(self) -> dict[bytes, bytes]:
+        """Request headers with lowercased names."""
+        match self._request_headers:
+            case None:
+                headers = dict(self._scope.get("headers", []))
+                self._request_headers = keymap(bytes.lower, headers)
+        return self._request_headers
+
+    @request_headers.setter
+    def request_headers(self, value: dict[bytes, bytes]) -> None:
+        self._request_headers = value
+
+    @property
+    def request_query_string(self) -> bytes:
+        """Raw query string."""
+        return self._request_query_string
+
+    @request_query_string.setter
+    def request_query_string(self, value: bytes) -> None:
+        self._request_query_string = value
+        self._request_query = None
+
+    @property
+    def request_query(self) -> dict[str, list[str]]:
+        """Query parameters with all their values in order of appearance.
+
+        "+" and percent-encoded characters are decoded, parameters without value
+        have empty string value.
+        """
+        match self._request_query:
+            case None:
+                self._request_query = parse_query(self._request_query_string)
+        return self._request_query
 
 
 @hof1
@@ -132,7 +363,22 @@ def set_response_header(name: str, value: str, ctx: HTTPContext) -> HTTPContext:
     """
     _name = name.encode("UTF-8").lower()
     _value = value.encode("UTF-8")
-    ctx.response_headers[_name] = _value
+    ctx.response_headers.set(_name, _value)
+    return ctx
+
+
+@hof2
+def add_response_header(name: str, value: str, ctx: HTTPContext) -> HTTPContext:
+    """Add one more `value` for response header `name`.
+
+    Args:
+        name (str): header name.
+        value (str): header value.
+        ctx (HTTPContext): to add header to.
+    """
+    _name = name.encode("UTF-8").lower()
+    _value = value.encode("UTF-8")
+    ctx.response_headers.add(_name, _value)
     return ctx
 
 
@@ -175,6 +421,11 @@ def get_request_query_string(ctx: HTTPContext):
     return ctx.request_query_string
 
 
+def get_request_query(ctx: HTTPContext):
+    """Returns `HTTPContext.request_query`."""
+    return ctx.request_query
+
+
 def get_request_headers(ctx: HTTPContext):
     """Returns `HTTPContext.request_headers`."""
     return ctx.request_headers
@@ -220,6 +471,11 @@ def get_server(ctx: HTTPContext):
     return ctx.server
 
 
+def get_extensions(ctx: HTTPContext):
+    """Returns `HTTPContext.extensions`."""
+    return ctx.extensions
+
+
 def get_response_body(ctx: HTTPContext):
     """Returns `HTTPContext.response_body`."""
     return ctx.response_body
@@ -248,3 +504,8 @@ def get_started(ctx: HTTPContext):
 def get_closed(ctx: HTTPContext):
     """Returns `HTTPContext.closed`."""
     return ctx.closed
+
+
+def get_skip_body(ctx: HTTPContext):
+    """Returns `HTTPContext.skip_body`."""
+    return ctx.skip_body
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import inspect
+import types
+import typing
+from datetime import date, datetime, time
+from typing import Any, Callable, get_args, get_origin
+
+Converter = Callable[[str], Any]
+ValuesConverter = Callable[[list[str]], Any]
+
+COLLECTIONS = (list, tuple, set, frozenset)
+
+
+def _to_bool(value: str) -> bool:
+    match value.lower():
+        case "1" | "true" | "yes" | "on":
+            return True
+        case "0" | "false" | "no" | "off" | "":
+            return False
+        case _:
+            raise ValueError(f"invalid boolean: {value!r}")
+
+
+def _to_bytes(value: str) -> bytes:
+    return value.encode("UTF-8")
+
+
+def _to_str(value: str) -> str:
+    return value
+
+
+CONVERTERS: dict[Any, Converter] = {
+    inspect.Parameter.empty: _to_str,
+    Any: _to_str,
+    str: _to_str,
+    bytes: _to_bytes,
+    bool: _to_bool,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+}
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Returns `T` for `T | None` and `Optional[T]`, `annotation` otherwise."""
+    match get_origin(annotation):
+        case typing.Union | types.UnionType:
+            match [arg for arg in get_args(annotation) if arg is not type(None)]:
+                case [arg]:
+                    return arg
+    return annotation
+
+
+def converter(annotation: Any) -> Converter:
+    """Returns function that converts string value to `annotation` type.
+
+    `str`, `bytes`, `bool` ("1", "true", "yes", "on" and their opposites), `datetime`,
+    `date` and `time` (ISO format) are handled specially, `T | None` is converted to
+    `T`, any other type (`int`, `float`, `UUID`, `Decimal`, `Enum`...) is called with
+    the value. Conversion raises `ValueError` or `TypeError` on invalid value.
+
+    Args:
+        annotation (Any): type to convert to.
+
+    Returns:
+        Converter: converter.
+    """
+    annotation = _unwrap_optional(annotation)
+    match CONVERTERS.get(annotation, None):
+        case None if callable(annotation):
+            return annotation
+        case None:
+            return _to_str
+        case convert:
+            return convert
+
+
+def values_converter(annotation: Any) -> ValuesConverter:
+    """Returns function that converts all values of the parameter to `annotation`.
+
+    Collections (`list[T]`, `tuple[T, ...]`, `set[T]`, `frozenset[T]`) get all values
+    converted to `T`, other types get the last value converted (see `converter`).
+
+    Args:
+        annotation (Any): type to convert to.
+
+    Returns:
+        ValuesConverter: converter.
+    """
+    annotation = _unwrap_optional(annotation)
+    origin = get_origin(annotation) or annotation
+    match origin in COLLECTIONS, get_args(annotation):
+        case True, (item, *_):
+            convert = converter(item)
+            return lambda values: origin(map(convert, values))
+        case True, ():
+            return origin
+        case _:
+            convert = converter(annotation)
+            return lambda values: convert(values[-1])
+
+
+def type_hints(func: Callable) -> dict[str, Any]:
+    """Returns resolved type hints of `func` or empty dict when they can't be."""
+    try:
+        return typing.get_type_hints(func)
+    except (NameError, TypeError):
+        return {}
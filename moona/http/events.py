@@ -1,13 +1,26 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import AsyncIterable, AsyncIterator, Iterable
+
 from fundom.core import future, pipe
 
+from moona.context import Message
 from moona.http.context import (
+    Header,
     HTTPContext,
     send_message,
     set_closed,
-    set_received,
     set_started,
 )
-from moona.http.handlers import HTTPFunc, handle_func, handler, skip
+from moona.http.handlers import HTTPFunc, HTTPHandler, handle_func, handler, skip
+
+# body message sent instead of the body when `HTTPContext.skip_body` is set
+EMPTY_BODY: Message = {"type": "http.response.body", "body": b""}
+
+
+def _content_length(body: bytes) -> bytes:
+    return str(len(body)).encode("UTF-8")
+
 
 # handlers
 
@@ -16,6 +29,9 @@ from moona.http.handlers import HTTPFunc, handle_func, handler, skip
 def start(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
     """Send message to client and return `HTTPContext` that sent that.
 
+    When `skip_body` is set and response body is already known "Content-Length" is
+    declared from it unless set before.
+
     Args:
         nxt (HTTPHandler): next handler.
         ctx (HTTPContext): actor.
@@ -24,9 +40,14 @@ def start(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
         case True:
             return nxt(ctx)
         case False:
+            match ctx.skip_body, ctx.response_body:
+                case True, bytes() as body:
+                    ctx.response_headers.setdefault(
+                        b"content-length", _content_length(body)
+                    )
             message = {
                 "type": "http.response.start",
-                "headers": list(ctx.response_headers.items()),
+                "headers": ctx.response_headers,
                 "status": ctx.response_status,
             }
             return pipe(ctx) << set_started(True) >> send_message(message) >> nxt
@@ -36,37 +57,239 @@ def start(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
 def respond(ctx: HTTPContext) -> future[HTTPContext | None]:
     """Send response body to the client and close the context.
 
+    When `skip_body` is set empty body is sent instead.
+
     Args:
         nxt (HTTPFunc): to execute next.
         ctx (HTTPContext): context to send body from.
     """
-    return (
-        pipe(ctx)
-        << set_closed(True)
-        >> send_message({"type": "http.response.body", "body": ctx.response_body})
-    )
+    match ctx.skip_body:
+        case True:
+            message = EMPTY_BODY
+        case False:
+            message = {"type": "http.response.body", "body": ctx.response_body}
+    return pipe(ctx) << set_closed(True) >> send_message(message)
+
+
+def respond_stream(chunks: AsyncIterable[bytes | str]) -> HTTPHandler:
+    """Send response body to the client chunk by chunk and close the context.
+
+    Every chunk is sent with "more_body" set and the next chunk is requested only
+    after the previous one has been sent, so only one chunk is kept in memory at a
+    time. `str` chunks are encoded to UTF-8. When `skip_body` is set chunks are not
+    produced at all (async generators are closed) and empty body is sent.
+
+    Args:
+        chunks (AsyncIterable[bytes | str]): response body chunks.
+    """
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        match ctx.skip_body:
+            case True:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                await ctx.send(EMPTY_BODY)
+                ctx.closed = True
+                return ctx
+
+        async for chunk in chunks:
+            match chunk:
+                case str():
+                    chunk = chunk.encode("UTF-8")
+            await ctx.send(
+                {"type": "http.response.body", "body": chunk, "more_body": True}
+            )
+        await ctx.send({"type": "http.response.body", "body": b"", "more_body": False})
+        ctx.closed = True
+        return ctx
+
+    return _handler
+
+
+@dataclass(slots=True)
+class ResponseTemplate:
+    """Constant response with pre-encoded ASGI messages.
+
+    Body message is built once, start messages are built once per status and cached
+    in `starts`. When earlier handlers have not set any response headers prebuilt
+    start message is sent as is (and context headers are left untouched), otherwise
+    template headers are merged into context ones. When `skip_body` is set
+    "Content-Length" of the body is declared and empty body is sent instead.
+
+    Prebuilt messages are shared by all requests, so they are read-only for `send`
+    wrappers: their headers are tuples and must be copied to be changed.
+    """
+
+    status: int | None
+    headers: tuple[Header, ...]
+    body: Message
+    starts: dict[int, Message]
+
+    def start_message(self, status: int) -> Message:
+        """Returns prebuilt start message for the `status`."""
+        match self.starts.get(status, None):
+            case None:
+                message = {
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": self.headers,
+                }
+                self.starts[status] = message
+                return message
+            case message:
+                return message
+
+    async def __call__(  # noqa
+        self, nxt: HTTPFunc, ctx: HTTPContext
+    ) -> HTTPContext | None:
+        match ctx.started:
+            case False:
+                status = self.status if self.status is not None else ctx.response_status
+                match bool(ctx.response_headers) or ctx.skip_body:
+                    case False:
+                        message = self.start_message(status)
+                    case True:
+                        headers = ctx.response_headers
+                        headers.update(self.headers)
+                        if ctx.skip_body:
+                            headers.setdefault(
+                                b"content-length", _content_length(self.body["body"])
+                            )
+                        message = {
+                            "type": "http.response.start",
+                            "status": status,
+                            "headers": headers,
+                        }
+                ctx.response_status = status
+                ctx.started = True
+                await ctx.send(message)
+        ctx.response_body = self.body["body"]
+        ctx.closed = True
+        await ctx.send(EMPTY_BODY if ctx.skip_body else self.body)
+        return ctx
+
+
+def respond_with(
+    body: bytes, headers: Iterable[Header] = (), status: int | None = None
+) -> HTTPHandler:
+    """Respond client with constant response compiled ahead of time.
+
+    Same as setting body, headers and status and running `start >> respond`, but
+    ASGI messages are built once, so sending response allocates almost nothing.
+
+    Args:
+        body (bytes): response body.
+        headers (Iterable[Header]): encoded response headers.
+        status (int | None): response status, by default context one is used.
+    """
+    body_message = {"type": "http.response.body", "body": body}
+    return HTTPHandler(ResponseTemplate(status, tuple(headers), body_message, {}))
+
+
+def _declared_body_size(ctx: HTTPContext) -> int:
+    match ctx.request_headers.get(b"content-length", b""):
+        case length if length.isdigit():
+            return int(length)
+        case _:
+            return 0
+
+
+class PayloadTooLarge(Exception):
+    """Raised by `iter_body` when request body exceeds `HTTPContext.max_body_size`.
+
+    By the time it is raised client has already been responded with 413 Payload Too
+    Large and context is closed.
+    """
+
+
+async def _reject_payload_too_large(ctx: HTTPContext) -> None:
+    ctx.response_status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE.value
+    ctx.response_headers[b"content-type"] = b"text/plain"
+    ctx.response_body = b"Payload Too Large"
+    await (start >> respond)(skip, ctx)
+    raise PayloadTooLarge(f"Request body exceeds {ctx.max_body_size} bytes")
+
+
+async def iter_body(ctx: HTTPContext) -> AsyncIterator[bytes]:
+    """Iterate over request body chunks as they arrive from the client.
+
+    Chunks are received from the client only when the next one is requested, so slow
+    consumer naturally applies backpressure. When body is fully received `received` is
+    set, when client disconnects `closed` is set and iteration stops. If body had
+    already been received it is yielded as a single chunk.
+
+    When `HTTPContext.max_body_size` is set, body is checked against it: first by
+    "Content-Length" header (before anything is read) and then by the number of
+    received bytes. As soon as limit is exceeded reading stops, client is responded
+    with 413 Payload Too Large, context is closed and `PayloadTooLarge` is raised, so
+    consumers do not mistake the truncated body for the complete one.
+
+    Args:
+        ctx (HTTPContext): to receive body for.
+
+    Yields:
+        bytes: body chunk.
+
+    Raises:
+        PayloadTooLarge: body exceeds `HTTPContext.max_body_size`.
+    """
+    match ctx.received:
+        case True:
+            if ctx.request_body:
+                yield ctx.request_body
+            return
+
+    limit = ctx.max_body_size
+    match limit is not None and _declared_body_size(ctx) > limit:
+        case True:
+            await _reject_payload_too_large(ctx)
+
+    size = 0
+    while True:
+        match await ctx.receive():
+            case {"type": "http.request"} as msg:
+                chunk = msg.get("body", b"")
+                size += len(chunk)
+                match limit is not None and size > limit:
+                    case True:
+                        await _reject_payload_too_large(ctx)
+                if chunk:
+                    yield chunk
+                match msg.get("more_body", False):
+                    case False:
+                        ctx.received = True
+                        return
+            case {"type": "http.disconnect"}:
+                ctx.closed = True
+                return
 
 
 @handler
 async def receive(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
     """Receive request body from client.
 
+    Chunks are collected to the list and joined once, so receiving body is linear in
+    its size regardless of the number of chunks. When body exceeds
+    `HTTPContext.max_body_size` client is responded with 413 and closed context is
+    returned without running `nxt`.
+
     Args:
         nxt (HTTPFunc): to execute next if body had been successfully received..
         ctx (HTTPContext): to write body to.
     """
     match ctx.received:
         case False:
-            msg = await ctx.receive()
-            match msg:
-                case {"type": "http.request"}:
-                    ctx.request_body += msg["body"]
-                    match msg.get("more_body", False):
-                        case True:
-                            return await receive(nxt, ctx)
-                        case False:
-                            return await (pipe(ctx) << set_received(True) >> nxt)
-                case {"type": "http.disconnect"}:
-                    return await (pipe(ctx) << set_closed(True) >> skip)
+            try:
+                chunks = [chunk async for chunk in iter_body(ctx)]
+            except PayloadTooLarge:
+                return ctx
+            match ctx.closed:
+                case True:
+                    return await skip(ctx)
+                case False:
+                    ctx.request_body += b"".join(chunks)
+                    return await nxt(ctx)
         case True:
             return await nxt(ctx)
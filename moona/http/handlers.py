@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, TypeVar
+from typing import Any, Callable, Hashable, NamedTuple, TypeVar
 
-from fundom import cmap, foldl, future, hof1, pipe, this_future
+from fundom import future, this_future
 
 from moona.http.context import HTTPContext
 
 HTTPFunc = Callable[[HTTPContext], future[HTTPContext | None]]
 _HTTPHandler = Callable[[HTTPFunc, HTTPContext], future[HTTPContext | None]]
 
+Guard = NamedTuple("Guard", [("kind", str), ("args", tuple)])
+
 
 def compose(h1: _HTTPHandler, h2: _HTTPHandler) -> HTTPHandler:
     """Compose 2 `HTTPHandler`s into one.
@@ -23,32 +25,76 @@ def compose(h1: _HTTPHandler, h2: _HTTPHandler) -> HTTPHandler:
     """
 
     def handler(final: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
-        _h1 = hof1(h1)
-        _h2 = hof1(h2)
-        func = _h1(_h2(final))
-
         match ctx.closed:
             case True:
                 return final(ctx)
             case False:
-                return func(ctx)
+                return h1(lambda _ctx: h2(final, _ctx), ctx)
 
-    return HTTPHandler(handler)
+    return HTTPHandler(handler, chain=(*unchain(h1), *unchain(h2)))
 
 
 @dataclass(frozen=True, slots=True)
 class HTTPHandler:
-    """Abstraction over function that hander `HTTPContext`."""
+    """Abstraction over function that hander `HTTPContext`.
+
+    Besides the function itself `HTTPHandler` remembers handlers it was composed of
+    (`_chain`) and optional declarative `Guard` describing what request it matches.
+    """
 
     _handler: Callable[[HTTPContext], future[HTTPContext | None]]
+    _chain: tuple[HTTPHandler, ...]
+    _guard: Guard | None
 
     def __call__(  # noqa
         self, nxt: HTTPFunc, ctx: HTTPContext
     ) -> future[HTTPContext | None]:
-        return future.returns(self._handler)(nxt, ctx)
-
-    def __init__(self, handler: _HTTPHandler) -> None:
+        match self._handler(nxt, ctx):
+            case future() as result:
+                return result
+            case awaitable:
+                return future(awaitable)
+
+    def __init__(
+        self,
+        handler: _HTTPHandler,
+        *,
+        chain: tuple[HTTPHandler, ...] = (),
+        guard: Guard | None = None,
+    ) -> None:
         object.__setattr__(self, "_handler", handler)
+        object.__setattr__(self, "_chain", chain)
+        object.__setattr__(self, "_guard", guard)
+
+    @property
+    def guard(self) -> Guard | None:
+        """`Guard` of the first handler in composition chain if any."""
+        return unchain(self)[0]._guard
+
+    def compile(self, final: HTTPFunc | None = None) -> HTTPFunc:
+        """Link handler with all the handlers it is composed of ahead of time.
+
+        Each handler from the composition chain is bound to the next one only once, so
+        running resulting `HTTPFunc` does not allocate wrappers for the whole
+        composition tree on every request. As with `compose` closed `HTTPContext` is
+        passed directly to `final`.
+
+        Args:
+            final (HTTPFunc): to run after all handlers. Defaults to `end`.
+
+        Returns:
+            HTTPFunc: pre-linked pipeline.
+        """
+        func = _link_chain(self, end if final is None else final)
+
+        def compiled(ctx: HTTPContext) -> future[HTTPContext | None]:
+            match func(ctx):
+                case future() as result:
+                    return result
+                case awaitable:
+                    return future(awaitable)
+
+        return compiled
 
     def compose(self, h: _HTTPHandler) -> HTTPHandler:
         """Compose 2 `HTTPHandler`s into one.
@@ -65,6 +111,24 @@ class HTTPHandler:
         return compose(self, h)
 
 
+def _link(h: _HTTPHandler, nxt: HTTPFunc, final: HTTPFunc) -> HTTPFunc:
+    def func(ctx: HTTPContext) -> future[HTTPContext | None]:
+        match ctx.closed:
+            case True:
+                return final(ctx)
+            case False:
+                return h(nxt, ctx)
+
+    return func
+
+
+def _link_chain(h: _HTTPHandler, final: HTTPFunc) -> HTTPFunc:
+    func = final
+    for _h in reversed(unchain(h)):
+        func = _link(_h._handler, func, final)
+    return func
+
+
 A = TypeVar("A")
 B = TypeVar("B")
 C = TypeVar("C")
@@ -75,6 +139,48 @@ def handler(func: _HTTPHandler) -> HTTPHandler:
     return HTTPHandler(func)
 
 
+def guard(kind: str, *args: Any) -> Callable[[_HTTPHandler], HTTPHandler]:
+    """Decorator that converts function to HTTPHandler with declarative `Guard`.
+
+    Guard describes what requests handler lets through (for example
+    `Guard("route", ("users",))`) so that dispatchers are able to index branches
+    instead of trying them one by one. Handler function itself must still perform the
+    check as guard is only a hint.
+
+    Guards of kind "equals" are indexed by `choose`. They are declared as
+    `guard("equals", dimension, key, value)` and promise that handler passes only when
+    `key(ctx) == value`. `dimension` is hashable name of what is compared (for example
+    "method") and `key` returns hashable value of this dimension for `HTTPContext`.
+
+    Args:
+        kind (str): of the guard.
+        *args (Any): guard parameters.
+    """
+
+    def decorator(func: _HTTPHandler) -> HTTPHandler:
+        return HTTPHandler(func, guard=Guard(kind, args))
+
+    return decorator
+
+
+def unchain(h: _HTTPHandler) -> tuple[HTTPHandler, ...]:
+    """Split handler to the sequence of handlers it was composed of.
+
+    Args:
+        h (_HTTPHandler): to split.
+
+    Returns:
+        tuple[HTTPHandler, ...]: handlers in order of execution.
+    """
+    match h:
+        case HTTPHandler(_chain=()):
+            return (h,)
+        case HTTPHandler(_chain=chain):
+            return chain
+        case _:
+            return (HTTPHandler(h),)
+
+
 def handle_func(func: HTTPFunc) -> HTTPHandler:
     """Converts `HTTPFunc` to `HTTPHandler`.
 
@@ -125,42 +231,83 @@ def handle_func_sync(func: Callable[[HTTPContext], HTTPContext | None]) -> HTTPH
     return _handler
 
 
-def __choose_reducer(f: HTTPFunc, s: HTTPFunc) -> HTTPFunc:
-    @future.returns
-    async def func(ctx: HTTPContext) -> HTTPFunc:
-        match await f(ctx):
-            case None:
-                return await s(ctx)
-            case some:
-                return some
-
-    return func
+@dataclass(slots=True)
+class _GuardIndex:
+    """Index of handlers by "equals" guards they start with."""
+
+    keys: dict[Hashable, Callable[[HTTPContext], Hashable]]
+    tables: dict[Hashable, dict[Hashable, list[int]]]
+    unindexed: list[int]
+
+    def __init__(self, handlers: list[HTTPHandler]) -> None:
+        self.keys = {}
+        self.tables = {}
+        self.unindexed = []
+        for i, h in enumerate(handlers):
+            match unchain(h)[0]._guard:
+                case ("equals", (dimension, key, value)):
+                    self.keys.setdefault(dimension, key)
+                    self.tables.setdefault(dimension, {}).setdefault(value, [])
+                    self.tables[dimension][value].append(i)
+                case _:
+                    self.unindexed.append(i)
+
+    def select(self, ctx: HTTPContext) -> list[int]:
+        """Returns indices of handlers that could pass `ctx` in declaration order."""
+        selected = list(self.unindexed)
+        for dimension, key in self.keys.items():
+            selected.extend(self.tables[dimension].get(key(ctx), ()))
+        if self.unindexed or len(self.keys) > 1:
+            selected.sort()
+        return selected
 
 
 def choose(handlers: list[HTTPHandler]) -> HTTPHandler:
     """Iterate though handlers till one would return some `HTTPContext`.
 
+    Handlers are linked with `nxt` only when it changes (see `HTTPHandler.compile`),
+    so in compiled pipeline branches are bound once and then just tried in order.
+
+    Handlers that start with "equals" guard (like `method`, `matches_header` or
+    `host`) are indexed by the value they compare. On request only the handlers whose
+    guard value matches the request (plus all the handlers that could not be
+    indexed) are tried, so selecting the branch is a dict lookup instead of trying
+    every guard in turn. Order of handlers is preserved.
+
     Args:
         handlers (list[HTTPHandler]): to iterate through.
 
     Returns:
         HTTPHandler: result.
     """
+    bound: list = [None, ()]
+    index = _GuardIndex(handlers)
 
     @handler
     async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
-        match handlers:
-            case []:
+        match handlers, bound:
+            case [], _:
                 return await nxt(ctx)
+            case _, [_nxt, funcs] if _nxt is nxt:
+                pass
             case _:
-                func: HTTPFunc = (
-                    pipe(handlers)
-                    .then(cmap(hof1))
-                    .then(cmap(lambda h: h(nxt)))
-                    .then(foldl(__choose_reducer, skip))
-                    .finish()
-                )
-                return await func(ctx)
+                funcs = tuple(_link_chain(h, nxt) for h in handlers)
+                bound[:] = [nxt, funcs]
+
+        match bool(index.tables):
+            case False:
+                selected = funcs
+            case True:
+                selected = [funcs[i] for i in index.select(ctx)]
+
+        for func in selected:
+            match await func(ctx):
+                case None:
+                    continue
+                case some:
+                    return some
+
+        return None
 
     return _handler
 
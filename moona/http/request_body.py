@@ -1,19 +1,39 @@
-from logging.handlers import HTTPHandler
-from typing import Callable, Type, TypeVar
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Type, TypeVar
 
 import orjson
 from fundom import future, pipe
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from moona.http.context import HTTPContext, get_request_body
-from moona.http.events import receive
-from moona.http.handlers import HTTPFunc, handler
+from moona.http.events import PayloadTooLarge, iter_body, receive, respond_with
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler
+from moona.http.response_status import BAD_REQUEST, UNPROCESSABLE_ENTITY
+
+PYDANTIC_V2 = hasattr(BaseModel, "model_validate_json")
 
 
 def _decode_bytes(data: bytes) -> str:
     return data.decode("UTF-8")
 
 
+def max_body_size(size: int) -> HTTPHandler:
+    """Limits size of the request body that is received by next handlers.
+
+    Overrides limit set for the application (see `asgi.create`). Body larger than
+    `size` bytes is rejected with 413 Payload Too Large (see `iter_body`).
+
+    Args:
+        size (int): maximum body size in bytes.
+    """
+
+    @handler
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        ctx.max_body_size = size
+        return nxt(ctx)
+
+    return _handler
+
+
 def bind_raw(func: Callable[[bytes], HTTPHandler]) -> HTTPHandler:
     """Executes passed `func` on request body.
 
@@ -29,6 +49,32 @@ def bind_raw(func: Callable[[bytes], HTTPHandler]) -> HTTPHandler:
     return receive >> _handler
 
 
+def bind_stream(func: Callable[[AsyncIterator[bytes]], HTTPHandler]) -> HTTPHandler:
+    """Executes passed `func` on async iterator over request body chunks.
+
+    Body is not buffered: chunks are received from the client only when handler asks
+    for the next one, so memory used is bounded by the chunk size. Handler returned
+    by `func` should consume the iterator before the response is sent.
+
+    When body exceeds `HTTPContext.max_body_size` iterator raises `PayloadTooLarge`
+    (client is already responded with 413), which stops the handler and ends the
+    pipeline with the closed context.
+
+    Args:
+        func (Callable[[AsyncIterator[bytes]], HTTPHandler]): to run on request body
+        stream.
+    """
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        try:
+            return await func(iter_body(ctx))(nxt, ctx)
+        except PayloadTooLarge:
+            return ctx
+
+    return _handler
+
+
 def bind_text(func: Callable[[str], HTTPHandler]) -> HTTPHandler:
     """Executes passed `func` on request body.
 
@@ -79,12 +125,72 @@ def bind_dict(func: Callable[[dict], HTTPHandler]) -> HTTPHandler:
 TBaseModel = TypeVar("TBaseModel", bound=BaseModel)
 
 
+def validate_json(model: Type[TBaseModel], data: bytes) -> TBaseModel:
+    """Validates `model` from JSON `data`.
+
+    With pydantic v2 model is validated straight from bytes in a single pass. v1
+    cannot do that (`parse_raw` goes through stdlib `json` and is slower), so body is
+    parsed with orjson first.
+
+    Args:
+        model (Type[TBaseModel]): pydantic `BaseModel` to validate.
+        data (bytes): JSON.
+
+    Raises:
+        orjson.JSONDecodeError: when `data` is malformed (pydantic v1).
+        ValidationError: when `data` does not match the `model`.
+
+    Returns:
+        TBaseModel: validated model.
+    """
+    match PYDANTIC_V2:
+        case True:
+            return model.model_validate_json(data)
+        case False:
+            return model.parse_obj(orjson.loads(data))
+
+
+def _error(status: int, errors: bytes) -> HTTPHandler:
+    """Responds with JSON `{"detail": errors}`."""
+    body = b'{"detail":' + errors + b"}"
+    return respond_with(body, [(b"content-type", b"application/json")], status)
+
+
+def _malformed(msg: str) -> HTTPHandler:
+    errors = [{"loc": [], "msg": msg, "type": "json_invalid"}]
+    return _error(BAD_REQUEST, orjson.dumps(errors))
+
+
+def validation_error(error: orjson.JSONDecodeError | ValidationError) -> HTTPHandler:
+    """Responds client with error raised by `validate_json`.
+
+    Malformed JSON is responded with 400 Bad Request and JSON that does not match
+    the model with 422 Unprocessable Entity, both with JSON `{"detail": [errors]}`
+    body.
+
+    Args:
+        error (orjson.JSONDecodeError | ValidationError): raised error.
+    """
+    match error:
+        case orjson.JSONDecodeError():
+            return _malformed(str(error))
+    match [e for e in error.errors() if e["type"] == "json_invalid"]:
+        case [invalid, *_]:
+            return _malformed(invalid["msg"])
+    return _error(UNPROCESSABLE_ENTITY, error.json(indent=None).encode("UTF-8"))
+
+
 def bind_model(
     model: Type[TBaseModel],
     func: Callable[[TBaseModel], HTTPHandler],
 ) -> HTTPHandler:
     """Executes passed `func` on request body.
 
+    Body is validated against the `model` without building intermediate objects
+    when pydantic supports it. Malformed JSON is responded with 400 Bad Request and
+    body that does not match the `model` with 422 Unprocessable Entity, both with
+    JSON `{"detail": [errors]}` body, and `func` is not executed.
+
     Args:
         model (Type[TBaseModel]): pydantic `BaseModel` to parse to.
         func (Callable[[TBaseModel], HTTPHandler]): to run on request body.
@@ -92,9 +198,115 @@ def bind_model(
 
     @handler
     def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
-        handle = (
-            pipe(ctx) << get_request_body << orjson.loads << model.parse_obj << func
-        ).finish()
-        return handle(nxt, ctx)
+        try:
+            data = validate_json(model, ctx.request_body)
+        except (orjson.JSONDecodeError, ValidationError) as error:
+            return validation_error(error)(nxt, ctx)
+        return func(data)(nxt, ctx)
 
     return receive >> _handler
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Iterate over lines of the body as its chunks arrive.
+
+    Lines are split on newlines, surrounding whitespace (e.g. carriage return) is
+    kept as is and blank lines are skipped. Only the current incomplete line is kept in
+    memory besides the chunk.
+
+    Args:
+        chunks (AsyncIterable[bytes]): body chunks.
+
+    Yields:
+        bytes: line without trailing newline.
+    """
+    pending: list[bytes] = []
+    async for chunk in chunks:
+        start = 0
+        while (stop := chunk.find(b"\n", start)) != -1:
+            pending.append(chunk[start:stop])
+            line = b"".join(pending)
+            pending.clear()
+            if line.strip():
+                yield line
+            start = stop + 1
+        pending.append(chunk[start:])
+    line = b"".join(pending)
+    if line.strip():
+        yield line
+
+
+async def _parse_lines(
+    parse: Callable[[bytes], Any], lines: AsyncIterable[bytes]
+) -> AsyncIterator[Any]:
+    async for line in lines:
+        yield parse(line)
+
+
+async def _batched(records: AsyncIterable[Any], size: int) -> AsyncIterator[list]:
+    batch = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _bind_lines(
+    parse: Callable[[bytes], Any],
+    func: Callable[[AsyncIterator], HTTPHandler],
+    batch: int | None,
+) -> HTTPHandler:
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        records = _parse_lines(parse, iter_lines(iter_body(ctx)))
+        match batch:
+            case None:
+                h = func(records)
+            case size:
+                h = func(_batched(records, size))
+        try:
+            return await h(nxt, ctx)
+        except PayloadTooLarge:
+            return ctx
+
+    return _handler
+
+
+def bind_ndjson(
+    func: Callable[[AsyncIterator[Any]], HTTPHandler], batch: int | None = None
+) -> HTTPHandler:
+    """Executes passed `func` on async iterator over NDJSON (JSON lines) records.
+
+    Body is not buffered: it is split into lines as chunks arrive and each line is
+    parsed only when handler asks for the next record, so memory used is bounded by
+    the record (or batch) size. When `batch` is set records are yielded in lists of
+    at most `batch` records. Malformed line raises `orjson.JSONDecodeError` while
+    iterating. Body larger than `HTTPContext.max_body_size` is handled as in
+    `bind_stream`, so truncated last line is never parsed.
+
+    Args:
+        func (Callable[[AsyncIterator[Any]], HTTPHandler]): to run on records.
+        batch (int | None): number of records to yield at once.
+    """
+    return _bind_lines(orjson.loads, func, batch)
+
+
+def bind_ndjson_model(
+    model: Type[TBaseModel],
+    func: Callable[[AsyncIterator[TBaseModel]], HTTPHandler],
+    batch: int | None = None,
+) -> HTTPHandler:
+    """Executes passed `func` on async iterator over NDJSON records parsed to `model`.
+
+    Same as `bind_ndjson`, but every record is validated against the `model`, which
+    raises `ValidationError` while iterating when record does not match it.
+
+    Args:
+        model (Type[TBaseModel]): pydantic `BaseModel` to parse records to.
+        func (Callable[[AsyncIterator[TBaseModel]], HTTPHandler]): to run on records.
+        batch (int | None): number of records to yield at once.
+    """
+    return _bind_lines(lambda line: validate_json(model, line), func, batch)
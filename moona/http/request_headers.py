@@ -1,9 +1,9 @@
-from logging.handlers import HTTPHandler
+from functools import lru_cache
 
 from fundom import future
 
 from moona.http.context import HTTPContext
-from moona.http.handlers import HTTPFunc, handler, skip
+from moona.http.handlers import HTTPFunc, HTTPHandler, guard, handler, skip
 
 
 def has_header(name: str) -> HTTPHandler:
@@ -36,7 +36,10 @@ def matches_header(name: str, value: str) -> HTTPHandler:
     raw_name = name.encode("UTF-8").lower()
     raw_value = value.encode("UTF-8")
 
-    @handler
+    def _get_header(ctx: HTTPContext) -> bytes | None:
+        return ctx.request_headers.get(raw_name, None)
+
+    @guard("equals", ("header", raw_name), _get_header, raw_value)
     def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
         match ctx.request_headers.get(raw_name, None) == raw_value:
             case True:
@@ -45,3 +48,144 @@ def matches_header(name: str, value: str) -> HTTPHandler:
                 return skip(ctx)
 
     return _handler
+
+
+def get_request_host(ctx: HTTPContext) -> bytes | None:
+    """Returns lowercased "Host" request header without port."""
+    match ctx.request_headers.get(b"host", None):
+        case None:
+            return None
+        case value:
+            host, _, port = value.rpartition(b":")
+            match bool(host) and port.isdigit():
+                case True:
+                    return host.lower()
+                case False:
+                    return value.lower()
+
+
+def host(name: str) -> HTTPHandler:
+    """Processes next `HTTPFunc` only when request "Host" header matches `name`.
+
+    Port of the "Host" header is ignored, comparison is case-insensitive.
+
+    Args:
+        name (str): host name to match.
+    """
+    raw_name = name.encode("UTF-8").lower()
+
+    @guard("equals", "host", get_request_host, raw_name)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        match get_request_host(ctx) == raw_name:
+            case True:
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
+
+    return _handler
+
+
+@lru_cache(maxsize=1024)
+def parse_qvalues(value: bytes) -> tuple[tuple[str, float], ...]:
+    """Parse header value with quality values (like "Accept-Encoding" or "Accept").
+
+    Results are cached as clients tend to send the same header values.
+
+    Args:
+        value (bytes): header value.
+
+    Returns:
+        tuple[tuple[str, float], ...]: lowercased tokens with their quality, sorted
+        by quality (stable).
+    """
+    items = []
+    for part in value.decode("latin-1").split(","):
+        token, *params = part.split(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, raw_q = param.partition("=")
+            match name.strip().lower():
+                case "q":
+                    try:
+                        q = float(raw_q)
+                    except ValueError:
+                        q = 0.0
+        items.append((token, q))
+    return tuple(sorted(items, key=lambda item: -item[1]))
+
+
+@lru_cache(maxsize=1024)
+def choose_encoding(value: bytes, available: tuple[str, ...]) -> str | None:
+    """Choose the best content coding among `available` for "Accept-Encoding" value.
+
+    Args:
+        value (bytes): "Accept-Encoding" header value.
+        available (tuple[str, ...]): codings in the order of server preference.
+
+    Returns:
+        str | None: chosen coding or `None` when client accepts none of them.
+    """
+    qvalues = dict(parse_qvalues(value))
+    default = qvalues.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = qvalues.get(coding, default)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+@lru_cache(maxsize=1024)
+def accepted_media_types(value: bytes, available: tuple[str, ...]) -> tuple[str, ...]:
+    """Order `available` media types by client preference expressed in "Accept".
+
+    Quality of each media type is taken from the most specific matching range
+    ("type/subtype", then "type/*", then "*/*"), types with zero quality or not
+    matched by any range are dropped. Types of the same quality keep server order.
+    Empty header value accepts everything.
+
+    Args:
+        value (bytes): "Accept" header value.
+        available (tuple[str, ...]): media types in the order of server preference.
+
+    Returns:
+        tuple[str, ...]: acceptable media types, most preferred first.
+    """
+    match value.strip():
+        case b"":
+            return available
+    qvalues = {}
+    for token, q in parse_qvalues(value):
+        qvalues.setdefault(token, q)
+    default = qvalues.get("*/*", qvalues.get("*", 0.0))
+    accepted = []
+    for media_type in available:
+        main_type, _, _ = media_type.partition("/")
+        q = qvalues.get(media_type, qvalues.get(f"{main_type}/*", default))
+        if q > 0:
+            accepted.append((media_type, q))
+    return tuple(media_type for media_type, _ in sorted(accepted, key=lambda x: -x[1]))
+
+
+def etag_matches(value: bytes, etag: bytes) -> bool:
+    """Checks if "If-None-Match" header `value` matches `etag`.
+
+    Weak comparison is used, so "W/" prefixes are ignored.
+
+    Args:
+        value (bytes): "If-None-Match" header value.
+        etag (bytes): quoted entity tag of the resource.
+    """
+    match value.strip():
+        case b"":
+            return False
+        case b"*":
+            return True
+        case tags:
+            etag = etag.removeprefix(b"W/")
+            return any(
+                tag.strip().removeprefix(b"W/") == etag for tag in tags.split(b",")
+            )
@@ -1,31 +1,45 @@
+from typing import Callable
+
 from fundom import future
 
-from moona.http.context import HTTPContext
-from moona.http.handlers import HTTPFunc, handler, handler1, skip
+from moona.http.context import HTTPContext, get_request_method
+from moona.http.handlers import HTTPFunc, HTTPHandler, guard, handler, skip
+
+
+def _method_guard(method: str) -> Callable[..., HTTPHandler]:
+    return guard("equals", "method", get_request_method, method)
+
+
+def _match_method(
+    method: str, nxt: HTTPFunc, ctx: HTTPContext
+) -> future[HTTPContext | None]:
+    match ctx.request_method == method:
+        case True:
+            return nxt(ctx)
+        case False:
+            return skip(ctx)
 
 
-@handler1
-def method(method: str, nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+def method(method: str) -> HTTPHandler:
     """Handler that matches request method with passed method.
 
     When methods are equal pipeline is continued, otherwise skipped.
 
     Args:
         method (str): method to match.
-        nxt (HTTPFunc): next func to run.
-        ctx (HTTPContext): to match with
 
     Returns:
-        future[HTTPContext | None]: result.
+        HTTPHandler: result.
     """
-    match ctx.request_method == method:
-        case True:
-            return nxt(ctx)
-        case False:
-            return skip(ctx)
 
+    @_method_guard(method)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        return _match_method(method, nxt, ctx)
 
-@handler
+    return _handler
+
+
+@_method_guard("GET")
 def GET(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with GET method.
 
@@ -33,10 +47,10 @@ def GET(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("GET")(nxt, ctx)
+    return _match_method("GET", nxt, ctx)
 
 
-@handler
+@_method_guard("POST")
 def POST(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with POST method.
 
@@ -44,10 +58,10 @@ def POST(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("POST")(nxt, ctx)
+    return _match_method("POST", nxt, ctx)
 
 
-@handler
+@_method_guard("PATCH")
 def PATCH(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with PATCH method.
 
@@ -55,10 +69,10 @@ def PATCH(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noq
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("PATCH")(nxt, ctx)
+    return _match_method("PATCH", nxt, ctx)
 
 
-@handler
+@_method_guard("PUT")
 def PUT(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with PUT method.
 
@@ -66,10 +80,10 @@ def PUT(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("PUT")(nxt, ctx)
+    return _match_method("PUT", nxt, ctx)
 
 
-@handler
+@_method_guard("DELETE")
 def DELETE(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with DELETE method.
 
@@ -77,10 +91,10 @@ def DELETE(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # no
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("DELETE")(nxt, ctx)
+    return _match_method("DELETE", nxt, ctx)
 
 
-@handler
+@_method_guard("OPTIONS")
 def OPTIONS(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with OPTIONS method.
 
@@ -88,10 +102,10 @@ def OPTIONS(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # n
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("OPTIONS")(nxt, ctx)
+    return _match_method("OPTIONS", nxt, ctx)
 
 
-@handler
+@_method_guard("HEAD")
 def HEAD(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with HEAD method.
 
@@ -99,10 +113,10 @@ def HEAD(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("HEAD")(nxt, ctx)
+    return _match_method("HEAD", nxt, ctx)
 
 
-@handler
+@_method_guard("TRACE")
 def TRACE(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with TRACE method.
 
@@ -110,10 +124,10 @@ def TRACE(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noq
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("TRACE")(nxt, ctx)
+    return _match_method("TRACE", nxt, ctx)
 
 
-@handler
+@_method_guard("CONNECT")
 def CONNECT(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # noqa
     """Matches request with CONNECT method.
 
@@ -121,4 +135,24 @@ def CONNECT(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:  # n
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return method("CONNECT")(nxt, ctx)
+    return _match_method("CONNECT", nxt, ctx)
+
+
+@handler
+def head_as_get(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+    """Handle HEAD requests with the handlers for GET requests.
+
+    Request method of HEAD requests is replaced with GET, while
+    `HTTPContext.skip_body` stays set, so handlers that respond send only headers
+    (with "Content-Length" when body is known) and do not produce the body: streams
+    are not iterated and files are not read. Must be placed before method guards.
+
+    Args:
+        nxt (HTTPFunc): to run next.
+        ctx (HTTPContext): to process.
+    """
+    match ctx.request_method:
+        case "HEAD":
+            ctx.request_method = "GET"
+            ctx.skip_body = True
+    return nxt(ctx)
@@ -1,29 +1,51 @@
-from typing import Callable
+import inspect
+from functools import partial
+from typing import Any, Callable, get_origin
 
-from fundom import cmap, future, pipe
+import orjson
+from fundom import future
+from pydantic import BaseModel, ValidationError
 
-from moona.http.context import HTTPContext, get_request_path, get_request_query_string
-from moona.http.handlers import HTTPFunc, HTTPHandler, handler, handler1, skip
-from moona.utils import decode, str_split
+from moona.http.context import HTTPContext, get_request_path
+from moona.http.converters import (
+    ValuesConverter,
+    converter,
+    type_hints,
+    values_converter,
+)
+from moona.http.events import receive
+from moona.http.handlers import (
+    HTTPFunc,
+    HTTPHandler,
+    guard,
+    handler,
+    skip,
+)
+from moona.http.request_body import validate_json, validation_error
+from moona.http.response_status import bad_request
 
 
-@handler1
-def route(path: str, nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+def route(path: str) -> HTTPHandler:
     """Handler that processes ctx only on right path.
 
     Request path must be exactly the same as path passed as an argument to the handler
     HOF. In order to keep them of the same format paths (bth in request and in handler)
     are striped from leading and trailing "/".
     """
-    match ctx.request_path == path.strip("/"):
-        case True:
-            return nxt(ctx)
-        case False:
-            return skip(ctx)
+    path = path.strip("/")
+
+    @guard("route", path)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        match ctx.request_path == path:
+            case True:
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
 
+    return _handler
 
-@handler1
-def subroute(path: str, nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+
+def subroute(path: str) -> HTTPHandler:
     """Handler that proceeds only when Request path starts with passed path.
 
     Leading part of the path is removed after processing the request. For example
@@ -31,33 +53,41 @@ def subroute(path: str, nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext |
     handler `HTTPContext` will have "users".
     """
     path = path.strip("/")
-    match ctx.request_path.startswith(path):
-        case True:
-            ctx.request_path = ctx.request_path.lstrip(path).strip("/")
-            return nxt(ctx)
-        case False:
-            return skip(ctx)
+    subroute_len = len(path)
+
+    @guard("subroute", path)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        match ctx.request_path.startswith(path):
+            case True:
+                ctx.request_path = ctx.request_path[subroute_len:].strip("/")
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
+
+    return _handler
 
 
-@handler1
-def route_ci(path: str, nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+def route_ci(path: str) -> HTTPHandler:
     """Handler that processes ctx only on right path.
 
     Request path must be case-insensitive to path passed as an argument to the handler
     HOF. In order to keep them of the same format paths (bth in request and in handler)
     are striped from leading and trailing "/".
     """
-    match ctx.request_path.lower() == path.strip("/").lower():
-        case True:
-            return nxt(ctx)
-        case False:
-            return skip(ctx)
+    path = path.strip("/").lower()
+
+    @guard("route_ci", path)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        match ctx.request_path.lower() == path:
+            case True:
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
+
+    return _handler
 
 
-@handler1
-def subroute_ci(
-    path: str, nxt: HTTPFunc, ctx: HTTPContext
-) -> future[HTTPContext | None]:
+def subroute_ci(path: str) -> HTTPHandler:
     """Handler that proceeds only when Request path starts with passed path.
 
     Leading part of the path is removed after processing the request. For example
@@ -66,42 +96,119 @@ def subroute_ci(
     """
     path = path.strip("/").lower()
     subroute_len = len(path)
-    match ctx.request_path.lower().startswith(path):
-        case True:
-            ctx.request_path = ctx.request_path[subroute_len:].strip("/")
-            return nxt(ctx)
-        case False:
-            return skip(ctx)
+
+    @guard("subroute_ci", path)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        match ctx.request_path.lower().startswith(path):
+            case True:
+                ctx.request_path = ctx.request_path[subroute_len:].strip("/")
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
+
+    return _handler
+
+
+QueryParams = dict[str, tuple[ValuesConverter, bool]]
+
+
+def _parameters(func: Callable) -> list[inspect.Parameter] | None:
+    """Returns parameters of `func` or `None` when signature can't be inspected."""
+    try:
+        return list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return None
+
+
+def _query_param(param: inspect.Parameter, annotation: Any) -> tuple:
+    return (values_converter(annotation), param.default is param.empty)
+
+
+def _query_error(name: str, msg: str, error_type: str) -> dict:
+    return {"loc": ["query", name], "msg": msg, "type": f"value_error.{error_type}"}
+
+
+def _convert_query(
+    params: QueryParams, query: dict[str, list[str]], kwargs: dict[str, Any]
+) -> list[dict]:
+    """Converts query `params` to `kwargs` and returns errors."""
+    errors = []
+    for name, (convert, required) in params.items():
+        match query.get(name, None):
+            case None if required:
+                errors.append(_query_error(name, "field required", "missing"))
+            case None:
+                pass
+            case values:
+                try:
+                    kwargs[name] = convert(values)
+                except (TypeError, ValueError) as error:
+                    errors.append(_query_error(name, str(error), "invalid"))
+    return errors
 
 
 def bind_query(func: Callable[..., HTTPHandler]) -> HTTPHandler:
-    """Executes passed `func` on path query.
+    """Executes passed `func` on request query parameters.
+
+    Query is parsed once per request (see `HTTPContext.request_query`) and shared by
+    all `bind_query` handlers. Named parameters of `func` are taken from the query
+    and converted to their annotated types (see `converters.values_converter`): list
+    annotations get all values, other ones get the last value. Unknown parameters
+    are passed as last `str` value only when `func` accepts `**kwargs`.
+
+    When a parameter without default is missing or can't be converted client is
+    responded with 400 Bad Request with JSON `{"detail": [errors]}` body.
 
     Args:
-        func (Callable[..., HTTPHandler]): to run on request path query.
+        func (Callable[..., HTTPHandler]): to run on request query parameters.
     """
+    hints = type_hints(func)
+    params: QueryParams = {}
+    parameters = _parameters(func)
+    var_keyword = parameters is None
+    for param in parameters or ():
+        match param.kind:
+            case param.POSITIONAL_OR_KEYWORD | param.KEYWORD_ONLY:
+                annotation = hints.get(param.name, param.annotation)
+                params[param.name] = _query_param(param, annotation)
+            case param.VAR_KEYWORD:
+                var_keyword = True
 
     @handler
     def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
-        match get_request_query_string(ctx):
-            case b"":
-                query = {}
-            case raw_query:
-                query = (
-                    pipe(raw_query)
-                    << decode("UTF-8")
-                    << str_split("&")
-                    << cmap(str_split("="))
-                    << list
-                    << dict
-                ).finish()
-
-        handle = func(**query)
-        return handle(nxt, ctx)
+        query = ctx.request_query
+        kwargs = {}
+        match _convert_query(params, query, kwargs):
+            case []:
+                pass
+            case errors:
+                return bad_request({"detail": errors})(nxt, ctx)
+
+        if var_keyword:
+            for name, values in query.items():
+                if name not in params:
+                    kwargs[name] = values[-1]
+        return func(**kwargs)(nxt, ctx)
 
     return _handler
 
 
+def _match_params(path_parts: list[str], ctx: HTTPContext) -> tuple[str, ...] | None:
+    """Returns values of path params when request path matches `path_parts`."""
+    request_path_parts = get_request_path(ctx).strip("/").split("/")
+    match len(request_path_parts) == len(path_parts):
+        case False:
+            return None
+    params = ()
+    for part, request_part in zip(path_parts, request_path_parts):
+        match part.startswith("{"), part == request_part:
+            case True, _:
+                params = (*params, request_part)
+            case False, False:
+                return None
+    return params
+
+
 def bind_params(path: str, func: Callable[..., HTTPHandler]) -> HTTPHandler:
     """Executes passed `func` on path params or skips pipeline.
 
@@ -111,22 +218,135 @@ def bind_params(path: str, func: Callable[..., HTTPHandler]) -> HTTPHandler:
     """
     path_parts = path.strip("/").split("/")
 
-    @handler
+    @guard("params", tuple(path_parts), func)
     def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
-        request_path_parts = get_request_path(ctx).strip("/").split("/")
-        params = ()
-        match len(request_path_parts) == len(path_parts):
-            case True:
-                for part, request_part in zip(path_parts, request_path_parts):
-                    match part.startswith("{"), part == request_part:
-                        case True, _:
-                            params = (*params, request_part)
-                        case False, True:
-                            continue
-                        case False, False:
-                            return skip(ctx)
+        match _match_params(path_parts, ctx):
+            case None:
+                return skip(ctx)
+            case params:
                 return func(*params)(nxt, ctx)
-            case False:
+
+    return _handler
+
+
+def _is_model(annotation: Any) -> bool:
+    return (
+        isinstance(annotation, type)
+        and get_origin(annotation) is None
+        and issubclass(annotation, BaseModel)
+    )
+
+
+def bind(func: Callable[..., HTTPHandler], path: str | None = None) -> HTTPHandler:
+    """Executes passed `func` on typed path params, query parameters and body.
+
+    Signature of `func` is inspected once when handler is created:
+
+    * parameters named as "{param}" parts of the `path` are taken from the path;
+    * parameter annotated with pydantic `BaseModel` subclass is validated from the
+      JSON request body (see `request_body.validate_json`);
+    * other parameters are taken from the query (see `bind_query`), unknown query
+      parameters are passed as last `str` value only when `func` accepts
+      `**kwargs`.
+
+    Values are converted to annotated types (`int`, `float`, `bool`, `UUID`,
+    `datetime`, `date`, `Enum`... see `converters.converter`). When `path` does not
+    match request path or path param can't be converted pipeline is skipped, so
+    other routes may match. Invalid query is responded with 400 Bad Request, invalid
+    body with 400 or 422 (see `request_body.validation_error`).
+
+    With `path` set handler is registered in `router` the same way `bind_params` is.
+
+    Args:
+        func (Callable[..., HTTPHandler]): to run on request parameters.
+        path (str | None): to match with, when `None` only query and body are bound.
+
+    Raises:
+        ValueError: when path param is not a parameter of `func`.
+    """
+    hints = type_hints(func)
+    path_parts = path.strip("/").split("/") if path is not None else []
+    path_names = [part[1:-1] for part in path_parts if part.startswith("{")]
+    parameters = {}
+    signature = _parameters(func)
+    var_keyword = signature is None
+    for param in signature or ():
+        match param.kind:
+            case param.POSITIONAL_OR_KEYWORD | param.KEYWORD_ONLY:
+                parameters[param.name] = param
+            case param.VAR_KEYWORD:
+                var_keyword = True
+    for name in path_names:
+        match parameters.get(name, None):
+            case None:
+                raise ValueError(f"path param {name!r} is not a parameter of {func!r}")
+
+    annotations = {
+        name: hints.get(name, param.annotation) for name, param in parameters.items()
+    }
+    path_params = tuple((name, converter(annotations[name])) for name in path_names)
+    query_params: QueryParams = {}
+    body_params = []
+    for name, param in parameters.items():
+        match name in path_names, annotations[name]:
+            case True, _:
+                continue
+            case False, annotation if _is_model(annotation):
+                body_params.append((name, annotation))
+            case False, annotation:
+                query_params[name] = _query_param(param, annotation)
+
+    async def _body(
+        kwargs: dict, nxt: HTTPFunc, ctx: HTTPContext
+    ) -> HTTPContext | None:
+        for name, model in body_params:
+            try:
+                kwargs[name] = validate_json(model, ctx.request_body)
+            except (orjson.JSONDecodeError, ValidationError) as error:
+                return await validation_error(error)(nxt, ctx)
+        return await func(**kwargs)(nxt, ctx)
+
+    async def _run(
+        params: tuple[str, ...], nxt: HTTPFunc, ctx: HTTPContext
+    ) -> HTTPContext | None:
+        kwargs = {}
+        for (name, convert), value in zip(path_params, params):
+            try:
+                kwargs[name] = convert(value)
+            except (TypeError, ValueError):
+                return await skip(ctx)
+
+        query = ctx.request_query
+        match _convert_query(query_params, query, kwargs):
+            case []:
+                pass
+            case errors:
+                return await bad_request({"detail": errors})(nxt, ctx)
+
+        if var_keyword:
+            for name, values in query.items():
+                if name not in parameters:
+                    kwargs[name] = values[-1]
+
+        match body_params:
+            case []:
+                return await func(**kwargs)(nxt, ctx)
+            case _:
+                return await (receive >> HTTPHandler(partial(_body, kwargs)))(nxt, ctx)
+
+    def bound(*params: str) -> HTTPHandler:
+        return HTTPHandler(partial(_run, params))
+
+    match path:
+        case None:
+            return bound()
+
+    @guard("params", tuple(path_parts), bound)
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        match _match_params(path_parts, ctx):
+            case None:
                 return skip(ctx)
+            case params:
+                return _run(params, nxt, ctx)
 
     return _handler
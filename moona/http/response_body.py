@@ -1,15 +1,80 @@
+import csv
+import io
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache, partial
+from typing import Any, AsyncIterable, Callable
+from uuid import UUID
+
 import orjson
 from fundom import future, pipe
 from pydantic import BaseModel
 
 from moona.http.context import HTTPContext, set_response_body
-from moona.http.events import respond, start
-from moona.http.handlers import HTTPFunc, HTTPHandler, handler1
+from moona.http.events import respond_stream, respond_with, start
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler, handler1
+from moona.http.request_headers import accepted_media_types
 from moona.http.response_headers import (
     content_type_application_json,
     content_type_text_plain,
 )
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# models, dicts, lists and dataclasses (and whatever orjson serializes natively)
+JSONData = Any
+
+PYDANTIC_V2 = hasattr(BaseModel, "model_dump_json")
+
+
+def _default(obj: Any) -> Any:
+    """Makes objects orjson does not know about serializable."""
+    match obj:
+        case BaseModel() if PYDANTIC_V2:
+            return obj.model_dump()
+        case BaseModel():
+            return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@lru_cache(maxsize=None)
+def _model_serializer(cls: type[BaseModel]) -> Callable[[BaseModel], bytes]:
+    """Returns serializer for the `cls` instances.
+
+    With pydantic v2 compiled model serializer is used, with v1 fields are passed to
+    orjson as is, so nested models, datetimes, UUIDs and dataclasses are serialized
+    in a single pass without building intermediate dict.
+    """
+    match PYDANTIC_V2:
+        case True:
+            return cls.__pydantic_serializer__.to_json
+        case False:
+            return partial(orjson.dumps, default=_default)
+
+
+def serialize(data: JSONData) -> bytes:
+    """Serializes `data` to JSON using the fastest path available for its type.
+
+    Models use serializer cached per model class, everything else (dicts, lists,
+    dataclasses, datetimes, UUIDs and models nested in them) is serialized by orjson
+    natively.
+
+    Args:
+        data (JSONData): to serialize.
+
+    Returns:
+        bytes: JSON.
+    """
+    match data:
+        case BaseModel():
+            return _model_serializer(type(data))(data)
+        case _:
+            return orjson.dumps(data, default=_default)
+
 
 @handler1
 def set_raw(data: bytes, nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
@@ -34,59 +99,223 @@ def set_text(data: str) -> HTTPHandler:
     return set_raw(data.encode("UTF-8")) >> content_type_text_plain
 
 
-def set_json(data: BaseModel) -> HTTPHandler:
+def set_json(data: JSONData) -> HTTPHandler:
     """Sets response body to passed object json representation.
 
     Also sets "Content-Type: application/json" response header.
 
     Args:
-        data (BaseModel): body.
+        data (JSONData): body.
     """
-    raw = pipe(data) << BaseModel.dict << orjson.dumps
-    return set_raw(raw.value) >> content_type_application_json
+    return set_raw(serialize(data)) >> content_type_application_json
 
 
-def raw(data: bytes) -> HTTPHandler:
+def raw(data: bytes, status: int | None = None) -> HTTPHandler:
     """Respond client with raw passed `bytes`.
 
+    Response messages are built once when handler is created.
+
     Args:
         data (bytes): response body.
+        status (int | None): response status, by default context one is used.
     """
-    return set_raw(data) >> start >> respond
+    return respond_with(data, (), status)
 
 
-def text(data: str) -> HTTPHandler:
+def text(data: str, status: int | None = None) -> HTTPHandler:
     """Respond client with passed `str`.
 
-    Also sets "Content-Type: text/plain" response header.
+    Also sets "Content-Type: text/plain" response header. Response messages are built
+    once when handler is created.
 
     Args:
         data (str): response body.
+        status (int | None): response status, by default context one is used.
     """
-    return set_text(data) >> start >> respond
+    return respond_with(
+        data.encode("UTF-8"), [(b"content-type", b"text/plain")], status
+    )
 
 
-def json(data: BaseModel) -> HTTPHandler:
-    """Respond client with passed `BaseModel` json representation.
+def json(data: JSONData, status: int | None = None) -> HTTPHandler:
+    """Respond client with passed data json representation.
 
-    Also sets "Content-Type: application/json" response header.
+    Also sets "Content-Type: application/json" response header. Response messages are
+    built once when handler is created.
 
     Args:
-        data (BaseModel): response body.
+        data (JSONData): response body.
+        status (int | None): response status, by default context one is used.
     """
-    return set_json(data) >> start >> respond
+    body = serialize(data)
+    return respond_with(body, [(b"content-type", b"application/json")], status)
 
 
-def negotiate(data: bytes | str | BaseModel) -> HTTPHandler:
+def stream(chunks: AsyncIterable[bytes | str]) -> HTTPHandler:
+    """Respond client with body produced by async iterable chunk by chunk.
+
+    Each chunk is sent as soon as it is produced and the next one is produced only
+    after previous had been sent, so time to first byte and memory usage do not
+    depend on the size of the response. As async iterable can be consumed only once
+    handler should be created for each request.
+
+    Args:
+        chunks (AsyncIterable[bytes | str]): response body chunks.
+    """
+    return start >> respond_stream(chunks)
+
+
+def _as_dict(obj: Any) -> dict:
+    match obj:
+        case dict():
+            return obj
+        case BaseModel() if PYDANTIC_V2:
+            return obj.model_dump()
+        case BaseModel():
+            return obj.dict()
+        case _ if is_dataclass(obj) and not isinstance(obj, type):
+            return asdict(obj)
+    raise TypeError(f"Type can't be converted to dict: {type(obj).__name__}")
+
+
+def serialize_csv(data: JSONData) -> bytes:
+    """Serializes list of rows (dicts, models or dataclasses) to CSV with header.
+
+    Args:
+        data (JSONData): rows.
+
+    Raises:
+        TypeError: when `data` is not a list of rows.
+
+    Returns:
+        bytes: CSV.
+    """
+    match data:
+        case list() | tuple():
+            rows = [_as_dict(row) for row in data]
+        case _:
+            raise TypeError("CSV can only be serialized from a list of rows")
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]) if rows else [])
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("UTF-8")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    match obj:
+        case datetime() | date() | time():
+            return obj.isoformat()
+        case UUID() | Decimal():
+            return str(obj)
+    return _as_dict(obj)
+
+
+def serialize_msgpack(data: JSONData) -> bytes:
+    """Serializes `data` to MessagePack (requires `msgpack` package).
+
+    Args:
+        data (JSONData): to serialize.
+
+    Returns:
+        bytes: MessagePack.
+    """
+    return msgpack.packb(data, default=_msgpack_default)
+
+
+SERIALIZERS: dict[str, Callable[[JSONData], bytes]] = {
+    "application/json": serialize,
+    **(
+        {
+            "application/msgpack": serialize_msgpack,
+            "application/x-msgpack": serialize_msgpack,
+        }
+        if msgpack is not None
+        else {}
+    ),
+    "text/csv": serialize_csv,
+}
+
+
+def register_serializer(media_type: str, func: Callable[[JSONData], bytes]) -> None:
+    """Registers serializer for the `media_type` used by `serialized` and `negotiate`.
+
+    Serializer should raise `TypeError` or `ValueError` for data it can't serialize,
+    so next acceptable media type is tried.
+
+    Args:
+        media_type (str): e.g. "application/yaml".
+        func (Callable[[JSONData], bytes]): serializer.
+    """
+    SERIALIZERS[media_type.lower()] = func
+
+
+def serialized(data: JSONData, status: int | None = None) -> HTTPHandler:
+    """Respond client with data serialized to the media type it prefers.
+
+    Media type is chosen from `SERIALIZERS` by "Accept" request header (parsed
+    results are cached, see `accepted_media_types`). Data is serialized once per
+    media type and the response is reused for later requests. When client accepts
+    none of the media types (or data can't be serialized to them) JSON is sent.
+    "Vary: accept" is set.
+
+    Args:
+        data (JSONData): to respond with.
+        status (int | None): response status, by default context one is used.
+
+    Raises:
+        TypeError: when `data` can't be serialized to JSON.
+    """
+    templates: dict[str, HTTPHandler | None] = {}
+
+    def template(media_type: str) -> HTTPHandler | None:
+        match media_type in templates:
+            case False:
+                try:
+                    body = SERIALIZERS[media_type](data)
+                except (TypeError, ValueError):
+                    templates[media_type] = None
+                else:
+                    headers = [
+                        (b"content-type", media_type.encode("UTF-8")),
+                        (b"vary", b"accept"),
+                    ]
+                    templates[media_type] = respond_with(body, headers, status)
+        return templates[media_type]
+
+    fallback = template("application/json")
+    match fallback:
+        case None:
+            raise TypeError(f"Type is not JSON serializable: {type(data).__name__}")
+
+    @handler
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        accept = ctx.request_headers.get(b"accept", b"")
+        for media_type in accepted_media_types(accept, tuple(SERIALIZERS)):
+            match template(media_type):
+                case HTTPHandler() as h:
+                    return h(nxt, ctx)
+        return fallback(nxt, ctx)
+
+    return _handler
+
+
+def negotiate(data: bytes | str | JSONData, status: int | None = None) -> HTTPHandler:
     """Respond client with passed data based on its type.
 
+    `bytes` are sent as is, `str` as text, models, dicts, lists and dataclasses are
+    serialized to the media type client accepts (see `serialized`), JSON by default.
+
     Args:
-        data (bytes | str | BaseModel): to respond with.
+        data (bytes | str | JSONData): to respond with.
+        status (int | None): response status, by default context one is used.
     """
     match data:
         case bytes():
-            return raw(data)
+            return raw(data, status)
         case str():
-            return text(data)
-        case BaseModel():
-            return json(data)
+            return text(data, status)
+        case BaseModel() | dict() | list() | tuple():
+            return serialized(data, status)
+        case _ if is_dataclass(data) and not isinstance(data, type):
+            return serialized(data, status)
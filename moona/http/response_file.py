@@ -0,0 +1,120 @@
+import asyncio
+import mimetypes
+import os
+from stat import S_ISREG
+from typing import AsyncIterator
+
+from moona.http.context import HTTPContext, get_extensions
+from moona.http.events import respond, respond_stream, start
+from moona.http.handlers import HTTPFunc, HTTPHandler, end, handler, skip
+
+
+async def iter_file(path: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    """Iterate over file content reading it in the thread pool by `chunk_size` bytes.
+
+    Args:
+        path (str): to file.
+        chunk_size (int): maximum size of the chunk.
+
+    Yields:
+        bytes: file chunk.
+    """
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
+
+
+async def _send_pathsend(path: str, ctx: HTTPContext) -> HTTPContext:
+    await start(end, ctx)
+    await ctx.send({"type": "http.response.pathsend", "path": path})
+    ctx.closed = True
+    return ctx
+
+
+async def _send_zerocopy(path: str, size: int, ctx: HTTPContext) -> HTTPContext:
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        await start(end, ctx)
+        await ctx.send(
+            {
+                "type": "http.response.zerocopy",
+                "file": f,
+                "offset": 0,
+                "count": size,
+                "more_body": False,
+            }
+        )
+    finally:
+        await asyncio.to_thread(f.close)
+    ctx.closed = True
+    return ctx
+
+
+async def send_file(
+    path: str, size: int, ctx: HTTPContext, chunk_size: int = 65536
+) -> HTTPContext:
+    """Start response and send file with the best way server supports.
+
+    When `skip_body` is set only headers are sent and file is not read.
+
+    Args:
+        path (str): absolute path to file.
+        size (int): of file.
+        ctx (HTTPContext): to send file from.
+        chunk_size (int): maximum size of the chunk when file is streamed.
+
+    Returns:
+        HTTPContext: closed context.
+    """
+    match ctx.skip_body, get_extensions(ctx):
+        case True, _:
+            return await (start >> respond)(end, ctx)
+        case _, {"http.response.pathsend": _}:
+            return await _send_pathsend(path, ctx)
+        case _, {"http.response.zerocopy": _}:
+            return await _send_zerocopy(path, size, ctx)
+        case _:
+            chunks = iter_file(path, chunk_size)
+            return await (start >> respond_stream(chunks))(end, ctx)
+
+
+def file(path: str | os.PathLike, chunk_size: int = 65536) -> HTTPHandler:  # noqa
+    """Respond client with the content of the file.
+
+    When server supports "http.response.pathsend" or "http.response.zerocopy" ASGI
+    extension, file is sent by the server itself (for example with `sendfile`) and
+    its content never gets to Python. Otherwise file is streamed by `chunk_size`
+    bytes read in the thread pool.
+
+    "Content-Length" is set to the size of the file and "Content-Type" is guessed
+    from its name when not set before. When file does not exist or is not a regular
+    file (for example a directory) pipeline is skipped.
+
+    Args:
+        path (str | os.PathLike): to file.
+        chunk_size (int): maximum size of the chunk when file is streamed.
+    """
+    path = os.path.abspath(path)
+    content_type, _ = mimetypes.guess_type(path)
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        try:
+            stat = await asyncio.to_thread(os.stat, path)
+        except (FileNotFoundError, NotADirectoryError):
+            return await skip(ctx)
+        if not S_ISREG(stat.st_mode):
+            return await skip(ctx)
+
+        ctx.response_headers[b"content-length"] = str(stat.st_size).encode("UTF-8")
+        if content_type is not None:
+            ctx.response_headers.setdefault(
+                b"content-type", content_type.encode("UTF-8")
+            )
+
+        return await send_file(path, stat.st_size, ctx, chunk_size)
+
+    return _handler
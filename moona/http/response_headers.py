@@ -1,28 +1,54 @@
 from fundom import future, pipe
 
 from moona.http.context import HTTPContext, get_response_body, set_response_header
-from moona.http.handlers import HTTPFunc, HTTPHandler, handle_func_sync, handler2
+from moona.http.handlers import HTTPFunc, HTTPHandler, handle_func_sync, handler
 
 
-@handler2
-def header(
-    name: str,
-    value: str,
-    nxt: HTTPFunc,
-    ctx: HTTPContext,
-) -> future[HTTPContext | None]:
-    """`HTTPHandler` that sets response header.
+def header(name: str, value: str) -> HTTPHandler:
+    """`HTTPHandler` that sets response header replacing its previous values.
+
+    Name and value are encoded once when handler is created.
 
     Args:
         name (str): of header.
         value (str): of header.
-        nxt (HTTPFunc): to run next.
-        ctx (HTTPContext): to process.
 
     Returns:
-        future[HTTPContext | None]: result.
+        HTTPHandler: handler.
     """
-    return pipe(ctx) << set_response_header(name, value) >> nxt
+    _name = name.encode("UTF-8").lower()
+    _value = value.encode("UTF-8")
+
+    @handler
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        ctx.response_headers.set(_name, _value)
+        return nxt(ctx)
+
+    return _handler
+
+
+def add_header(name: str, value: str) -> HTTPHandler:
+    """`HTTPHandler` that adds one more value for response header.
+
+    Useful for headers that may occur several times like "Set-Cookie". Name and
+    value are encoded once when handler is created.
+
+    Args:
+        name (str): of header.
+        value (str): of header.
+
+    Returns:
+        HTTPHandler: handler.
+    """
+    _name = name.encode("UTF-8").lower()
+    _value = value.encode("UTF-8")
+
+    @handler
+    def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
+        ctx.response_headers.add(_name, _value)
+        return nxt(ctx)
+
+    return _handler
 
 
 def content_type(value: str):
@@ -37,6 +63,10 @@ def content_type(value: str):
     return header("content-type", value)
 
 
+_content_type_application_json = content_type("application/json")
+_content_type_text_plain = content_type("text/plain")
+
+
 def content_type_application_json(
     nxt: HTTPFunc, ctx: HTTPContext
 ) -> future[HTTPContext | None]:
@@ -49,7 +79,7 @@ def content_type_application_json(
     Returns:
         future[HTTPContext | None]: result
     """
-    return content_type("application/json")(nxt, ctx)
+    return _content_type_application_json(nxt, ctx)
 
 
 def content_type_text_plain(
@@ -64,7 +94,7 @@ def content_type_text_plain(
     Returns:
         future[HTTPContext | None]: result.
     """
-    return content_type("text/plain")(nxt, ctx)
+    return _content_type_text_plain(nxt, ctx)
 
 
 def content_length(value: int) -> HTTPHandler:
@@ -206,6 +206,19 @@ def set_gone(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
     return set_status(GONE)(nxt, ctx)
 
 
+@handler
+def set_payload_too_large(
+    nxt: HTTPFunc, ctx: HTTPContext
+) -> future[HTTPContext | None]:
+    """Sets response status code to PAYLOAD_TOO_LARGE.
+
+    Args:
+        nxt (HTTPFunc): to run next.
+        ctx (HTTPContext): to process.
+    """
+    return set_status(PAYLOAD_TOO_LARGE)(nxt, ctx)
+
+
 @handler
 def set_unsupported_media_type(
     nxt: HTTPFunc, ctx: HTTPContext
@@ -347,7 +360,7 @@ def ok(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_ok >> negotiate(data)
+    return negotiate(data, OK)
 
 
 def created(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -356,7 +369,7 @@ def created(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_created >> negotiate(data)
+    return negotiate(data, CREATED)
 
 
 def accepted(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -365,18 +378,21 @@ def accepted(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_accepted >> negotiate(data)
+    return negotiate(data, ACCEPTED)
+
+
+_EMPTY_NO_CONTENT = raw(b"", NO_CONTENT)
 
 
 @handler
 def no_content(nxt: HTTPFunc, ctx: HTTPContext) -> future[HTTPContext | None]:
-    """Sets status code NO_CONTENT and respond with passed data.
+    """Sets status code NO_CONTENT and respond with empty body.
 
     Args:
         nxt (HTTPFunc): to run next.
         ctx (HTTPContext): to process.
     """
-    return (set_no_content >> raw(b""))(nxt, ctx)
+    return _EMPTY_NO_CONTENT(nxt, ctx)
 
 
 def bad_request(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -385,7 +401,7 @@ def bad_request(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_bad_request >> negotiate(data)
+    return negotiate(data, BAD_REQUEST)
 
 
 def unauthorized(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -394,7 +410,7 @@ def unauthorized(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_unauthorized >> negotiate(data)
+    return negotiate(data, UNAUTHORIZED)
 
 
 def forbidden(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -403,7 +419,7 @@ def forbidden(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_forbidden >> negotiate(data)
+    return negotiate(data, FORBIDDEN)
 
 
 def not_found(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -412,7 +428,7 @@ def not_found(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_not_found >> negotiate(data)
+    return negotiate(data, NOT_FOUND)
 
 
 def method_not_allowed(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -421,7 +437,7 @@ def method_not_allowed(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_method_not_allowed >> negotiate(data)
+    return negotiate(data, METHOD_NOT_ALLOWED)
 
 
 def not_acceptable(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -430,7 +446,7 @@ def not_acceptable(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_not_acceptable >> negotiate(data)
+    return negotiate(data, NOT_ACCEPTABLE)
 
 
 def conflict(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -439,7 +455,7 @@ def conflict(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_conflict >> negotiate(data)
+    return negotiate(data, CONFLICT)
 
 
 def gone(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -448,7 +464,16 @@ def gone(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_gone >> negotiate(data)
+    return negotiate(data, GONE)
+
+
+def payload_too_large(data: bytes | str | BaseModel) -> HTTPHandler:
+    """Sets status code PAYLOAD_TOO_LARGE and respond with passed data.
+
+    Args:
+        data (bytes | str | BaseModel): to respond with.
+    """
+    return negotiate(data, PAYLOAD_TOO_LARGE)
 
 
 def unsupported_media_type(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -457,7 +482,7 @@ def unsupported_media_type(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_unsupported_media_type >> negotiate(data)
+    return negotiate(data, UNSUPPORTED_MEDIA_TYPE)
 
 
 def im_a_teapot(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -466,7 +491,7 @@ def im_a_teapot(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_im_a_teapot >> negotiate(data)
+    return negotiate(data, IM_A_TEAPOT)
 
 
 def unprocessable_entity(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -475,7 +500,7 @@ def unprocessable_entity(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_unprocessable_entity >> negotiate(data)
+    return negotiate(data, UNPROCESSABLE_ENTITY)
 
 
 def precondition_required(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -484,7 +509,7 @@ def precondition_required(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_precondition_required >> negotiate(data)
+    return negotiate(data, PRECONDITION_REQUIRED)
 
 
 def too_many_requests(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -493,7 +518,7 @@ def too_many_requests(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_too_many_requests >> negotiate(data)
+    return negotiate(data, TOO_MANY_REQUESTS)
 
 
 def internal_server_error(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -502,7 +527,7 @@ def internal_server_error(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_internal_server_error >> negotiate(data)
+    return negotiate(data, INTERNAL_SERVER_ERROR)
 
 
 def not_implemented(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -511,7 +536,7 @@ def not_implemented(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_not_implemented >> negotiate(data)
+    return negotiate(data, NOT_IMPLEMENTED)
 
 
 def bad_gateway(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -520,7 +545,7 @@ def bad_gateway(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_bad_gateway >> negotiate(data)
+    return negotiate(data, BAD_GATEWAY)
 
 
 def service_unavailable(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -529,7 +554,7 @@ def service_unavailable(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_service_unavailable >> negotiate(data)
+    return negotiate(data, SERVICE_UNAVAILABLE)
 
 
 def gateway_timeout(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -538,7 +563,7 @@ def gateway_timeout(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_gateway_timeout >> negotiate(data)
+    return negotiate(data, GATEWAY_TIMEOUT)
 
 
 def http_version_not_supported(data: bytes | str | BaseModel) -> HTTPHandler:
@@ -547,4 +572,4 @@ def http_version_not_supported(data: bytes | str | BaseModel) -> HTTPHandler:
     Args:
         data (bytes | str | BaseModel): to respond with.
     """
-    return set_http_version_not_supported >> negotiate(data)
+    return negotiate(data, HTTP_VERSION_NOT_SUPPORTED)
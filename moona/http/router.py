@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, NamedTuple
+
+from fundom import future
+
+from moona.http.context import HTTPContext
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler, unchain
+
+Endpoint = NamedTuple(
+    "Endpoint",
+    [
+        ("order", int),
+        ("kind", str),
+        ("func", Callable[..., HTTPHandler] | None),
+        ("rest", HTTPHandler | None),
+    ],
+)
+Match = NamedTuple("Match", [("endpoint", Endpoint), ("params", tuple), ("depth", int)])
+
+
+@dataclass(slots=True)
+class _Node:
+    """Node of radix tree of path segments."""
+
+    static: dict[str, _Node] = field(default_factory=dict)
+    param: _Node | None = None
+    endpoints: list[Endpoint] = field(default_factory=list)
+    prefixes: list[Endpoint] = field(default_factory=list)
+
+    def insert(self, parts: list[str] | tuple[str, ...], params: bool = False) -> _Node:
+        """Returns node for passed path segments creating missing ones.
+
+        "{param}" segments become param nodes only when `params` is set, otherwise
+        they are matched literally as `route` and `subroute` do.
+        """
+        node = self
+        for part in parts:
+            match params and part.startswith("{"):
+                case True:
+                    if node.param is None:
+                        node.param = _Node()
+                    node = node.param
+                case False:
+                    node = node.static.setdefault(part, _Node())
+        return node
+
+    def match(
+        self, parts: list[str], depth: int, params: tuple, found: list[Match]
+    ) -> None:
+        """Collects all endpoints matching path segments starting from `depth`."""
+        for endpoint in self.prefixes:
+            found.append(Match(endpoint, params, depth))
+
+        match depth == len(parts):
+            case True:
+                for endpoint in self.endpoints:
+                    found.append(Match(endpoint, params, depth))
+            case False:
+                part = parts[depth]
+                if (child := self.static.get(part)) is not None:
+                    child.match(parts, depth + 1, params, found)
+                if self.param is not None:
+                    self.param.match(parts, depth + 1, (*params, part), found)
+
+
+def _rest(chain: tuple[HTTPHandler, ...]) -> HTTPHandler | None:
+    match chain:
+        case ():
+            return None
+        case (h,):
+            return h
+        case (h, *hs):
+            for _h in hs:
+                h = h >> _h
+            return h
+
+
+def _prefix_parts(path: str) -> list[str]:
+    return path.split("/") if path else []
+
+
+@dataclass(slots=True)
+class RouteTree:
+    """Radix tree compiled from `route`, `subroute` and `bind_params` declarations.
+
+    Tree is built once from the list of handlers. Each handler is indexed by its
+    leading routing guard, handlers that start with anything else are stored as
+    fallbacks that are tried for any path.
+    """
+
+    exact: _Node = field(default_factory=_Node)
+    insensitive: _Node = field(default_factory=_Node)
+    fallbacks: list[Match] = field(default_factory=list)
+
+    def add(self, order: int, h: HTTPHandler) -> None:
+        """Index handler `h` declared at position `order`."""
+        head, *tail = unchain(h)
+        rest = _rest(tuple(tail))
+        match head._guard:
+            case ("route", (path,)):
+                endpoint = Endpoint(order, "route", None, rest)
+                self.exact.insert(path.split("/")).endpoints.append(endpoint)
+            case ("route_ci", (path,)):
+                endpoint = Endpoint(order, "route", None, rest)
+                self.insensitive.insert(path.split("/")).endpoints.append(endpoint)
+            case ("subroute", (path,)):
+                endpoint = Endpoint(order, "subroute", None, rest)
+                self.exact.insert(_prefix_parts(path)).prefixes.append(endpoint)
+            case ("subroute_ci", (path,)):
+                endpoint = Endpoint(order, "subroute", None, rest)
+                node = self.insensitive.insert(_prefix_parts(path))
+                node.prefixes.append(endpoint)
+            case ("params", (parts, func)):
+                endpoint = Endpoint(order, "params", func, rest)
+                self.exact.insert(parts, params=True).endpoints.append(endpoint)
+            case _:
+                endpoint = Endpoint(order, "fallback", None, h)
+                self.fallbacks.append(Match(endpoint, (), 0))
+
+    def match(self, parts: list[str]) -> list[Match]:
+        """Returns all matches for path segments in the order of declaration."""
+        found: list[Match] = []
+        self.exact.match(parts, 0, (), found)
+        if self.insensitive.static or self.insensitive.prefixes:
+            self.insensitive.match([p.lower() for p in parts], 0, (), found)
+        found.extend(self.fallbacks)
+        if len(found) > 1:
+            found.sort(key=lambda m: m.endpoint.order)
+        return found
+
+
+def _run(
+    m: Match, nxt: HTTPFunc, linked: dict[int, HTTPFunc], ctx: HTTPContext
+) -> future[HTTPContext | None]:
+    endpoint = m.endpoint
+    match endpoint.rest:
+        case None:
+            func = nxt
+        case rest:
+            func = linked.get(endpoint.order, None)
+            if func is None:
+                func = linked[endpoint.order] = rest.compile(nxt)
+    match endpoint.kind:
+        case "params":
+            return endpoint.func(*m.params)(func, ctx)
+        case _:
+            return func(ctx)
+
+
+def router(handlers: list[HTTPHandler]) -> HTTPHandler:
+    """Dispatch request by path through radix tree of routing declarations.
+
+    Works like `choose` over the same `handlers`, but instead of trying every handler
+    in turn radix tree of path segments is built once from leading `route`,
+    `route_ci`, `subroute`, `subroute_ci` and `bind_params` guards. On request path
+    is split once and only handlers that could match it are tried (in the order they
+    were declared). Static segments, "{param}" segments of `bind_params` and `bind`
+    and `subroute` prefixes (that match any tail) are supported. Handlers that do not
+    start with routing guard are tried for every path.
+
+    Unlike `subroute` prefixes are matched by whole path segments. As in `choose`
+    handlers following the routing guard are linked with `nxt` only when it changes.
+
+    Args:
+        handlers (list[HTTPHandler]): to dispatch to.
+
+    Returns:
+        HTTPHandler: result.
+    """
+    tree = RouteTree()
+    for order, h in enumerate(handlers):
+        tree.add(order, h)
+    bound: list = [None, {}]
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        match handlers, bound:
+            case [], _:
+                return await nxt(ctx)
+            case _, [_nxt, linked] if _nxt is nxt:
+                pass
+            case _:
+                linked = {}
+                bound[:] = [nxt, linked]
+
+        path = ctx.request_path
+        parts = path.split("/")
+        for m in tree.match(parts):
+            match m:
+                case Match(endpoint=Endpoint(kind="subroute"), depth=depth):
+                    ctx.request_path = "/".join(parts[depth:])
+            match await _run(m, nxt, linked, ctx):
+                case None:
+                    ctx.request_path = path
+                case some:
+                    return some
+
+        return None
+
+    return _handler
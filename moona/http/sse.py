@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, NamedTuple
+
+from moona.http.context import HTTPContext
+from moona.http.events import EMPTY_BODY, start
+from moona.http.handlers import HTTPFunc, HTTPHandler, end, handler
+from moona.http.response_body import serialize
+
+
+class ServerSentEvent(NamedTuple):
+    """Event with optional name ("event" field), id and reconnection time."""
+
+    data: Any
+    event: str | None = None
+    id: str | None = None
+    retry: int | None = None
+
+
+HEARTBEAT = b": heartbeat\n\n"
+
+
+def _lines(data: Any) -> list[bytes]:
+    match data:
+        case bytes():
+            return data.splitlines() or [b""]
+        case str():
+            return data.encode("UTF-8").splitlines() or [b""]
+        case _:
+            return [serialize(data)]
+
+
+def _field(name: bytes, value: str) -> bytes:
+    match "\r" in value or "\n" in value:
+        case True:
+            # line break would end the field and let value inject other fields
+            raise ValueError(f"{name.decode()} must not contain line breaks: {value!r}")
+    return name + b": " + value.encode("UTF-8") + b"\n"
+
+
+def format_event(event: ServerSentEvent | Any) -> bytes:
+    """Encodes event to "text/event-stream" frame.
+
+    Anything that is not `ServerSentEvent` is sent as event data. Data is sent as
+    is when it is `str` or `bytes` (one "data:" field for each line) and serialized
+    to JSON otherwise.
+
+    Args:
+        event (ServerSentEvent | Any): event or its data.
+
+    Returns:
+        bytes: frame.
+
+    Raises:
+        ValueError: event name or id contains line breaks.
+    """
+    match event:
+        case ServerSentEvent(data, name, id_, retry):
+            pass
+        case data:
+            name, id_, retry = None, None, None
+    frame = []
+    if name is not None:
+        frame.append(_field(b"event", name))
+    if id_ is not None:
+        frame.append(_field(b"id", id_))
+    if retry is not None:
+        frame.append(b"retry: " + str(retry).encode("UTF-8") + b"\n")
+    frame.extend(b"data: " + line + b"\n" for line in _lines(data))
+    frame.append(b"\n")
+    return b"".join(frame)
+
+
+@dataclass(slots=True, init=False)
+class ReplayBuffer:
+    """Keeps last `max_events` frames of events with ids for resuming streams.
+
+    Buffer is meant to be shared by all the streams of the same feed: frames are
+    stored once per event id, so streams do not duplicate each other.
+    """
+
+    max_events: int
+    _frames: OrderedDict[str, bytes]
+
+    def __init__(self, max_events: int = 1024) -> None:
+        self.max_events = max_events
+        self._frames = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def add(self, id_: str, frame: bytes) -> None:
+        """Stores `frame` of event with `id_` evicting the oldest one if needed."""
+        match id_ in self._frames:
+            case True:
+                return
+        self._frames[id_] = frame
+        if len(self._frames) > self.max_events:
+            self._frames.popitem(last=False)
+
+    def after(self, id_: str) -> list[bytes] | None:
+        """Returns frames stored after event with `id_` or `None` if it is not kept."""
+        match id_ in self._frames:
+            case False:
+                return None
+        ids = iter(self._frames)
+        for _id in ids:
+            if _id == id_:
+                break
+        return [self._frames[_id] for _id in ids]
+
+
+async def _wait_disconnect(ctx: HTTPContext) -> None:
+    while True:
+        match await ctx.receive():
+            case {"type": "http.disconnect"}:
+                return
+
+
+async def _send_frame(ctx: HTTPContext, frame: bytes) -> None:
+    await ctx.send({"type": "http.response.body", "body": frame, "more_body": True})
+
+
+async def _stream(
+    ctx: HTTPContext,
+    events: AsyncIterator,
+    heartbeat: float | None,
+    replay: ReplayBuffer | None,
+) -> None:
+    disconnected = asyncio.ensure_future(_wait_disconnect(ctx))
+    produced = None
+    try:
+        while True:
+            match produced:
+                case None:
+                    produced = asyncio.ensure_future(anext(events))
+            done, _ = await asyncio.wait(
+                {produced, disconnected},
+                timeout=heartbeat,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            match disconnected in done, produced in done:
+                case True, _:
+                    return
+                case False, False:
+                    await _send_frame(ctx, HEARTBEAT)
+                    continue
+            try:
+                event = produced.result()
+            except StopAsyncIteration:
+                await ctx.send(
+                    {"type": "http.response.body", "body": b"", "more_body": False}
+                )
+                return
+            produced = None
+            frame = format_event(event)
+            match replay, event:
+                case ReplayBuffer(), ServerSentEvent(id=str() as id_):
+                    replay.add(id_, frame)
+            await _send_frame(ctx, frame)
+    finally:
+        disconnected.cancel()
+        if produced is not None:
+            produced.cancel()
+            await asyncio.wait({produced})
+
+
+def sse(
+    events: AsyncIterable[ServerSentEvent | Any],
+    heartbeat: float | None = 15.0,
+    replay: ReplayBuffer | None = None,
+    retry: int | None = None,
+) -> HTTPHandler:
+    """Respond client with Server-Sent Events produced by async iterable.
+
+    Each event is sent as a separate "text/event-stream" frame (see `format_event`)
+    as soon as it is produced, the next one is requested only after the previous
+    one has been sent. When no event is produced for `heartbeat` seconds comment
+    frame is sent to keep the connection alive. As soon as client disconnects
+    producing stops and async generators are closed.
+
+    When `replay` buffer is passed, frames of events with ids are stored in it and
+    on reconnect with "Last-Event-ID" header events sent after that id are replayed
+    before new ones. `retry` tells client how many milliseconds to wait before
+    reconnecting.
+
+    As async iterable can be consumed only once handler should be created for each
+    request.
+
+    Args:
+        events (AsyncIterable[ServerSentEvent | Any]): events or their data.
+        heartbeat (float | None): seconds of silence before heartbeat is sent.
+        replay (ReplayBuffer | None): buffer of recent events for resuming.
+        retry (int | None): reconnection time in milliseconds.
+    """
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        headers = ctx.response_headers
+        headers.set(b"content-type", b"text/event-stream")
+        headers.set(b"cache-control", b"no-cache")
+        headers.set(b"x-accel-buffering", b"no")
+        await start(end, ctx)
+
+        iterator = aiter(events)
+        try:
+            match ctx.skip_body:
+                case True:
+                    await ctx.send(EMPTY_BODY)
+                    return ctx
+            if retry is not None:
+                await _send_frame(
+                    ctx, b"retry: " + str(retry).encode("UTF-8") + b"\n\n"
+                )
+            last_event_id = ctx.request_headers.get(b"last-event-id", None)
+            match replay, last_event_id:
+                case ReplayBuffer(), bytes():
+                    for frame in (
+                        replay.after(last_event_id.decode("UTF-8", "replace")) or ()
+                    ):
+                        await _send_frame(ctx, frame)
+            await _stream(ctx, iterator, heartbeat, replay)
+            return ctx
+        finally:
+            ctx.closed = True
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return _handler
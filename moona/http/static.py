@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+import os
+import time
+from email.utils import formatdate
+from typing import NamedTuple
+
+from moona.http.context import HTTPContext
+from moona.http.events import respond, start
+from moona.http.handlers import HTTPFunc, HTTPHandler, handler, skip
+from moona.http.request_headers import choose_encoding, etag_matches
+from moona.http.response_file import send_file
+from moona.http.response_status import NOT_MODIFIED
+from moona.utils import LRUCache
+
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+StaticFile = NamedTuple(
+    "StaticFile",
+    [
+        ("path", str),
+        ("size", int),
+        ("etag", bytes),
+        ("last_modified", bytes),
+        ("body", bytes | None),
+    ],
+)
+
+
+def _safe_path(path: str) -> str | None:
+    """Normalizes request path and returns `None` if it tries to escape directory."""
+    match "\x00" in path or "\\" in path:
+        case True:
+            return None
+    path = os.path.normpath(path)
+    match path == ".." or path.startswith(("../", "/")):
+        case True:
+            return None
+    return path
+
+
+def _load(root: str, path: str, suffix: str, max_file_size: int) -> StaticFile | None:
+    """Finds file in `root` and reads it if it is small enough.
+
+    Blocking, must be run in the thread pool.
+    """
+    full_path = os.path.realpath(os.path.join(root, path) + suffix)
+    match os.path.commonpath([root, full_path]) == root:
+        case False:
+            return None
+    try:
+        stat = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if not os.path.isfile(full_path):
+        return None
+
+    body = None
+    if stat.st_size <= max_file_size:
+        with open(full_path, "rb") as f:
+            body = f.read()
+
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'.encode("UTF-8")
+    last_modified = formatdate(stat.st_mtime, usegmt=True).encode("UTF-8")
+    return StaticFile(full_path, stat.st_size, etag, last_modified, body)
+
+
+def _sizeof(lookup: tuple[float, StaticFile | None]) -> int:
+    match lookup:
+        case (_, StaticFile(body=bytes() as body)):
+            return len(body)
+        case _:
+            return 0
+
+
+def static(
+    directory: str | os.PathLike,
+    *,
+    max_entries: int = 1024,
+    max_cache_size: int = 32 * 1024 * 1024,
+    max_file_size: int = 256 * 1024,
+    revalidate_after: float = 1.0,
+    precompressed: bool = True,
+    chunk_size: int = 65536,
+) -> HTTPHandler:
+    """Serve files from the `directory` by request path.
+
+    Only GET and HEAD requests are handled. Request path is resolved inside the
+    `directory` and requests that try to escape it (or point to missing files or
+    directories) skip the pipeline.
+
+    Lookups are kept in LRU cache with at most `max_entries` entries and contents of
+    files not larger than `max_file_size` bytes are cached too (up to
+    `max_cache_size` bytes in total) together with precomputed "ETag" and
+    "Last-Modified". Cached lookups are trusted for `revalidate_after` seconds.
+    Filesystem is accessed only in the thread pool. Larger files are sent with
+    `send_file`.
+
+    When `precompressed` is set ".br" and ".gz" siblings of the file are served to
+    clients that accept "br" or "gzip" content coding. Requests with matching
+    "If-None-Match" are responded with 304 Not Modified.
+
+    Args:
+        directory (str | os.PathLike): to serve files from.
+        max_entries (int): maximum number of cached lookups.
+        max_cache_size (int): maximum total size of cached file contents.
+        max_file_size (int): maximum size of the file which content is cached.
+        revalidate_after (float): seconds after which cached lookup is checked again.
+        precompressed (bool): serve precompressed siblings of the files.
+        chunk_size (int): maximum size of the chunk when file is streamed.
+    """
+    root = os.path.realpath(directory)
+    cache: LRUCache[tuple[str, str], tuple[float, StaticFile | None]] = LRUCache(
+        max_entries, max_cache_size, _sizeof
+    )
+    encodings = tuple(ENCODING_SUFFIXES) if precompressed else ()
+
+    async def lookup(path: str, encoding: str) -> StaticFile | None:
+        key = (path, encoding)
+        now = time.monotonic()
+        match cache.get(key):
+            case (checked, entry) if now - checked < revalidate_after:
+                return entry
+        suffix = ENCODING_SUFFIXES.get(encoding, "")
+        entry = await asyncio.to_thread(_load, root, path, suffix, max_file_size)
+        cache.put(key, (now, entry))
+        return entry
+
+    @handler
+    async def _handler(nxt: HTTPFunc, ctx: HTTPContext) -> HTTPContext | None:
+        match ctx.request_method, _safe_path(ctx.request_path):
+            case ("GET" | "HEAD"), str() as path:
+                pass
+            case _:
+                return await skip(ctx)
+
+        accept_encoding = ctx.request_headers.get(b"accept-encoding", b"")
+        entry, encoding = None, None
+        match encodings and choose_encoding(accept_encoding, encodings):
+            case str() as encoding:
+                entry = await lookup(path, encoding)
+        match entry:
+            case None:
+                encoding = None
+                entry = await lookup(path, "identity")
+        match entry:
+            case None:
+                return await skip(ctx)
+
+        content_type, _ = mimetypes.guess_type(path)
+        content_type = content_type or "application/octet-stream"
+        headers = ctx.response_headers
+        headers[b"content-type"] = content_type.encode("UTF-8")
+        headers[b"etag"] = entry.etag
+        headers[b"last-modified"] = entry.last_modified
+        if encodings:
+            headers[b"vary"] = b"accept-encoding"
+        if encoding is not None:
+            headers[b"content-encoding"] = encoding.encode("UTF-8")
+
+        match etag_matches(ctx.request_headers.get(b"if-none-match", b""), entry.etag):
+            case True:
+                ctx.response_status = NOT_MODIFIED
+                ctx.response_body = b""
+                return await (start >> respond)(nxt, ctx)
+
+        headers[b"content-length"] = str(entry.size).encode("UTF-8")
+        match entry.body:
+            case None:
+                return await send_file(entry.path, entry.size, ctx, chunk_size)
+            case body:
+                ctx.response_body = body
+                return await (start >> respond)(nxt, ctx)
+
+    return _handler
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from moona.context import BaseContext, Receive, Scope, Send
 
@@ -19,11 +20,14 @@ class LifespanContext(BaseContext):
         asgi_version (str): version of the ASGI spec.
         asgi_spec_version (str): The version of this spec being used. Optional; if
         missing defaults to "1.0".
+        state (dict[str, Any]): state of the application shared with all the
+        contexts (see `asgi.create`).
     """
 
     scope_type: str
     asgi_version: str
     asgi_spec_version: str
+    state: dict[str, Any]
 
     def __init__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Creates an instance of `LifespanContext` from ASGI args.
@@ -37,5 +41,7 @@ class LifespanContext(BaseContext):
         self.scope_type = scope["type"]
         self.asgi_version = scope["asgi"]["version"]
         self.asgi_spec_version = scope["asgi"].get("spec_version", "1.0")
+        state = scope.get("state", None)
+        self.state = {} if state is None else state
         self.receive = receive
         self.send = send
@@ -1,4 +1,6 @@
-from typing import Iterable
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, TypeVar
 
 from fundom import hof1
 
@@ -16,3 +18,78 @@ def encode(encoding: str, data: str) -> bytes:  # noqa
 @hof1
 def str_split(separator: str, data: str) -> Iterable[str]:  # noqa
     return data.split(separator)
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(slots=True, init=False)
+class LRUCache(Generic[K, V]):
+    """Least recently used cache bounded by number of entries and their total size.
+
+    Size of each entry is computed with `sizeof`. When any bound is exceeded least
+    recently used entries are evicted.
+    """
+
+    max_entries: int
+    max_size: int | None
+    sizeof: Callable[[V], int]
+    size: int
+    evictions: int
+    _data: OrderedDict[K, V]
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_size: int | None = None,
+        sizeof: Callable[[V], int] = lambda _: 0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.size = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Returns value for the `key` marking it as recently used."""
+        match self._data.get(key, None):
+            case None:
+                return None
+            case value:
+                self._data.move_to_end(key)
+                return value
+
+    def put(self, key: K, value: V) -> None:
+        """Stores `value` for the `key` evicting least recently used entries."""
+        self.pop(key)
+        size = self.sizeof(value)
+        match self.max_size is not None and size > self.max_size:
+            case True:
+                return
+        self._data[key] = value
+        self.size += size
+        while len(self._data) > self.max_entries or (
+            self.max_size is not None and self.size > self.max_size
+        ):
+            _, evicted = self._data.popitem(last=False)
+            self.size -= self.sizeof(evicted)
+            self.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """Removes and returns value for the `key` if any."""
+        match self._data.pop(key, None):
+            case None:
+                return None
+            case value:
+                self.size -= self.sizeof(value)
+                return value
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._data.clear()
+        self.size = 0
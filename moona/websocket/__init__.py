@@ -0,0 +1,32 @@
+from .context import DEFAULT_MAX_QUEUE, WebsocketContext
+from .events import (
+    INTERNAL_ERROR,
+    NORMAL_CLOSURE,
+    POLICY_VIOLATION,
+    ConnectionClosed,
+    accept,
+    close,
+    close_connection,
+    iter_messages,
+    message,
+    on_message,
+    send,
+    send_nowait,
+    send_stream,
+)
+from .handlers import (
+    WebsocketFunc,
+    WebsocketHandler,
+    choose,
+    compose,
+    end,
+    handle_func,
+    handle_func_sync,
+    handler,
+    handler1,
+    handler2,
+    handler3,
+    skip,
+)
+from .hub import Hub, subscribe
+from .request_route import route, subprotocol
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from toolz import keymap
+
+from moona.context import BaseContext, Message, Receive, Scope, Send
+from moona.http.context import ClientInfo, ServerInfo, parse_query
+
+DEFAULT_MAX_QUEUE = 32
+
+
+@dataclass(slots=True)
+class WebsocketContext(BaseContext):
+    """Object that contains entire information related to WebSocket connection.
+
+    Mostly it's structure is replication of WebSocket Connection Scope of ASGI
+    Specification. Unlike `HTTPContext` it lives as long as the connection does, so
+    scope is processed once when context is created.
+
+    Messages to the client are put to the bounded `outbox` queue and are sent by the
+    writer task started on accept, so producers are suspended (or, with
+    `send_nowait`, refused) when client reads slower than they produce and memory
+    used by the connection stays bounded by `max_queue` messages.
+
+    Note:
+        https://asgi.readthedocs.io/en/latest/specs/www.html#websocket
+    """
+
+    # common scope data
+    scope_type: str
+    asgi_version: str
+    asgi_spec_version: str
+    http_version: str
+    scheme: str
+    client: ClientInfo | None
+    server: ServerInfo | None
+
+    # connection info
+    request_path: str
+    request_headers: dict[bytes, bytes]
+    request_query_string: bytes
+    request_query: dict[str, list[str]]
+    subprotocols: list[str]
+
+    # outbound messages
+    max_queue: int
+    outbox: asyncio.Queue[Message | None]
+    writer: asyncio.Task | None
+
+    # context state
+    accepted: bool
+    closed: bool
+    close_code: int | None
+
+    # state of the application shared with all the contexts (see `asgi.create`)
+    state: dict[str, Any]
+
+    _scope: Scope
+
+    def __init__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        self._scope = scope
+        self.scope_type = scope["type"]
+        self.asgi_version = scope["asgi"]["version"]
+        self.asgi_spec_version = scope["asgi"].get("spec_version", "2.0")
+        self.http_version = scope.get("http_version", "1.1")
+        self.scheme = scope.get("scheme", "ws")
+        match scope.get("client", None):
+            case (host, port):
+                self.client = ClientInfo(host, port)
+            case _:
+                self.client = None
+        match scope.get("server", None):
+            case (host, port):
+                self.server = ServerInfo(host, port)
+            case _:
+                self.server = None
+
+        self.receive = receive
+        self.send = send
+
+        self.request_path = scope["path"].strip("/")
+        self.request_headers = keymap(bytes.lower, dict(scope.get("headers", [])))
+        self.request_query_string = scope.get("query_string", b"")
+        self.request_query = parse_query(self.request_query_string)
+        self.subprotocols = list(scope.get("subprotocols", []))
+
+        self.max_queue = max_queue
+        self.outbox = asyncio.Queue(max_queue)
+        self.writer = None
+
+        self.accepted = False
+        self.closed = False
+        self.close_code = None
+
+        state = scope.get("state", None)
+        self.state = {} if state is None else state
+
+    @property
+    def extensions(self) -> dict[str, dict]:
+        """ASGI extensions supported by the server."""
+        return self._scope.get("extensions") or {}
+
+
+# getters
+
+
+def get_request_path(ctx: WebsocketContext):
+    """Returns `WebsocketContext.request_path`."""
+    return ctx.request_path
+
+
+def get_request_headers(ctx: WebsocketContext):
+    """Returns `WebsocketContext.request_headers`."""
+    return ctx.request_headers
+
+
+def get_request_query(ctx: WebsocketContext):
+    """Returns `WebsocketContext.request_query`."""
+    return ctx.request_query
+
+
+def get_subprotocols(ctx: WebsocketContext):
+    """Returns `WebsocketContext.subprotocols`."""
+    return ctx.subprotocols
+
+
+def get_accepted(ctx: WebsocketContext):
+    """Returns `WebsocketContext.accepted`."""
+    return ctx.accepted
+
+
+def get_closed(ctx: WebsocketContext):
+    """Returns `WebsocketContext.closed`."""
+    return ctx.closed
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+
+from moona.context import Message
+from moona.http.context import Header
+from moona.websocket.context import WebsocketContext
+from moona.websocket.handlers import WebsocketFunc, WebsocketHandler, handler
+
+WebsocketData = str | bytes
+
+NORMAL_CLOSURE = 1000
+POLICY_VIOLATION = 1008
+NO_STATUS = 1005
+INTERNAL_ERROR = 1011
+
+
+class ConnectionClosed(ConnectionError):
+    """Raised on sending to the connection that is not accepted or already closed."""
+
+
+def message(data: WebsocketData) -> Message:
+    """Returns "websocket.send" message with `data`.
+
+    Args:
+        data (WebsocketData): text or binary data to send.
+
+    Returns:
+        Message: ASGI message.
+    """
+    match data:
+        case str():
+            return {"type": "websocket.send", "text": data}
+        case bytes():
+            return {"type": "websocket.send", "bytes": data}
+    raise TypeError(f"Websocket data must be str or bytes: {type(data).__name__}")
+
+
+async def _write(ctx: WebsocketContext) -> None:
+    """Send messages from the outbox to the client until `None` or close is taken.
+
+    When client is gone messages are still taken from the outbox (and dropped), so
+    producers waiting for a place in it are not suspended forever.
+    """
+    while True:
+        match await ctx.outbox.get():
+            case None:
+                return
+            case {"type": "websocket.close", "code": code} as msg:
+                match ctx.closed:
+                    case False:
+                        ctx.closed = True
+                        ctx.close_code = code
+                        try:
+                            await ctx.send(msg)
+                        except OSError:
+                            pass
+                return
+            case msg if not ctx.closed:
+                try:
+                    await ctx.send(msg)
+                except OSError:
+                    ctx.closed = True
+
+
+def _ensure_open(ctx: WebsocketContext) -> None:
+    match ctx.closed, ctx.writer:
+        case True, _:
+            raise ConnectionClosed("Websocket connection is closed")
+        case False, None:
+            raise ConnectionClosed("Websocket connection is not accepted")
+        case False, asyncio.Task() as writer if writer.done():
+            raise ConnectionClosed("Websocket connection is closed")
+
+
+async def send(ctx: WebsocketContext, data: WebsocketData) -> None:
+    """Put `data` to the outbox of the connection.
+
+    When outbox is full waits until writer sends enough messages to the client.
+
+    Args:
+        ctx (WebsocketContext): connection to send to.
+        data (WebsocketData): text or binary data to send.
+
+    Raises:
+        ConnectionClosed: connection is not accepted or is already closed.
+    """
+    _ensure_open(ctx)
+    await ctx.outbox.put(message(data))
+
+
+def send_nowait(ctx: WebsocketContext, msg: Message) -> bool:
+    """Put prebuilt `msg` to the outbox of the connection if there is a place.
+
+    Args:
+        ctx (WebsocketContext): connection to send to.
+        msg (Message): "websocket.send" message (see `message`).
+
+    Returns:
+        bool: message was put to the outbox.
+    """
+    try:
+        ctx.outbox.put_nowait(msg)
+        return True
+    except asyncio.QueueFull:
+        return False
+
+
+async def iter_messages(ctx: WebsocketContext) -> AsyncIterator[WebsocketData]:
+    """Iterate over messages as they arrive from the client.
+
+    Messages are received only when the next one is requested. When client
+    disconnects `closed` and `close_code` are set and iteration stops.
+
+    Args:
+        ctx (WebsocketContext): to receive messages for.
+
+    Yields:
+        WebsocketData: text or binary message.
+    """
+    while not ctx.closed:
+        match await ctx.receive():
+            case {"type": "websocket.receive", "text": str() as text}:
+                yield text
+            case {"type": "websocket.receive", "bytes": bytes() as data}:
+                yield data
+            case {"type": "websocket.disconnect"} as msg:
+                ctx.closed = True
+                ctx.close_code = msg.get("code", NO_STATUS)
+                return
+
+
+async def close_connection(
+    ctx: WebsocketContext, code: int = NORMAL_CLOSURE, reason: str = ""
+) -> None:
+    """Send messages left in the outbox and close the connection.
+
+    If connection was not accepted yet it is rejected. When client has already
+    disconnected messages left in the outbox are dropped.
+
+    Args:
+        ctx (WebsocketContext): connection to close.
+        code (int): close code.
+        reason (str): close reason.
+    """
+    match ctx.writer:
+        case asyncio.Task() as writer if ctx.closed or writer.done():
+            writer.cancel()
+        case asyncio.Task() as writer:
+            await ctx.outbox.put(None)
+            await writer
+    ctx.writer = None
+    match ctx.closed:
+        case False:
+            ctx.closed = True
+            ctx.close_code = code
+            await ctx.send({"type": "websocket.close", "code": code, "reason": reason})
+
+
+# handlers
+
+
+def accept(
+    subprotocol: str | None = None, headers: Iterable[Header] = ()
+) -> WebsocketHandler:
+    """Accept the connection and start sending messages from the outbox.
+
+    Args:
+        subprotocol (str | None): subprotocol chosen by the server.
+        headers (Iterable[Header]): encoded headers to send with the accept.
+    """
+    msg = {"type": "websocket.accept", "subprotocol": subprotocol}
+    headers = list(headers)
+    if headers:
+        msg["headers"] = headers
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        match ctx.accepted:
+            case False:
+                await ctx.send(msg)
+                ctx.accepted = True
+                ctx.writer = asyncio.create_task(_write(ctx))
+        return await nxt(ctx)
+
+    return _handler
+
+
+def close(code: int = NORMAL_CLOSURE, reason: str = "") -> WebsocketHandler:
+    """Close the connection (reject when it was not accepted) and end the pipeline.
+
+    Messages left in the outbox are sent before closing.
+
+    Args:
+        code (int): close code.
+        reason (str): close reason.
+    """
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        await close_connection(ctx, code, reason)
+        return ctx
+
+    return _handler
+
+
+def send_stream(messages: AsyncIterable[WebsocketData]) -> WebsocketHandler:
+    """Send messages produced by async iterable to the client.
+
+    Next message is produced only after the previous one was put to the outbox, so
+    producer is slowed down to the pace of the client when outbox is full. Sending
+    stops when connection is closed.
+
+    Raises:
+        ConnectionClosed: connection is not accepted.
+
+    Args:
+        messages (AsyncIterable[WebsocketData]): text or binary messages.
+    """
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        match ctx.accepted:
+            case False:
+                raise ConnectionClosed("Websocket connection is not accepted")
+        async for data in messages:
+            match ctx.closed:
+                case True:
+                    break
+            try:
+                await send(ctx, data)
+            except ConnectionClosed:
+                break
+        return await nxt(ctx)
+
+    return _handler
+
+
+def on_message(
+    func: Callable[[WebsocketContext, WebsocketData], Awaitable[None]]
+) -> WebsocketHandler:
+    """Run `func` for each message received from the client until it disconnects.
+
+    Args:
+        func (Callable[[WebsocketContext, WebsocketData], Awaitable[None]]): to run
+        for each message.
+    """
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        async for data in iter_messages(ctx):
+            await func(ctx, data)
+        return await nxt(ctx)
+
+    return _handler
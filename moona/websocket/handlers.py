@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from fundom import future, this_future
+
+from moona.websocket.context import WebsocketContext
+
+WebsocketFunc = Callable[[WebsocketContext], future[WebsocketContext | None]]
+_WebsocketHandler = Callable[
+    [WebsocketFunc, WebsocketContext], future[WebsocketContext | None]
+]
+
+
+def compose(h1: _WebsocketHandler, h2: _WebsocketHandler) -> WebsocketHandler:
+    """Compose 2 `WebsocketHandler`s into one.
+
+    Args:
+        h1 (_WebsocketHandler): to run first.
+        h2 (_WebsocketHandler): to run second.
+
+    Returns:
+        WebsocketHandler: resulting handler.
+    """
+
+    def handler(
+        final: WebsocketFunc, ctx: WebsocketContext
+    ) -> future[WebsocketContext | None]:
+        match ctx.closed:
+            case True:
+                return final(ctx)
+            case False:
+                return h1(lambda _ctx: h2(final, _ctx), ctx)
+
+    return WebsocketHandler(handler, chain=(*unchain(h1), *unchain(h2)))
+
+
+@dataclass(frozen=True, slots=True)
+class WebsocketHandler:
+    """Abstraction over function that hander `WebsocketContext`.
+
+    Besides the function itself `WebsocketHandler` remembers handlers it was composed
+    of (`_chain`).
+    """
+
+    _handler: Callable[[WebsocketContext], future[WebsocketContext | None]]
+    _chain: tuple[WebsocketHandler, ...]
+
+    def __call__(  # noqa
+        self, nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> future[WebsocketContext | None]:
+        match self._handler(nxt, ctx):
+            case future() as result:
+                return result
+            case awaitable:
+                return future(awaitable)
+
+    def __init__(
+        self,
+        handler: _WebsocketHandler,
+        *,
+        chain: tuple[WebsocketHandler, ...] = (),
+    ) -> None:
+        object.__setattr__(self, "_handler", handler)
+        object.__setattr__(self, "_chain", chain)
+
+    def compile(self, final: WebsocketFunc | None = None) -> WebsocketFunc:
+        """Link handler with all the handlers it is composed of ahead of time.
+
+        Each handler from the composition chain is bound to the next one only once
+        (see `HTTPHandler.compile`). As with `compose` closed `WebsocketContext` is
+        passed directly to `final`.
+
+        Args:
+            final (WebsocketFunc): to run after all handlers. Defaults to `end`.
+
+        Returns:
+            WebsocketFunc: pre-linked pipeline.
+        """
+        func = _link_chain(self, end if final is None else final)
+
+        def compiled(ctx: WebsocketContext) -> future[WebsocketContext | None]:
+            match func(ctx):
+                case future() as result:
+                    return result
+                case awaitable:
+                    return future(awaitable)
+
+        return compiled
+
+    def compose(self, h: _WebsocketHandler) -> WebsocketHandler:
+        """Compose 2 `WebsocketHandler`s into one.
+
+        Args:
+            h2 (_WebsocketHandler): to run next.
+
+        Returns:
+            WebsocketHandler: resulting handler.
+        """
+        return compose(self, h)
+
+    def __rshift__(self, h: _WebsocketHandler) -> WebsocketHandler:
+        return compose(self, h)
+
+
+def _link(
+    h: _WebsocketHandler, nxt: WebsocketFunc, final: WebsocketFunc
+) -> WebsocketFunc:
+    def func(ctx: WebsocketContext) -> future[WebsocketContext | None]:
+        match ctx.closed:
+            case True:
+                return final(ctx)
+            case False:
+                return h(nxt, ctx)
+
+    return func
+
+
+def _link_chain(h: _WebsocketHandler, final: WebsocketFunc) -> WebsocketFunc:
+    func = final
+    for _h in reversed(unchain(h)):
+        func = _link(_h._handler, func, final)
+    return func
+
+
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+
+
+def handler(func: _WebsocketHandler) -> WebsocketHandler:
+    """Decorator that converts function to WebsocketHandler callable."""
+    return WebsocketHandler(func)
+
+
+def unchain(h: _WebsocketHandler) -> tuple[WebsocketHandler, ...]:
+    """Split handler to the sequence of handlers it was composed of.
+
+    Args:
+        h (_WebsocketHandler): to split.
+
+    Returns:
+        tuple[WebsocketHandler, ...]: handlers in order of execution.
+    """
+    match h:
+        case WebsocketHandler(_chain=()):
+            return (h,)
+        case WebsocketHandler(_chain=chain):
+            return chain
+        case _:
+            return (WebsocketHandler(h),)
+
+
+def handle_func(func: WebsocketFunc) -> WebsocketHandler:
+    """Converts `WebsocketFunc` to `WebsocketHandler`.
+
+    Args:
+        func (WebsocketFunc): to convert to `WebsocketHandler`.
+
+    Returns:
+        WebsocketHandler: result.
+    """
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        match await func(ctx):
+            case None:
+                return None
+            case WebsocketContext() as _ctx:
+                match _ctx.closed:
+                    case True:
+                        return _ctx
+                    case False:
+                        return await nxt(_ctx)
+
+    return _handler
+
+
+def handle_func_sync(
+    func: Callable[[WebsocketContext], WebsocketContext | None]
+) -> WebsocketHandler:
+    """Converts sync `WebsocketFunc` to `WebsocketHandler`.
+
+    Args:
+        func (Callable[[WebsocketContext], WebsocketContext | None]): to convert to
+        `WebsocketHandler`.
+
+    Returns:
+        WebsocketHandler: result.
+    """
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        match func(ctx):
+            case None:
+                return None
+            case WebsocketContext() as _ctx:
+                match _ctx.closed:
+                    case True:
+                        return _ctx
+                    case False:
+                        return await nxt(_ctx)
+
+    return _handler
+
+
+def choose(handlers: list[WebsocketHandler]) -> WebsocketHandler:
+    """Iterate though handlers till one would return some `WebsocketContext`.
+
+    Handlers are linked with `nxt` only when it changes (see `HTTPHandler.compile`),
+    so in compiled pipeline branches are bound once and then just tried in order.
+
+    Args:
+        handlers (list[WebsocketHandler]): to iterate through.
+
+    Returns:
+        WebsocketHandler: result.
+    """
+    bound: list = [None, ()]
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        match handlers, bound:
+            case [], _:
+                return await nxt(ctx)
+            case _, [_nxt, funcs] if _nxt is nxt:
+                pass
+            case _:
+                funcs = tuple(_link_chain(h, nxt) for h in handlers)
+                bound[:] = [nxt, funcs]
+
+        for func in funcs:
+            match await func(ctx):
+                case None:
+                    continue
+                case some:
+                    return some
+
+        return None
+
+    return _handler
+
+
+def handler1(
+    func: Callable[
+        [A, WebsocketFunc, WebsocketContext], future[WebsocketContext | None]
+    ]
+) -> Callable[[A], WebsocketHandler]:
+    """Decorator for WebsocketHandlers with 1 additional argument.
+
+    Makes it "curried".
+    """
+
+    def wrapper(a: A) -> WebsocketHandler:
+        return WebsocketHandler(lambda nxt, ctx: func(a, nxt, ctx))
+
+    return wrapper
+
+
+def handler2(
+    func: Callable[
+        [A, B, WebsocketFunc, WebsocketContext], future[WebsocketContext | None]
+    ]
+) -> Callable[[A, B], WebsocketHandler]:
+    """Decorator for WebsocketHandlers with 2 additional arguments.
+
+    Makes it "curried".
+    """
+
+    def wrapper(a: A, b: B) -> WebsocketHandler:
+        return WebsocketHandler(lambda nxt, ctx: func(a, b, nxt, ctx))
+
+    return wrapper
+
+
+def handler3(
+    func: Callable[
+        [A, B, C, WebsocketFunc, WebsocketContext], future[WebsocketContext | None]
+    ]
+) -> Callable[[A, B, C], WebsocketHandler]:
+    """Decorator for WebsocketHandlers with 3 additional arguments.
+
+    Makes it "curried".
+    """
+
+    def wrapper(a: A, b: B, c: C) -> WebsocketHandler:
+        return WebsocketHandler(lambda nxt, ctx: func(a, b, c, nxt, ctx))
+
+    return wrapper
+
+
+def skip(_: WebsocketContext) -> future[None]:
+    """`WebsocketFunc` that skips pipeline by returning `None` instead of context.
+
+    Args:
+        _ (WebsocketContext): ctx we don't care of.
+
+    Returns:
+        future[None]: result.
+    """
+    return this_future(None)
+
+
+def end(ctx: WebsocketContext) -> future[WebsocketContext]:
+    """`WebsocketFunc` that finishes the pipeline of connection handling.
+
+    Args:
+        ctx (WebsocketContext): to end.
+
+    Returns:
+        future[WebsocketContext]: ended ctx.
+    """
+    return this_future(ctx)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from moona.context import Message
+from moona.http.response_body import serialize
+from moona.websocket.context import WebsocketContext
+from moona.websocket.events import POLICY_VIOLATION, message, send_nowait
+from moona.websocket.handlers import WebsocketFunc, WebsocketHandler, handler
+
+Policy = Literal["drop_oldest", "disconnect"]
+
+
+def encode(data: Any) -> Message:
+    """Returns "websocket.send" message for published `data`.
+
+    `str` is sent as text, `bytes` as binary, anything else is serialized to JSON
+    (see `http.serialize`) and sent as text.
+
+    Args:
+        data (Any): published data.
+
+    Returns:
+        Message: ASGI message.
+    """
+    match data:
+        case str() | bytes():
+            return message(data)
+        case _:
+            return message(serialize(data).decode("UTF-8"))
+
+
+@dataclass(slots=True, init=False)
+class Hub:
+    """Broadcasts messages to websocket connections subscribed to topics.
+
+    Published message is encoded once and the same ASGI message is put to the outbox
+    of every subscriber without waiting, so publishing never blocks on slow clients.
+    When outbox of the subscriber is full `policy` is applied: with "drop_oldest"
+    the oldest message in the outbox is dropped to make place for the new one, with
+    "disconnect" messages in the outbox are discarded and connection is closed with
+    1008 code. `dropped` and `disconnected` count applied policies.
+
+    Hub is usually created once and passed to `asgi.create` in the `state`, so HTTP
+    handlers can publish with `ctx.state["hub"].publish(topic, data)`.
+    """
+
+    policy: Policy
+    dropped: int
+    disconnected: int
+    _topics: dict[str, dict[int, WebsocketContext]]
+    _subscriptions: dict[int, set[str]]
+
+    def __init__(self, policy: Policy = "drop_oldest") -> None:
+        match policy:
+            case "drop_oldest" | "disconnect":
+                pass
+            case _:
+                raise ValueError(f"Unknown slow consumer policy: {policy!r}")
+        self.policy = policy
+        self.dropped = 0
+        self.disconnected = 0
+        self._topics = {}
+        self._subscriptions = {}
+
+    def subscribe(self, ctx: WebsocketContext, topic: str) -> None:
+        """Subscribes connection to the `topic`."""
+        self._topics.setdefault(topic, {})[id(ctx)] = ctx
+        self._subscriptions.setdefault(id(ctx), set()).add(topic)
+
+    def unsubscribe(self, ctx: WebsocketContext, topic: str | None = None) -> None:
+        """Unsubscribes connection from the `topic` or from all topics."""
+        topics = self._subscriptions.get(id(ctx), set())
+        for _topic in list(topics) if topic is None else [topic]:
+            topics.discard(_topic)
+            subscribers = self._topics.get(_topic, {})
+            subscribers.pop(id(ctx), None)
+            if not subscribers:
+                self._topics.pop(_topic, None)
+        if not topics:
+            self._subscriptions.pop(id(ctx), None)
+
+    def subscribers(self, topic: str) -> int:
+        """Returns number of connections subscribed to the `topic`."""
+        return len(self._topics.get(topic, {}))
+
+    def publish(self, topic: str, data: Any) -> int:
+        """Sends `data` to all the connections subscribed to the `topic`.
+
+        Args:
+            topic (str): to publish to.
+            data (Any): text, binary or JSON serializable data.
+
+        Returns:
+            int: number of connections message was put to the outbox of.
+        """
+        subscribers = self._topics.get(topic, None)
+        if not subscribers:
+            return 0
+
+        msg = encode(data)
+        delivered = 0
+        gone = []
+        for ctx in subscribers.values():
+            match ctx.closed:
+                case True:
+                    gone.append(ctx)
+                    continue
+            match send_nowait(ctx, msg), self.policy:
+                case True, _:
+                    delivered += 1
+                case False, "drop_oldest":
+                    self.dropped += 1
+                    delivered += _drop_oldest(ctx.outbox, msg)
+                case False, "disconnect":
+                    self.disconnected += 1
+                    _disconnect(ctx)
+                    gone.append(ctx)
+        for ctx in gone:
+            self.unsubscribe(ctx)
+        return delivered
+
+
+def _drop_oldest(outbox: asyncio.Queue, msg: Message) -> bool:
+    match outbox.get_nowait():
+        case {"type": "websocket.send"}:
+            outbox.put_nowait(msg)
+            return True
+        case last:
+            # connection is being closed, put the end of the stream back
+            outbox.put_nowait(last)
+            return False
+
+
+def _disconnect(ctx: WebsocketContext) -> None:
+    while not ctx.outbox.empty():
+        ctx.outbox.get_nowait()
+    ctx.outbox.put_nowait(
+        {"type": "websocket.close", "code": POLICY_VIOLATION, "reason": ""}
+    )
+
+
+def subscribe(hub: Hub, *topics: str) -> WebsocketHandler:
+    """Subscribe connection to `topics` of the `hub` for the rest of the pipeline.
+
+    Connection is unsubscribed when the rest of the pipeline finishes, so it must be
+    followed by handlers that keep the connection open (like `on_message`).
+
+    Args:
+        hub (Hub): to subscribe to.
+        *topics (str): topics to subscribe to.
+    """
+
+    @handler
+    async def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> WebsocketContext | None:
+        for topic in topics:
+            hub.subscribe(ctx, topic)
+        try:
+            return await nxt(ctx)
+        finally:
+            hub.unsubscribe(ctx)
+
+    return _handler
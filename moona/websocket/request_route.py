@@ -0,0 +1,41 @@
+from fundom import future
+
+from moona.websocket.context import WebsocketContext
+from moona.websocket.handlers import WebsocketFunc, WebsocketHandler, handler, skip
+
+
+def route(path: str) -> WebsocketHandler:
+    """Handler that processes ctx only on right path.
+
+    Connection path must be exactly the same as path passed as an argument to the
+    handler HOF. Both paths are striped from leading and trailing "/".
+    """
+    path = path.strip("/")
+
+    @handler
+    def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> future[WebsocketContext | None]:
+        match ctx.request_path == path:
+            case True:
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
+
+    return _handler
+
+
+def subprotocol(name: str) -> WebsocketHandler:
+    """Handler that processes ctx only when client offers `name` subprotocol."""
+
+    @handler
+    def _handler(
+        nxt: WebsocketFunc, ctx: WebsocketContext
+    ) -> future[WebsocketContext | None]:
+        match name in ctx.subprotocols:
+            case True:
+                return nxt(ctx)
+            case False:
+                return skip(ctx)
+
+    return _handler
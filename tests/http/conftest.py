@@ -1,6 +1,8 @@
+from typing import Callable
+
 import pytest
 
-from moona.context import Message
+from moona.context import Message, Receive
 from moona.http import HTTPContext
 from moona.lifespan import LifespanContext
 
@@ -57,9 +59,14 @@ def receive():
 
 
 @pytest.fixture
-def send():
-    async def send(_: Message) -> None:
-        return None
+def sent() -> list[Message]:
+    return []
+
+
+@pytest.fixture
+def send(sent):
+    async def send(msg: Message) -> None:
+        sent.append(msg)
 
     return send
 
@@ -69,6 +76,19 @@ def ctx(scope, receive, send) -> HTTPContext:
     return HTTPContext(scope, receive, send)
 
 
+@pytest.fixture
+def make_ctx(scope, receive, send) -> Callable[..., HTTPContext]:
+    """Returns factory of contexts for `scope` updated with passed fields.
+
+    Contexts record sent messages to `sent` fixture.
+    """
+
+    def make_ctx(receive: Receive = receive, **fields) -> HTTPContext:
+        return HTTPContext({**scope, **fields}, receive, send)
+
+    return make_ctx
+
+
 @pytest.fixture
 def lifespan_ctx(receive, send) -> LifespanContext:
     scope = {
@@ -0,0 +1,9 @@
+import asyncio
+from typing import Any, AsyncIterator
+
+
+async def chunks(*values: Any, delay: float = 0) -> AsyncIterator[Any]:
+    """Yields `values` one by one like a streamed body waiting `delay` before each."""
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
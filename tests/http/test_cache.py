@@ -0,0 +1,146 @@
+import pytest
+
+from moona.http.cache import ResponseCache, cache
+from moona.http.compression import compress
+from moona.http.context import HTTPContext
+from moona.http.handlers import HTTPHandler, end, handle_func_sync
+from moona.http.request_method import head_as_get
+from moona.http.response_body import raw, stream
+from moona.http.response_headers import header
+from moona.http.response_status import not_found
+from tests.http.helpers import chunks
+
+
+def counted(h: HTTPHandler) -> tuple[HTTPHandler, list[int]]:
+    calls = []
+
+    def _count(ctx: HTTPContext) -> HTTPContext:
+        calls.append(1)
+        return ctx
+
+    return handle_func_sync(_count) >> h, calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, runs",
+    [
+        (raw(b"cached"), 1),
+        (header("x-custom", "1") >> raw(b"cached"), 1),
+        (header("set-cookie", "id=1") >> raw(b"cached"), 3),
+        (header("cache-control", "no-store") >> raw(b"cached"), 3),
+        (not_found(b"missing"), 3),
+    ],
+)
+async def test_cache(make_ctx, sent, h, runs):
+    store = ResponseCache()
+    h, calls = counted(h)
+    app = cache(store=store) >> h
+    responses = []
+    for _ in range(3):
+        sent.clear()
+        ctx = make_ctx()
+        _ctx = await app(end, ctx)
+        assert _ctx is ctx
+        assert ctx.closed
+        start, *messages = sent
+        responses.append([{**start, "headers": list(start["headers"])}, *messages])
+
+    assert len(calls) == runs
+    assert responses[0] == responses[1] == responses[2]
+    assert (store.hits, store.misses) == (3 - runs, runs)
+
+
+@pytest.mark.asyncio
+async def test_cache_stream(make_ctx):
+    h, calls = counted(stream(chunks(b"a")))
+    app = cache() >> h
+    ctx = make_ctx()
+    await app(end, ctx)
+    assert len(calls) == 1
+    assert ctx.closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "first, second, hit",
+    [
+        (("GET", b"", ()), ("GET", b"", ()), True),
+        (("GET", b"", ()), ("HEAD", b"", ()), False),
+        (("GET", b"a=1", ()), ("GET", b"a=2", ()), False),
+        (("POST", b"", ()), ("POST", b"", ()), False),
+        (("GET", b"", [(b"accept", b"a")]), ("GET", b"", [(b"accept", b"a")]), True),
+        (("GET", b"", [(b"accept", b"a")]), ("GET", b"", [(b"accept", b"b")]), False),
+        (("GET", b"", [(b"x-other", b"a")]), ("GET", b"", [(b"x-other", b"b")]), True),
+    ],
+)
+async def test_cache_key(make_ctx, first, second, hit):
+    h, calls = counted(raw(b"cached"))
+    app = cache(vary=["Accept"]) >> h
+    for method, query, headers in (first, second):
+        await app(end, make_ctx(method=method, query_string=query, headers=headers))
+    assert len(calls) == (1 if hit else 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "vary, runs, encodings",
+    [
+        ((), 2, [b"gzip", None]),
+        (["Accept-Encoding"], 2, [b"gzip", None]),
+        (["Accept-Encoding"], 1, [b"gzip", b"gzip"]),
+    ],
+)
+async def test_cache_response_vary(make_ctx, sent, vary, runs, encodings):
+    h, calls = counted(compress(min_size=1) >> raw(b"cached" * 10))
+    app = cache(vary=vary) >> h
+    for encoding in encodings:
+        headers = [] if encoding is None else [(b"accept-encoding", encoding)]
+        sent.clear()
+        await app(end, make_ctx(headers=headers))
+        assert dict(sent[0]["headers"]).get(b"content-encoding") == encoding
+    assert len(calls) == runs
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl(make_ctx):
+    store = ResponseCache(ttl=0)
+    h, calls = counted(raw(b"cached"))
+    app = cache(store=store) >> h
+    for _ in range(2):
+        await app(end, make_ctx())
+    assert len(calls) == 2
+    assert store.hits == 0
+
+
+def test_response_cache_bounds():
+    store = ResponseCache(max_entries=2, max_size=100)
+    store.put("a", 200, [], b"a" * 10)
+    store.put("b", 200, [], b"b" * 10)
+    store.put("c", 200, [], b"c" * 10)
+    assert len(store) == 2
+    assert store.get("a") is None
+    store.put("d", 200, [], b"d" * 95)
+    assert store.get("b") is None
+    assert store.get("c") is None
+    assert store.get("d").body == b"d" * 95
+    assert store.evictions == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_head(make_ctx, sent):
+    store = ResponseCache()
+    h, calls = counted(raw(b"cached"))
+    app = head_as_get >> cache(store=store) >> h
+
+    await app(end, make_ctx(method="HEAD"))
+    assert len(store) == 0
+
+    await app(end, make_ctx())
+    sent.clear()
+    await app(end, make_ctx(method="HEAD"))
+    start, body = sent
+
+    assert len(calls) == 2
+    assert (b"content-length", b"6") in start["headers"]
+    assert body["body"] == b""
@@ -0,0 +1,102 @@
+import gzip
+import zlib
+
+import pytest
+
+from moona.http.compression import compress
+from moona.http.handlers import end
+from moona.http.request_method import head_as_get
+from moona.http.response_body import raw, stream
+from moona.http.response_headers import header
+from tests.http.helpers import chunks
+
+TEXT = b"moona " * 200
+
+
+def decode(encoding: bytes | None, body: bytes) -> bytes:
+    match encoding:
+        case b"gzip":
+            return gzip.decompress(body)
+        case b"deflate":
+            return zlib.decompress(body)
+        case _:
+            return body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "accept_encoding, h, encoding",
+    [
+        (b"gzip", raw(TEXT), b"gzip"),
+        (b"deflate", raw(TEXT), b"deflate"),
+        (b"deflate, gzip;q=0.5", raw(TEXT), b"deflate"),
+        (b"gzip;q=0, deflate;q=0", raw(TEXT), None),
+        (None, raw(TEXT), None),
+        (b"gzip", raw(b"small"), None),
+        (b"gzip", header("content-type", "image/png") >> raw(TEXT), None),
+        (b"gzip", header("content-type", "image/svg+xml") >> raw(TEXT), b"gzip"),
+        (b"gzip", header("content-encoding", "br") >> raw(TEXT), b"br"),
+        (b"gzip", stream(chunks(TEXT, b"", TEXT)), b"gzip"),
+        (b"gzip", stream(chunks(b"a", b"b")), b"gzip"),
+    ],
+)
+async def test_compress(make_ctx, sent, accept_encoding, h, encoding):
+    headers = [] if accept_encoding is None else [(b"accept-encoding", accept_encoding)]
+    ctx = make_ctx(headers=headers)
+    await (compress(min_size=100) >> h)(end, ctx)
+    start, *messages = sent
+    headers = dict(start["headers"])
+    body = b"".join(msg.get("body", b"") for msg in messages)
+
+    assert headers.get(b"content-encoding") == encoding
+    assert not messages[-1].get("more_body", False)
+    match headers:
+        case {b"content-length": length}:
+            assert int(length) == len(body)
+    match encoding:
+        case b"gzip" | b"deflate":
+            assert headers[b"vary"] == b"accept-encoding"
+            assert len(messages) > 1 or len(body) < len(TEXT)
+            assert decode(encoding, body) in (TEXT, TEXT * 2, b"ab")
+        case _:
+            assert decode(encoding, body) in (TEXT, b"small")
+
+
+@pytest.mark.asyncio
+async def test_compress_streamed_chunks_are_flushed(make_ctx, sent):
+    ctx = make_ctx(headers=[(b"accept-encoding", b"gzip")])
+    await (compress() >> stream(chunks(b"first", b"second")))(end, ctx)
+    _, first, second, last = sent
+    decompressor = zlib.decompressobj(31)
+
+    assert decompressor.decompress(first["body"]) == b"first"
+    assert decompressor.decompress(second["body"]) == b"second"
+    assert decompressor.decompress(last["body"]) == b""
+    assert decompressor.eof
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, encoding",
+    [
+        (raw(TEXT), b"gzip"),
+        (raw(b"small"), None),
+        (header("content-type", "image/png") >> raw(TEXT), None),
+        (stream(chunks(TEXT)), b"gzip"),
+    ],
+)
+async def test_compress_head(make_ctx, sent, h, encoding):
+    headers = [(b"accept-encoding", b"gzip")]
+    await (head_as_get >> compress(min_size=100) >> h)(end, make_ctx(headers=headers))
+    get_headers = dict(sent[0]["headers"])
+    sent.clear()
+    ctx = make_ctx(method="HEAD", headers=headers)
+    await (head_as_get >> compress(min_size=100) >> h)(end, ctx)
+    start, *messages = sent
+    head_headers = dict(start["headers"])
+
+    assert head_headers.get(b"content-encoding") == encoding
+    assert head_headers.get(b"vary") == get_headers.get(b"vary")
+    if encoding is not None:
+        assert b"content-length" not in head_headers
+    assert b"".join(msg.get("body", b"") for msg in messages) == b""
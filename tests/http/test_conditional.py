@@ -0,0 +1,184 @@
+import pytest
+
+from moona.http.compression import compress
+from moona.http.conditional import etag, if_none_match, not_modified, weak_etag
+from moona.http.context import Headers, HTTPContext
+from moona.http.handlers import end
+from moona.http.request_method import head_as_get
+from moona.http.response_body import raw, stream, text
+from moona.http.response_headers import header
+from moona.http.response_status import not_found
+from tests.http.helpers import chunks
+
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+@pytest.mark.parametrize(
+    "headers, tag, last_modified, result",
+    [
+        ([], b'"a"', None, False),
+        ([(b"if-none-match", b'"a"')], b'"a"', None, True),
+        ([(b"if-none-match", b'"b", W/"a"')], b'"a"', None, True),
+        ([(b"if-none-match", b'"b"')], b'"a"', None, False),
+        ([(b"if-none-match", b"*")], b'"a"', None, True),
+        ([(b"if-none-match", b'"a"')], None, None, False),
+        ([(b"if-none-match", b"*")], None, None, True),
+        ([(b"if-modified-since", LAST_MODIFIED.encode())], None, LAST_MODIFIED, True),
+        (
+            [(b"if-modified-since", b"Wed, 21 Oct 2015 07:27:59 GMT")],
+            None,
+            LAST_MODIFIED,
+            False,
+        ),
+        ([(b"if-modified-since", b"yesterday")], None, LAST_MODIFIED, False),
+        (
+            [
+                (b"if-none-match", b'"b"'),
+                (b"if-modified-since", LAST_MODIFIED.encode()),
+            ],
+            b'"a"',
+            LAST_MODIFIED,
+            False,
+        ),
+    ],
+)
+def test_not_modified(headers, tag, last_modified, result):
+    last_modified = last_modified.encode() if last_modified else None
+    assert not_modified(Headers(headers), tag, last_modified) == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h",
+    [
+        raw(b"moona"),
+        text("moona"),
+        header("content-type", "text/plain") >> raw(b"moona"),
+    ],
+)
+async def test_etag(make_ctx, sent, h):
+    await (etag >> h)(end, make_ctx(headers=[]))
+    start, body = sent
+    tag = dict(start["headers"])[b"etag"]
+
+    assert start["status"] == 200
+    assert tag == weak_etag(b"moona")
+    assert body["body"] == b"moona"
+
+    sent.clear()
+    await (etag >> h)(end, make_ctx(headers=[(b"if-none-match", tag)]))
+    start, body = sent
+    headers = dict(start["headers"])
+
+    assert start["status"] == 304
+    assert headers[b"etag"] == tag
+    assert b"content-length" not in headers
+    assert b"content-type" not in headers
+    assert body["body"] == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers, method, h, status, body",
+    [
+        ([(b"if-none-match", b'"x"')], "GET", raw(b"moona"), 200, b"moona"),
+        ([(b"if-none-match", b"*")], "POST", raw(b"moona"), 200, b"moona"),
+        ([(b"if-none-match", b"*")], "GET", not_found("missing"), 404, None),
+        ([(b"if-none-match", b"*")], "HEAD", raw(b"moona"), 304, b""),
+        (
+            [(b"if-none-match", b'"v1"')],
+            "GET",
+            header("etag", '"v1"') >> stream(chunks(b"a", b"b")),
+            304,
+            b"",
+        ),
+        (
+            [(b"if-none-match", b'"v2"')],
+            "GET",
+            header("etag", '"v1"') >> stream(chunks(b"a", b"b")),
+            200,
+            b"ab",
+        ),
+        (
+            [(b"if-modified-since", LAST_MODIFIED.encode())],
+            "GET",
+            header("last-modified", LAST_MODIFIED) >> stream(chunks(b"a", b"b")),
+            304,
+            b"",
+        ),
+    ],
+)
+async def test_etag_validators(make_ctx, sent, headers, method, h, status, body):
+    await (etag >> h)(end, make_ctx(method=method, headers=headers))
+    start, *messages = sent
+
+    assert start["status"] == status
+    assert not messages[-1].get("more_body", False)
+    if body is not None:
+        assert b"".join(msg["body"] for msg in messages) == body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers, version, status, called",
+    [
+        ([], "v1", 200, True),
+        ([(b"if-none-match", b'W/"v1"')], "v1", 304, False),
+        ([(b"if-none-match", b'"v1"')], "v1", 304, False),
+        ([(b"if-none-match", b'"v0"')], "v1", 200, True),
+        ([(b"if-none-match", b'"v1"')], None, 200, True),
+    ],
+)
+async def test_if_none_match(make_ctx, sent, headers, version, status, called):
+    calls = []
+
+    def get_version(ctx: HTTPContext) -> str | None:
+        return version
+
+    def expensive(ctx: HTTPContext) -> HTTPContext:
+        calls.append(ctx)
+        return ctx
+
+    ctx = make_ctx(headers=headers)
+    h = if_none_match(get_version) >> (lambda nxt, ctx: nxt(expensive(ctx)))
+    await (etag >> h >> raw(b"moona"))(end, ctx)
+    start, body = sent
+
+    assert start["status"] == status
+    assert bool(calls) == called
+    match version:
+        case str():
+            assert dict(start["headers"])[b"etag"] == f'W/"{version}"'.encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, tagged",
+    [
+        (etag >> raw(b"moona"), True),
+        (etag >> text("moona"), True),
+        (compress(min_size=1) >> etag >> raw(b"moona" * 100), True),
+        (etag >> stream(chunks(b"a", b"b")), False),
+    ],
+)
+async def test_etag_head(make_ctx, sent, h, tagged):
+    headers = [(b"accept-encoding", b"gzip")]
+    await (head_as_get >> h)(end, make_ctx(headers=headers))
+    get_tag = dict(sent[0]["headers"]).get(b"etag")
+    sent.clear()
+    ctx = make_ctx(method="HEAD", headers=headers)
+    await (head_as_get >> h)(end, ctx)
+    start, *messages = sent
+    tag = dict(start["headers"]).get(b"etag")
+
+    assert start["status"] == 200
+    assert b"".join(msg.get("body", b"") for msg in messages) == b""
+    match tagged:
+        case True:
+            assert tag == get_tag
+            sent.clear()
+            headers = [*headers, (b"if-none-match", tag)]
+            await (head_as_get >> h)(end, make_ctx(method="HEAD", headers=headers))
+            assert sent[0]["status"] == 304
+        case False:
+            assert tag is None
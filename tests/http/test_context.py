@@ -0,0 +1,83 @@
+import pytest
+
+from moona.http.context import (
+    ClientInfo,
+    Headers,
+    HTTPContext,
+    ServerInfo,
+    parse_query,
+)
+
+
+def test_lazy_fields(ctx: HTTPContext):
+    assert ctx._request_headers is None
+    assert ctx.request_headers[b"host"] == b"asgi-scope.now.sh"
+    assert ctx.request_headers is ctx.request_headers
+    assert ctx.request_path == "path"
+    assert ctx.client == ClientInfo("172.29.0.10", 34784)
+    assert ctx.server == ServerInfo("172.28.0.10", 8000)
+    assert ctx.scheme == "http"
+
+
+def test_lazy_fields_set(ctx: HTTPContext):
+    ctx.request_path = "other"
+    ctx.request_headers = {b"x": b"y"}
+    assert ctx.request_path == "other"
+    assert ctx.request_headers == {b"x": b"y"}
+
+
+def test_headers():
+    headers = Headers([(b"a", b"1"), (b"set-cookie", b"x=1"), (b"b", b"2")])
+    headers.add(b"set-cookie", b"y=2")
+    assert headers[b"set-cookie"] == b"y=2"
+    assert headers.get_all(b"set-cookie") == [b"x=1", b"y=2"]
+    assert headers[0] == (b"a", b"1")
+    assert b"b" in headers
+    assert (b"b", b"2") in headers
+    assert headers.get(b"missing") is None
+
+    headers[b"set-cookie"] = b"z=3"
+    assert headers == [(b"a", b"1"), (b"set-cookie", b"z=3"), (b"b", b"2")]
+    headers.update({b"a": b"10", b"c": b"3"})
+    assert headers == [
+        (b"a", b"10"),
+        (b"set-cookie", b"z=3"),
+        (b"b", b"2"),
+        (b"c", b"3"),
+    ]
+    assert headers.setdefault(b"c", b"4") == b"3"
+    assert headers.pop_all(b"b") == [b"2"]
+    del headers[b"c"]
+    assert headers == [(b"a", b"10"), (b"set-cookie", b"z=3")]
+    assert headers.items() is headers
+
+    with pytest.raises(KeyError):
+        headers[b"missing"]
+    with pytest.raises(KeyError):
+        del headers[b"missing"]
+
+
+@pytest.mark.parametrize(
+    "query_string, result",
+    [
+        (b"", {}),
+        (b"a=1", {"a": ["1"]}),
+        (b"a=1&a=2&b=3", {"a": ["1", "2"], "b": ["3"]}),
+        (b"a&b=", {"a": [""], "b": [""]}),
+        (b"q=hello+world%21", {"q": ["hello world!"]}),
+        (b"name=%D0%BC%D1%83%D0%BD", {"name": ["\u043c\u0443\u043d"]}),
+        (b"a%20b=c%26d", {"a b": ["c&d"]}),
+        (b"a=1&&b=2", {"a": ["1"], "b": ["2"]}),
+    ],
+)
+def test_parse_query(query_string, result):
+    assert parse_query(query_string) == result
+
+
+def test_state_shared_with_server(scope, receive, send):
+    state = {}
+    scope["state"] = state
+    ctx = HTTPContext(scope, receive, send)
+    ctx.state["hub"] = "hub"
+    assert ctx.state is state
+    assert state == {"hub": "hub"}
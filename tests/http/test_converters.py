@@ -0,0 +1,60 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+import pytest
+
+from moona.http.converters import converter, values_converter
+
+
+class Color(Enum):  # noqa
+    RED = "red"
+
+
+@pytest.mark.parametrize(
+    "annotation, value, result",
+    [
+        (str, "a", "a"),
+        (int, "42", 42),
+        (float, "1.5", 1.5),
+        (Decimal, "1.5", Decimal("1.5")),
+        (bool, "true", True),
+        (bool, "0", False),
+        (bytes, "a", b"a"),
+        (UUID, "00000000-0000-0000-0000-000000000001", UUID(int=1)),
+        (datetime, "2022-01-01T10:00:00", datetime(2022, 1, 1, 10)),
+        (date, "2022-01-01", date(2022, 1, 1)),
+        (time, "10:00", time(10)),
+        (Color, "red", Color.RED),
+        (int | None, "1", 1),
+        (Optional[int], "1", 1),
+    ],
+)
+def test_converter(annotation, value, result):
+    assert converter(annotation)(value) == result
+
+
+@pytest.mark.parametrize(
+    "annotation, value",
+    [(int, "one"), (bool, "maybe"), (UUID, "x"), (datetime, "yesterday")],
+)
+def test_converter_invalid(annotation, value):
+    with pytest.raises((TypeError, ValueError)):
+        converter(annotation)(value)
+
+
+@pytest.mark.parametrize(
+    "annotation, values, result",
+    [
+        (int, ["1", "2"], 2),
+        (list[int], ["1", "2"], [1, 2]),
+        (tuple[int, ...], ["1", "2"], (1, 2)),
+        (set[str], ["a", "a"], {"a"}),
+        (list, ["a", "b"], ["a", "b"]),
+        (list[int] | None, ["1"], [1]),
+    ],
+)
+def test_values_converter(annotation, values, result):
+    assert values_converter(annotation)(values) == result
@@ -0,0 +1,157 @@
+import pytest
+
+from moona.http.context import HTTPContext, get_request_method
+from moona.http.handlers import (
+    HTTPHandler,
+    choose,
+    end,
+    guard,
+    handle_func_sync,
+    skip,
+    unchain,
+)
+from moona.http.request_headers import host, matches_header
+from moona.http.request_method import GET, POST, method
+
+
+def append(value: str) -> HTTPHandler:
+    def _append(ctx: HTTPContext) -> HTTPContext:
+        ctx.response_body += value.encode()
+        return ctx
+
+    return handle_func_sync(_append)
+
+
+def close(ctx: HTTPContext) -> HTTPContext:
+    ctx.closed = True
+    return ctx
+
+
+def stop(_: HTTPContext) -> None:
+    return None
+
+
+@pytest.mark.parametrize(
+    "h, length",
+    [
+        (append("a"), 1),
+        (append("a") >> append("b"), 2),
+        (append("a") >> (append("b") >> append("c")), 3),
+        ((append("a") >> append("b")) >> (append("c") >> append("d")), 4),
+    ],
+)
+def test_unchain(h: HTTPHandler, length: int):
+    assert len(unchain(h)) == length
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, result",
+    [
+        (append("a"), b"a"),
+        (append("a") >> append("b") >> append("c"), b"abc"),
+        (append("a") >> (append("b") >> append("c")), b"abc"),
+        (append("a") >> handle_func_sync(close) >> append("b"), b"a"),
+        (append("a") >> handle_func_sync(stop) >> append("b"), None),
+    ],
+)
+async def test_compile(ctx: HTTPContext, h: HTTPHandler, result):
+    ctx.response_body = b""
+    _ctx = await h.compile()(ctx)
+    assert (_ctx.response_body if _ctx else None) == result
+
+    ctx.response_body = b""
+    ctx.closed = False
+    _ctx = await h(end, ctx)
+    assert (_ctx.response_body if _ctx else None) == result
+
+
+@pytest.mark.asyncio
+async def test_compile_final(ctx: HTTPContext):
+    ctx.response_body = b""
+    _ctx = await (append("a") >> append("b")).compile(skip)(ctx)
+    assert _ctx is None
+    assert ctx.response_body == b"ab"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, result",
+    [
+        (choose([]), b""),
+        (choose([append("a"), append("b")]), b"a"),
+        (choose([handle_func_sync(stop), append("b")]), b"b"),
+        (choose([handle_func_sync(stop) >> append("a"), append("b")]), b"b"),
+        (choose([handle_func_sync(stop)]), None),
+        (append("a") >> choose([append("b"), append("c")]) >> append("d"), b"abd"),
+        (choose([choose([handle_func_sync(stop)]), append("b")]), b"b"),
+    ],
+)
+async def test_choose(ctx: HTTPContext, h: HTTPHandler, result):
+    app = h.compile()
+    for _ in range(2):
+        ctx.response_body = b""
+        _ctx = await app(ctx)
+        assert (_ctx.response_body if _ctx else None) == result
+
+    ctx.response_body = b""
+    _ctx = await h(end, ctx)
+    assert (_ctx.response_body if _ctx else None) == result
+
+
+indexed = choose(
+    [
+        GET >> append("get"),
+        method("POST") >> append("post"),
+        matches_header("x-api-version", "2") >> append("v2"),
+        host("example.org") >> append("host"),
+        append("fallback"),
+        POST >> append("unreachable"),
+    ]
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_method, headers, result",
+    [
+        ("GET", {}, b"get"),
+        ("POST", {}, b"post"),
+        ("PUT", {b"x-api-version": b"2"}, b"v2"),
+        ("PUT", {b"x-api-version": b"1"}, b"fallback"),
+        ("PUT", {b"host": b"Example.org:8000"}, b"host"),
+        ("PUT", {b"host": b"example.com"}, b"fallback"),
+        ("DELETE", {}, b"fallback"),
+    ],
+)
+async def test_choose_indexed(ctx: HTTPContext, request_method, headers, result):
+    ctx.request_method = request_method
+    ctx.request_headers = headers
+    ctx.response_body = b""
+    _ctx = await indexed.compile()(ctx)
+    assert _ctx.response_body == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_method, tried",
+    [("GET", ["GET"]), ("POST", ["POST"]), ("PUT", [])],
+)
+async def test_choose_tries_only_matching_guards(
+    ctx: HTTPContext, request_method, tried
+):
+    calls = []
+
+    def recorded(value: str) -> HTTPHandler:
+        @guard("equals", "method", get_request_method, value)
+        def _handler(nxt, ctx):
+            calls.append(value)
+            return nxt(ctx) if ctx.request_method == value else skip(ctx)
+
+        return _handler
+
+    h = choose([recorded("GET") >> append("get"), recorded("POST") >> append("post")])
+    ctx.request_method = request_method
+    ctx.response_body = b""
+    await h.compile()(ctx)
+    assert calls == tried
@@ -1,11 +1,23 @@
 from typing import Any, Callable
 
+import orjson
 import pytest
 from pydantic import BaseModel
 
 from moona.http.context import HTTPContext
+from moona.http.events import receive
 from moona.http.handlers import HTTPHandler, end
-from moona.http.request_body import bind_dict, bind_int, bind_model, bind_raw, bind_text
+from moona.http.request_body import (
+    bind_dict,
+    bind_int,
+    bind_model,
+    bind_ndjson,
+    bind_ndjson_model,
+    bind_raw,
+    bind_stream,
+    bind_text,
+    max_body_size,
+)
 
 
 def check_for(result) -> Callable[[Any], HTTPHandler]:
@@ -77,3 +89,201 @@ async def test_bind_model(ctx: HTTPContext, model, request_body, handler):
     ctx.received = True
     ctx.request_body = request_body
     await bind_model(model, handler)(end, ctx)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_body, status, error_types",
+    [
+        (b"", 400, ("json_invalid",)),
+        (b'{"name": "John Doe", ', 400, ("json_invalid",)),
+        (b'{"name": "John Doe"}', 422, ("value_error.missing", "missing")),
+        (
+            b'{"name": "John Doe", "age": "old"}',
+            422,
+            ("type_error.integer", "int_parsing"),
+        ),
+    ],
+)
+async def test_bind_model_errors(
+    scope, receive, send, sent, request_body, status, error_types
+):
+    def unreachable(_) -> HTTPHandler:
+        raise AssertionError("must not be called")
+
+    ctx = HTTPContext(scope, receive, send)
+    ctx.received = True
+    ctx.request_body = request_body
+    _ctx = await bind_model(TestBaseModel, unreachable)(end, ctx)
+    assert _ctx.closed
+    start, body = sent
+    assert start["status"] == status
+    assert dict(start["headers"])[b"content-type"] == b"application/json"
+    [error] = orjson.loads(body["body"])["detail"]
+    assert error["type"] in error_types
+
+
+def messages(*msgs):
+    _msgs = iter(msgs)
+
+    async def _receive():
+        return next(_msgs)
+
+    return _receive
+
+
+def chunks(*bodies: bytes):
+    *head, last = bodies
+    return messages(
+        *({"type": "http.request", "body": b, "more_body": True} for b in head),
+        {"type": "http.request", "body": last, "more_body": False},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "receive_func, result",
+    [
+        (chunks(b""), b""),
+        (chunks(b"body"), b"body"),
+        (chunks(b"He", b"llo", b"", b", World!!!"), b"Hello, World!!!"),
+        (chunks(*[b"x"] * 5000), b"x" * 5000),
+        (messages({"type": "http.disconnect"}), None),
+    ],
+)
+async def test_receive(scope, send, receive_func, result):
+    ctx = HTTPContext(scope, receive_func, send)
+    _ctx = await receive(end, ctx)
+    match result:
+        case None:
+            assert _ctx is None
+            assert ctx.closed
+        case _:
+            assert _ctx.received
+            assert _ctx.request_body == result
+
+
+@pytest.mark.asyncio
+async def test_bind_stream(scope, send):
+    ctx = HTTPContext(scope, chunks(b"a", b"b", b"c"), send)
+    received = []
+
+    def consume(body) -> HTTPHandler:
+        async def _handler(nxt, ctx):
+            async for chunk in body:
+                received.append(chunk)
+            return await nxt(ctx)
+
+        return _handler
+
+    _ctx = await bind_stream(consume)(end, ctx)
+    assert received == [b"a", b"b", b"c"]
+    assert _ctx.received
+    assert _ctx.request_body == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "limit, content_length, bodies, result",
+    [
+        (None, None, [b"x" * 100], b"x" * 100),
+        (100, None, [b"x" * 50, b"x" * 50], b"x" * 100),
+        (100, None, [b"x" * 50, b"x" * 51], None),
+        (100, b"101", [b"x" * 101], None),
+        (100, b"100", [b"x" * 100], b"x" * 100),
+    ],
+)
+async def test_max_body_size(scope, send, sent, limit, content_length, bodies, result):
+    if content_length is not None:
+        scope["headers"].append([b"content-length", content_length])
+    ctx = HTTPContext(scope, chunks(*bodies), send)
+    h = receive if limit is None else max_body_size(limit) >> receive
+    _ctx = await h(end, ctx)
+    match result:
+        case None:
+            assert _ctx.closed
+            assert sent[0]["status"] == 413
+            assert sent[1]["body"] == b"Payload Too Large"
+        case _:
+            assert _ctx.request_body == result
+            assert sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("binder", [bind_stream, bind_ndjson])
+async def test_streamed_body_too_large(scope, send, sent, binder):
+    received = []
+    finished = []
+
+    def consume(records) -> HTTPHandler:
+        async def _handler(nxt, ctx):
+            async for record in records:
+                received.append(record)
+            finished.append(True)
+            return await nxt(ctx)
+
+        return _handler
+
+    ctx = HTTPContext(scope, chunks(b'{"a": 1}\n{"a"', b": 2}\n"), send)
+    _ctx = await (max_body_size(13) >> binder(consume))(end, ctx)
+    assert _ctx is ctx
+    assert _ctx.closed
+    assert sent[0]["status"] == 413
+    assert not finished
+    assert received == [b'{"a": 1}\n{"a"'] if binder is bind_stream else [{"a": 1}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "bodies, result",
+    [
+        ((b"",), []),
+        ((b'{"a": 1}',), [{"a": 1}]),
+        ((b'{"a": 1}\n{"a": 2}\n',), [{"a": 1}, {"a": 2}]),
+        (
+            (b'{"a"', b": 1}\n{", b'"a": 2}\r\n\n', b'{"a": 3}'),
+            [{"a": i} for i in (1, 2, 3)],
+        ),
+        ((b'{"a": 1}', b"\n", b"", b'{"a": 2}'), [{"a": 1}, {"a": 2}]),
+    ],
+)
+async def test_bind_ndjson(scope, send, bodies, result):
+    received = []
+
+    def consume(records) -> HTTPHandler:
+        async def _handler(nxt, ctx):
+            async for record in records:
+                received.append(record)
+            return await nxt(ctx)
+
+        return _handler
+
+    ctx = HTTPContext(scope, chunks(*bodies), send)
+    await bind_ndjson(consume)(end, ctx)
+    assert received == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "batch, result",
+    [
+        (1, [[test], [test], [test]]),
+        (2, [[test, test], [test]]),
+        (5, [[test, test, test]]),
+    ],
+)
+async def test_bind_ndjson_model(scope, send, batch, result):
+    line = b'{"name": "John Doe", "age": 33}\n'
+    received = []
+
+    def consume(batches) -> HTTPHandler:
+        async def _handler(nxt, ctx):
+            async for records in batches:
+                received.append(records)
+            return await nxt(ctx)
+
+        return _handler
+
+    ctx = HTTPContext(scope, chunks(line, line[:10], line[10:] + line), send)
+    await bind_ndjson_model(TestBaseModel, consume, batch)(end, ctx)
+    assert received == result
@@ -2,7 +2,14 @@ import pytest
 
 from moona.http import HTTPContext
 from moona.http.handlers import end
-from moona.http.request_headers import has_header, matches_header
+from moona.http.request_headers import (
+    accepted_media_types,
+    choose_encoding,
+    etag_matches,
+    has_header,
+    host,
+    matches_header,
+)
 
 
 @pytest.mark.asyncio
@@ -56,3 +63,81 @@ async def test_matches_header(
     ctx.request_headers[b_name] = b_value
     _ctx = await matches_header(s_name, s_value)(end, ctx)
     assert (_ctx is not None) == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "name, value, result",
+    [
+        ("example.org", b"example.org", True),
+        ("example.org", b"Example.org", True),
+        ("Example.org", b"example.org:8000", True),
+        ("example.org", b"example.com", False),
+        ("[::1]", b"[::1]:8000", True),
+        ("[::1]", b"[::1]", True),
+        ("example.org", None, False),
+    ],
+)
+async def test_host(ctx: HTTPContext, name, value, result):
+    ctx.request_headers.pop(b"host")
+    if value is not None:
+        ctx.request_headers[b"host"] = value
+    _ctx = await host(name)(end, ctx)
+    assert (_ctx is not None) == result
+
+
+@pytest.mark.parametrize(
+    "value, available, result",
+    [
+        (b"gzip, deflate, br", ("br", "gzip"), "br"),
+        (b"gzip, deflate", ("br", "gzip"), "gzip"),
+        (b"br;q=0.5, gzip", ("br", "gzip"), "gzip"),
+        (b"br;q=0, gzip;q=0", ("br", "gzip"), None),
+        (b"*", ("br", "gzip"), "br"),
+        (b"*, br;q=0", ("br", "gzip"), "gzip"),
+        (b"", ("br", "gzip"), None),
+    ],
+)
+def test_choose_encoding(value, available, result):
+    assert choose_encoding(value, available) == result
+
+
+@pytest.mark.parametrize(
+    "value, etag, result",
+    [
+        (b'"abc"', b'"abc"', True),
+        (b'"xyz", "abc"', b'"abc"', True),
+        (b'W/"abc"', b'"abc"', True),
+        (b"*", b'"abc"', True),
+        (b'"xyz"', b'"abc"', False),
+        (b"", b'"abc"', False),
+    ],
+)
+def test_etag_matches(value, etag, result):
+    assert etag_matches(value, etag) == result
+
+
+MEDIA_TYPES = ("application/json", "application/msgpack", "text/csv")
+
+
+@pytest.mark.parametrize(
+    "value, result",
+    [
+        (b"", MEDIA_TYPES),
+        (b"*/*", MEDIA_TYPES),
+        (b"application/msgpack", ("application/msgpack",)),
+        (b"text/*;q=0.5, application/json", ("application/json", "text/csv")),
+        (
+            b"application/*;q=0.5, application/msgpack",
+            ("application/msgpack", "application/json"),
+        ),
+        (
+            b"*/*;q=0.1, text/csv",
+            ("text/csv", "application/json", "application/msgpack"),
+        ),
+        (b"*/*, application/json;q=0", ("application/msgpack", "text/csv")),
+        (b"image/png", ()),
+    ],
+)
+def test_accepted_media_types(value, result):
+    assert accepted_media_types(value, MEDIA_TYPES) == result
@@ -12,6 +12,7 @@ from moona.http.request_method import (
     POST,
     PUT,
     TRACE,
+    head_as_get,
     method,
 )
 
@@ -202,3 +203,23 @@ async def test_concrete_method(
     ctx.request_method = request_method
     _ctx = await method_handler(end, ctx)
     assert (_ctx is not None) == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_method, method_handler, skip_body, result",
+    [
+        ("HEAD", GET, True, True),
+        ("HEAD", HEAD, True, False),
+        ("GET", GET, False, True),
+        ("POST", GET, False, False),
+    ],
+)
+async def test_head_as_get(
+    scope, receive, send, request_method, method_handler, skip_body, result
+):
+    scope["method"] = request_method
+    ctx = HTTPContext(scope, receive, send)
+    _ctx = await (head_as_get >> method_handler)(end, ctx)
+    assert ctx.skip_body == skip_body
+    assert (_ctx is not None) == result
@@ -1,10 +1,15 @@
+from datetime import date
 from typing import Callable
+from uuid import UUID
 
+import orjson
 import pytest
+from pydantic import BaseModel
 
-from moona.http.context import HTTPContext
-from moona.http.handlers import HTTPHandler, end
+from moona.http.context import HTTPContext, set_response_body
+from moona.http.handlers import HTTPHandler, end, handle_func_sync
 from moona.http.request_route import (
+    bind,
     bind_params,
     bind_query,
     route,
@@ -12,6 +17,7 @@ from moona.http.request_route import (
     subroute,
     subroute_ci,
 )
+from moona.http.router import router
 
 
 @pytest.mark.asyncio
@@ -234,6 +240,13 @@ def check_for(*, assert_args, assert_kwargs) -> Callable[..., HTTPHandler]:
                 assert_kwargs={"id": "123", "per_page": "10", "page": "3"},
             ),
         ),
+        (
+            b"q=a+b%21&tag=x&tag=y&empty",
+            check_for(
+                assert_args=(),
+                assert_kwargs={"q": "a b!", "tag": "y", "empty": ""},
+            ),
+        ),
     ],
 )
 async def test_bind_query(ctx: HTTPContext, query_string, handler):
@@ -241,6 +254,93 @@ async def test_bind_query(ctx: HTTPContext, query_string, handler):
     await bind_query(handler)(end, ctx)
 
 
+def search(
+    q: str,
+    ids: list[int],
+    page: int = 1,
+    exact: bool = False,
+    since: date | None = None,
+    user: UUID | None = None,
+) -> HTTPHandler:
+    return handle_func_sync(
+        set_response_body(
+            orjson.dumps(
+                {
+                    "q": q,
+                    "ids": ids,
+                    "page": page,
+                    "exact": exact,
+                    "since": since,
+                    "user": user,
+                }
+            )
+        )
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query_string, result",
+    [
+        (
+            b"q=moona&ids=1&ids=2",
+            {"q": "moona", "ids": [1, 2], "page": 1, "exact": False},
+        ),
+        (
+            b"q=a+b&ids=3&page=2&exact=true&since=2022-01-01",
+            {"q": "a b", "ids": [3], "page": 2, "exact": True, "since": "2022-01-01"},
+        ),
+        (
+            b"q=&ids=1&user=00000000-0000-0000-0000-000000000001&other=1",
+            {"q": "", "ids": [1], "user": "00000000-0000-0000-0000-000000000001"},
+        ),
+    ],
+)
+async def test_bind_query_typed(ctx: HTTPContext, query_string, result):
+    ctx.request_query_string = query_string
+    _ctx = await bind_query(search)(end, ctx)
+    body = orjson.loads(_ctx.response_body)
+    assert {k: v for k, v in body.items() if k in result} == result
+    assert all(body[k] in (None, False, 1) for k in body if k not in result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query_string, errors",
+    [
+        (b"", [["query", "q"], ["query", "ids"]]),
+        (b"q=moona&ids=one", [["query", "ids"]]),
+        (
+            b"q=moona&ids=1&page=last&exact=maybe",
+            [["query", "page"], ["query", "exact"]],
+        ),
+    ],
+)
+async def test_bind_query_errors(make_ctx, sent, query_string, errors):
+    ctx = make_ctx(query_string=query_string)
+    _ctx = await bind_query(search)(end, ctx)
+    assert _ctx.closed
+    start, body = sent
+    assert start["status"] == 400
+    assert [e["loc"] for e in orjson.loads(body["body"])["detail"]] == errors
+
+
+@pytest.mark.asyncio
+async def test_bind_query_parses_once(ctx: HTTPContext):
+    ctx.request_query_string = b"a=1"
+    seen = []
+
+    def remember(a: int) -> HTTPHandler:
+        seen.append(a)
+        return lambda nxt, ctx: nxt(ctx)
+
+    await (bind_query(remember) >> bind_query(remember))(end, ctx)
+    assert seen == [1, 1]
+    assert ctx.request_query is ctx.request_query
+    ctx.request_query_string = b"a=2"
+    assert ctx.request_query == {"a": ["2"]}
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "request_path, path, handler, result",
@@ -304,3 +404,106 @@ async def test_bind_params(ctx: HTTPContext, request_path, path, handler, result
     ctx.request_path = request_path
     _ctx = await bind_params(path, handler)(end, ctx)
     assert (_ctx is not None) == result
+
+
+class Body(BaseModel):  # noqa
+    name: str
+
+
+def show(id: int, day: date, body: Body, verbose: bool = False) -> HTTPHandler:
+    return handle_func_sync(
+        set_response_body(
+            orjson.dumps({"id": id, "day": day, "name": body.name, "verbose": verbose})
+        )
+    )
+
+
+def show_user(user: UUID, page: int = 1) -> HTTPHandler:
+    return handle_func_sync(
+        set_response_body(orjson.dumps({"user": user, "page": page}))
+    )
+
+
+typed = router(
+    [
+        bind(show, "/items/{id}/{day}"),
+        bind(show_user, "/users/{user}"),
+        route("/users/me") >> handle_func_sync(set_response_body(b"me")),
+    ]
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "app",
+    [typed, bind(show, "/items/{id}/{day}")],
+)
+@pytest.mark.parametrize(
+    "path, query, body, status, result",
+    [
+        (
+            "/items/1/2022-01-01",
+            b"verbose=yes",
+            b'{"name": "x"}',
+            200,
+            {"id": 1, "day": "2022-01-01", "name": "x", "verbose": True},
+        ),
+        ("/items/one/2022-01-01", b"", b'{"name": "x"}', None, None),
+        ("/items/1/2022-01-01", b"verbose=maybe", b'{"name": "x"}', 400, None),
+        ("/items/1/2022-01-01", b"", b"{", 400, None),
+        ("/items/1/2022-01-01", b"", b"{}", 422, None),
+    ],
+)
+async def test_bind(make_ctx, sent, app, path, query, body, status, result):
+    ctx = make_ctx(messages_of(body), path=path, query_string=query)
+    _ctx = await app(end, ctx)
+    match status, result:
+        case None, _:
+            assert _ctx is None
+        case 200, result:
+            assert orjson.loads(_ctx.response_body) == result
+        case status, _:
+            assert sent[0]["status"] == status
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, query, result",
+    [
+        (
+            "/users/00000000-0000-0000-0000-000000000001",
+            b"page=2",
+            b'{"user":"00000000-0000-0000-0000-000000000001","page":2}',
+        ),
+        ("/users/me", b"", b"me"),
+    ],
+)
+async def test_bind_router(make_ctx, path, query, result):
+    _ctx = await typed(end, make_ctx(path=path, query_string=query))
+    assert _ctx.response_body == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query, result",
+    [(b"", {"id": 1}), (b"a=1&a=2&b=x", {"id": 1, "a": "2", "b": "x"})],
+)
+async def test_bind_var_arguments(make_ctx, query, result):
+    def extra(id: int, *args, **kwargs) -> HTTPHandler:
+        return handle_func_sync(set_response_body(orjson.dumps({"id": id, **kwargs})))
+
+    ctx = make_ctx(path="/users/1", query_string=query)
+    _ctx = await bind(extra, "/users/{id}")(end, ctx)
+    assert orjson.loads(_ctx.response_body) == result
+
+
+def test_bind_unknown_path_param():
+    with pytest.raises(ValueError):
+        bind(show_user, "/users/{id}")
+
+
+def messages_of(body: bytes):
+    async def _receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return _receive
@@ -1,11 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Callable
+from uuid import UUID
 
 import pytest
 from pydantic import BaseModel
 
+from moona.http import response_body
 from moona.http.context import HTTPContext
+from moona.http.events import respond, start
 from moona.http.handlers import HTTPHandler, end
-from moona.http.response_body import negotiate, set_json, set_raw, set_text
+from moona.http.response_body import (
+    json,
+    negotiate,
+    raw,
+    register_serializer,
+    serialize,
+    serialize_csv,
+    serialized,
+    set_json,
+    set_raw,
+    set_text,
+    stream,
+    text,
+)
+from moona.http.response_headers import add_header, header
+from moona.http.response_status import set_status
 
 
 class TestInnerBaseModel(BaseModel):  # noqa
@@ -60,3 +80,240 @@ async def test_setters(
 ):
     _ctx = await setter(data)(end, ctx)
     assert _ctx.response_body == result
+
+
+@pytest.mark.asyncio
+async def test_stream(scope, receive, send, sent):
+    produced = []
+
+    async def chunks():
+        for chunk in [b"Hello", ", ", b"World!!!"]:
+            produced.append(chunk)
+            assert len(sent) == len(produced)
+            yield chunk
+
+    ctx = HTTPContext(scope, receive, send)
+    _ctx = await stream(chunks())(end, ctx)
+    assert _ctx.closed
+    assert sent[0]["type"] == "http.response.start"
+    assert [msg["body"] for msg in sent[1:]] == [b"Hello", b", ", b"World!!!", b""]
+    assert [msg["more_body"] for msg in sent[1:]] == [True, True, True, False]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, headers, status, result",
+    [
+        (raw(b"Hello"), [], 200, b"Hello"),
+        (raw(b"Hello", 201), [], 201, b"Hello"),
+        (text("Hello"), [(b"content-type", b"text/plain")], 200, b"Hello"),
+        (
+            json(TestInnerBaseModel(address="NYC", phone="111-11-11"), 404),
+            [(b"content-type", b"application/json")],
+            404,
+            b'{"address":"NYC","phone":"111-11-11"}',
+        ),
+        (
+            header("x-custom", "1") >> text("Hello"),
+            [(b"x-custom", b"1"), (b"content-type", b"text/plain")],
+            200,
+            b"Hello",
+        ),
+        (
+            header("content-type", "text/html") >> text("Hello"),
+            [(b"content-type", b"text/plain")],
+            200,
+            b"Hello",
+        ),
+        (set_status(202) >> raw(b"Hello"), [], 202, b"Hello"),
+    ],
+)
+async def test_templates(
+    scope, receive, send, sent, h: HTTPHandler, headers, status, result
+):
+    responses = []
+    for _ in range(2):
+        sent.clear()
+        ctx = HTTPContext(scope, receive, send)
+        _ctx = await h(end, ctx)
+        assert _ctx.closed
+        assert _ctx.started
+        assert _ctx.response_status == status
+        assert _ctx.response_body == result
+        start, body = sent
+        assert start["status"] == status
+        assert list(start["headers"]) == headers
+        assert body["body"] == result
+        responses.append(list(sent))
+
+    assert responses[0][1] is responses[1][1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, headers",
+    [
+        (raw(b"Hello"), [(b"content-length", b"5")]),
+        (
+            text("Hello"),
+            [(b"content-type", b"text/plain"), (b"content-length", b"5")],
+        ),
+        (
+            set_raw(b"Hello") >> start >> respond,
+            [(b"content-length", b"5")],
+        ),
+        (
+            header("content-length", "10") >> raw(b"Hello"),
+            [(b"content-length", b"10")],
+        ),
+    ],
+)
+async def test_skip_body(make_ctx, sent, h: HTTPHandler, headers):
+    ctx = make_ctx(method="HEAD")
+    _ctx = await h(end, ctx)
+    start_message, body = sent
+    assert _ctx.closed
+    assert start_message["headers"] == headers
+    assert body == {"type": "http.response.body", "body": b""}
+
+
+@pytest.mark.asyncio
+async def test_stream_skip_body(make_ctx, sent):
+    produced = []
+
+    async def chunks():
+        for chunk in [b"Hello", b"World"]:
+            produced.append(chunk)
+            yield chunk
+
+    ctx = make_ctx(method="HEAD")
+    _ctx = await (header("content-length", "10") >> stream(chunks()))(end, ctx)
+    start_message, body = sent
+    assert _ctx.closed
+    assert produced == []
+    assert start_message["headers"] == [(b"content-length", b"10")]
+    assert body["body"] == b""
+
+
+@pytest.mark.asyncio
+async def test_start_sends_headers_without_copying(scope, receive, send, sent):
+    ctx = HTTPContext(scope, receive, send)
+    h = add_header("set-cookie", "a=1") >> add_header("set-cookie", "b=2")
+    await (h >> text("Hello"))(end, ctx)
+    assert sent[0]["headers"] is ctx.response_headers
+    assert sent[0]["headers"] == [
+        (b"set-cookie", b"a=1"),
+        (b"set-cookie", b"b=2"),
+        (b"content-type", b"text/plain"),
+    ]
+
+
+@dataclass
+class Point:  # noqa
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "data, result",
+    [
+        (
+            TestInnerBaseModel(address="NYC", phone="1"),
+            b'{"address":"NYC","phone":"1"}',
+        ),
+        ({"a": 1}, b'{"a":1}'),
+        ([1, "a"], b'[1,"a"]'),
+        (Point(1, 2), b'{"x":1,"y":2}'),
+        (
+            [TestInnerBaseModel(address="NYC", phone="1"), Point(1, 2)],
+            b'[{"address":"NYC","phone":"1"},{"x":1,"y":2}]',
+        ),
+        (
+            {"at": datetime(2022, 1, 1), "id": UUID(int=1)},
+            b'{"at":"2022-01-01T00:00:00","id":"00000000-0000-0000-0000-000000000001"}',
+        ),
+    ],
+)
+def test_serialize(data, result):
+    assert serialize(data) == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data, result",
+    [
+        ({"a": 1}, b'{"a":1}'),
+        ([1, 2], b"[1,2]"),
+        ((1, 2), b"[1,2]"),
+        (Point(1, 2), b'{"x":1,"y":2}'),
+    ],
+)
+async def test_negotiate_json(ctx: HTTPContext, data, result):
+    _ctx = await negotiate(data)(end, ctx)
+    assert _ctx.response_body == result
+
+
+def test_serialize_unknown():
+    with pytest.raises(TypeError):
+        serialize(object())
+
+
+ROWS = [Point(1, 2), {"x": 3, "y": 4}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data, accept, content_type, result",
+    [
+        (ROWS, None, b"application/json", b'[{"x":1,"y":2},{"x":3,"y":4}]'),
+        (
+            ROWS,
+            b"application/json",
+            b"application/json",
+            b'[{"x":1,"y":2},{"x":3,"y":4}]',
+        ),
+        (ROWS, b"text/csv", b"text/csv", b"x,y\r\n1,2\r\n3,4\r\n"),
+        (ROWS, b"text/csv;q=0.5, application/json", b"application/json", None),
+        (ROWS, b"image/png", b"application/json", None),
+        (Point(1, 2), b"text/csv, */*;q=0.1", b"application/json", b'{"x":1,"y":2}'),
+        ({"a": 1}, b"application/x-test", b"application/x-test", b"a"),
+    ],
+)
+async def test_serialized(
+    monkeypatch, make_ctx, sent, data, accept, content_type, result
+):
+    monkeypatch.setattr(response_body, "SERIALIZERS", dict(response_body.SERIALIZERS))
+    register_serializer("application/x-test", lambda data: ",".join(data).encode())
+    h = serialized(data, 201)
+    for _ in range(2):
+        sent.clear()
+        headers = [] if accept is None else [(b"accept", accept)]
+        await h(end, make_ctx(headers=headers))
+        start, body = sent
+        assert start["status"] == 201
+        assert dict(start["headers"])[b"content-type"] == content_type
+        assert dict(start["headers"])[b"vary"] == b"accept"
+        if result is not None:
+            assert body["body"] == result
+
+
+def test_serialized_not_json_serializable():
+    with pytest.raises(TypeError):
+        serialized({"a": object()})
+
+
+@pytest.mark.asyncio
+async def test_serialized_msgpack(scope, receive, send):
+    msgpack = pytest.importorskip("msgpack")
+    scope["headers"] = [(b"accept", b"application/msgpack")]
+    ctx = HTTPContext(scope, receive, send)
+    _ctx = await serialized({"id": UUID(int=1), "at": datetime(2022, 1, 1)})(end, ctx)
+    assert msgpack.unpackb(_ctx.response_body) == {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "at": "2022-01-01T00:00:00",
+    }
+
+
+def test_serialize_csv_requires_rows():
+    with pytest.raises(TypeError):
+        serialize_csv({"x": 1})
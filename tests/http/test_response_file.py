@@ -0,0 +1,82 @@
+import pytest
+
+from moona.http.context import HTTPContext
+from moona.http.handlers import end
+from moona.http.response_file import file
+
+CONTENT = b"0123456789" * 1000
+
+
+@pytest.fixture
+def path(tmp_path):
+    _path = tmp_path / "data.txt"
+    _path.write_bytes(CONTENT)
+    return _path
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "extensions, message_type",
+    [
+        ({}, "http.response.body"),
+        ({"http.response.pathsend": {}}, "http.response.pathsend"),
+        ({"http.response.zerocopy": {}}, "http.response.zerocopy"),
+    ],
+)
+async def test_file(scope, receive, path, extensions, message_type):
+    sent = []
+
+    async def send(msg):
+        if msg["type"] == "http.response.zerocopy":
+            msg = {**msg, "body": msg["file"].read(msg["count"])}
+        sent.append(msg)
+
+    scope["extensions"] = extensions
+    ctx = HTTPContext(scope, receive, send)
+    _ctx = await file(path, chunk_size=4096)(end, ctx)
+
+    start, *body = sent
+    assert _ctx.closed
+    assert (b"content-length", b"10000") in start["headers"]
+    assert (b"content-type", b"text/plain") in start["headers"]
+    assert {msg["type"] for msg in body} == {message_type}
+    match message_type:
+        case "http.response.pathsend":
+            assert body[0]["path"] == str(path)
+        case "http.response.zerocopy":
+            assert body[0]["body"] == CONTENT
+        case "http.response.body":
+            assert b"".join(msg["body"] for msg in body) == CONTENT
+            assert all(len(msg["body"]) <= 4096 for msg in body)
+
+
+@pytest.mark.asyncio
+async def test_file_missing(ctx: HTTPContext, tmp_path):
+    _ctx = await file(tmp_path / "missing.txt")(end, ctx)
+    assert _ctx is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("extensions", [{}, {"http.response.pathsend": {}}])
+async def test_file_directory(scope, receive, send, sent, tmp_path, extensions):
+    scope["extensions"] = extensions
+    ctx = HTTPContext(scope, receive, send)
+    _ctx = await file(tmp_path)(end, ctx)
+    assert _ctx is None
+    assert not ctx.started
+    assert sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "extensions",
+    [{}, {"http.response.pathsend": {}}, {"http.response.zerocopy": {}}],
+)
+async def test_file_skip_body(make_ctx, sent, path, extensions):
+    ctx = make_ctx(method="HEAD", extensions=extensions)
+    _ctx = await file(path)(end, ctx)
+
+    start, body = sent
+    assert _ctx.closed
+    assert (b"content-length", b"10000") in start["headers"]
+    assert body == {"type": "http.response.body", "body": b""}
@@ -2,6 +2,7 @@ import pytest
 
 from moona.http import HTTPContext, end
 from moona.http.response_headers import (
+    add_header,
     auto_content_length,
     content_length,
     content_type,
@@ -25,6 +26,22 @@ async def test_header(ctx: HTTPContext, s_name, s_value, b_name, b_value):
     assert _ctx.response_headers[b_name] == b_value
 
 
+@pytest.mark.asyncio
+async def test_add_header(ctx: HTTPContext):
+    h = (
+        add_header("Set-Cookie", "a=1")
+        >> add_header("Set-Cookie", "b=2")
+        >> header("X-Custom", "1")
+        >> header("X-Custom", "2")
+    )
+    _ctx = await h(end, ctx)
+    assert _ctx.response_headers == [
+        (b"set-cookie", b"a=1"),
+        (b"set-cookie", b"b=2"),
+        (b"x-custom", b"2"),
+    ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "s_value, b_value",
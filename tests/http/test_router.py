@@ -0,0 +1,108 @@
+import pytest
+
+from moona.http.context import HTTPContext, set_response_body
+from moona.http.handlers import HTTPHandler, end, handle_func_sync
+from moona.http.request_method import GET, POST
+from moona.http.request_route import (
+    bind_params,
+    route,
+    route_ci,
+    subroute,
+    subroute_ci,
+)
+from moona.http.router import router
+
+
+def mark(value: str) -> HTTPHandler:
+    return handle_func_sync(set_response_body(value))
+
+
+def mark_params(*params: str) -> HTTPHandler:
+    return mark("/".join(params))
+
+
+def mark_path(ctx: HTTPContext) -> HTTPContext:
+    ctx.response_body = ctx.request_path
+    return ctx
+
+
+app = router(
+    [
+        route("/") >> mark("index"),
+        route("/users") >> GET >> mark("get users"),
+        route("/users") >> POST >> mark("post users"),
+        bind_params("/users/{id}", mark_params),
+        bind_params("/users/{id}/projects/{project}", mark_params),
+        route("/users/me") >> mark("me"),
+        route("/docs/{page}") >> mark("literal"),
+        route_ci("/About") >> mark("about"),
+        subroute("/static") >> handle_func_sync(mark_path),
+        subroute_ci("/Files") >> handle_func_sync(mark_path),
+        GET >> route("/fallback") >> mark("fallback"),
+    ]
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_method, request_path, result",
+    [
+        ("GET", "", "index"),
+        ("GET", "users", "get users"),
+        ("POST", "users", "post users"),
+        ("PUT", "users", None),
+        ("GET", "users/123", "123"),
+        ("GET", "users/me", "me"),
+        ("GET", "users/123/projects/moona", "123/moona"),
+        ("GET", "users/123/projects", None),
+        ("GET", "docs/{page}", "literal"),
+        ("GET", "docs/intro", None),
+        ("GET", "about", "about"),
+        ("GET", "ABOUT", "about"),
+        ("GET", "static", ""),
+        ("GET", "static/css/main.css", "css/main.css"),
+        ("GET", "statics/main.css", None),
+        ("GET", "FILES/Report.pdf", "Report.pdf"),
+        ("GET", "fallback", "fallback"),
+        ("POST", "fallback", None),
+        ("GET", "unknown", None),
+    ],
+)
+async def test_router(ctx: HTTPContext, request_method, request_path, result):
+    ctx.request_method = request_method
+    ctx.request_path = request_path
+    _ctx = await app(end, ctx)
+    match result:
+        case None:
+            assert _ctx is None
+            assert ctx.request_path == request_path
+        case _:
+            assert _ctx.response_body == result
+
+
+@pytest.mark.asyncio
+async def test_router_empty(ctx: HTTPContext):
+    _ctx = await router([])(end, ctx)
+    assert _ctx is ctx
+
+
+@pytest.mark.asyncio
+async def test_router_links_once(ctx: HTTPContext):
+    seen = []
+
+    def record(nxt, ctx):
+        seen.append(nxt)
+        return nxt(ctx)
+
+    h = router(
+        [
+            route("/users") >> HTTPHandler(record) >> mark("users"),
+            bind_params("/users/{id}", mark) >> HTTPHandler(record),
+        ]
+    ).compile()
+    for path in ["users", "users", "users/1", "users/2"]:
+        ctx.request_path = path
+        ctx.closed = False
+        assert (await h(ctx)) is ctx
+    assert seen[0] is seen[1]
+    assert seen[2] is seen[3]
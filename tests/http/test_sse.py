@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from moona.http.handlers import end
+from moona.http.sse import ReplayBuffer, ServerSentEvent, format_event, sse
+from tests.http.helpers import chunks
+
+
+def client(disconnect_after: float | None = None):
+    """Returns `receive` of the client that disconnects after the delay or never."""
+
+    async def receive():
+        match disconnect_after:
+            case None:
+                await asyncio.Event().wait()
+            case delay:
+                await asyncio.sleep(delay)
+                return {"type": "http.disconnect"}
+
+    return receive
+
+
+def frames(sent) -> list[bytes]:
+    return [msg["body"] for msg in sent[1:]]
+
+
+@pytest.mark.parametrize(
+    "event, result",
+    [
+        ("hello", b"data: hello\n\n"),
+        (b"a\nb", b"data: a\ndata: b\n\n"),
+        ("", b"data: \n\n"),
+        ({"a": 1}, b'data: {"a":1}\n\n'),
+        (
+            ServerSentEvent("hi", event="greeting", id="1", retry=1000),
+            b"event: greeting\nid: 1\nretry: 1000\ndata: hi\n\n",
+        ),
+    ],
+)
+def test_format_event(event, result):
+    assert format_event(event) == result
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        ServerSentEvent("a", event="tick\ndata: injected"),
+        ServerSentEvent("a", id="1\r\nevent: injected"),
+        ServerSentEvent("a", id="1\r"),
+    ],
+)
+def test_format_event_line_breaks(event):
+    with pytest.raises(ValueError):
+        format_event(event)
+
+
+def test_replay_buffer():
+    buffer = ReplayBuffer(max_events=3)
+    for i in range(4):
+        buffer.add(str(i), f"{i}".encode())
+    buffer.add("3", b"duplicate")
+
+    assert len(buffer) == 3
+    assert buffer.after("0") is None
+    assert buffer.after("1") == [b"2", b"3"]
+    assert buffer.after("3") == []
+
+
+@pytest.mark.asyncio
+async def test_sse(make_ctx, sent):
+    ctx = make_ctx(client(), headers=[])
+    _ctx = await sse(chunks("a", ServerSentEvent("b", id="1")), retry=500)(end, ctx)
+
+    start, *_ = sent
+    assert _ctx.closed
+    assert (b"content-type", b"text/event-stream") in start["headers"]
+    assert (b"cache-control", b"no-cache") in start["headers"]
+    assert frames(sent) == [
+        b"retry: 500\n\n",
+        b"data: a\n\n",
+        b"id: 1\ndata: b\n\n",
+        b"",
+    ]
+    assert [msg["more_body"] for msg in sent[1:]] == [True, True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_sse_heartbeat(make_ctx, sent):
+    ctx = make_ctx(client(), headers=[])
+    await sse(chunks("a", delay=0.05), heartbeat=0.01)(end, ctx)
+
+    assert b": heartbeat\n\n" in frames(sent)
+    assert frames(sent)[-2:] == [b"data: a\n\n", b""]
+
+
+@pytest.mark.asyncio
+async def test_sse_stops_on_disconnect(make_ctx, sent):
+    produced = []
+    closed = []
+
+    async def endless():
+        try:
+            while True:
+                await asyncio.sleep(0.005)
+                produced.append(1)
+                yield "tick"
+        finally:
+            closed.append(True)
+
+    ctx = make_ctx(client(disconnect_after=0.03), headers=[])
+    _ctx = await sse(endless())(end, ctx)
+    count = len(produced)
+    await asyncio.sleep(0.02)
+
+    assert _ctx.closed
+    assert closed == [True]
+    assert len(produced) == count
+    assert all(msg["more_body"] for msg in sent[1:])
+
+
+@pytest.mark.asyncio
+async def test_sse_replay(make_ctx, sent):
+    buffer = ReplayBuffer()
+    events = [ServerSentEvent(str(i), id=str(i)) for i in range(3)]
+    ctx = make_ctx(client(), headers=[])
+    await sse(chunks(*events), replay=buffer)(end, ctx)
+
+    sent.clear()
+    ctx = make_ctx(client(), headers=[(b"last-event-id", b"0")])
+    await sse(chunks(ServerSentEvent("3", id="3")), replay=buffer)(end, ctx)
+
+    assert frames(sent) == [
+        b"id: 1\ndata: 1\n\n",
+        b"id: 2\ndata: 2\n\n",
+        b"id: 3\ndata: 3\n\n",
+        b"",
+    ]
+    assert len(buffer) == 4
+
+
+@pytest.mark.asyncio
+async def test_sse_head(make_ctx, sent):
+    produced = []
+
+    async def events():
+        produced.append(1)
+        yield "a"
+
+    ctx = make_ctx(client(), method="HEAD", headers=[])
+    await sse(events())(end, ctx)
+
+    assert produced == []
+    assert frames(sent) == [b""]
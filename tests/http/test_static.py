@@ -0,0 +1,80 @@
+import gzip
+
+import pytest
+
+from moona.http.handlers import end
+from moona.http.static import static
+
+
+@pytest.fixture
+def directory(tmp_path):
+    root = tmp_path / "static"
+    (root / "css").mkdir(parents=True)
+    (root / "index.html").write_bytes(b"<html></html>")
+    (root / "css" / "main.css").write_bytes(b"body {}")
+    (root / "css" / "main.css.gz").write_bytes(gzip.compress(b"body {}", mtime=0))
+    (root / "big.bin").write_bytes(b"x" * 2048)
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    return root
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, method, headers, status, body, encoding",
+    [
+        ("/index.html", "GET", [], 200, b"<html></html>", None),
+        ("/css/main.css", "GET", [], 200, b"body {}", None),
+        (
+            "/css/main.css",
+            "GET",
+            [(b"accept-encoding", b"gzip, deflate")],
+            200,
+            gzip.compress(b"body {}", mtime=0),
+            b"gzip",
+        ),
+        (
+            "/css/main.css",
+            "GET",
+            [(b"accept-encoding", b"gzip;q=0")],
+            200,
+            b"body {}",
+            None,
+        ),
+        ("/big.bin", "GET", [], 200, b"x" * 2048, None),
+        ("/missing.html", "GET", [], None, None, None),
+        ("/css", "GET", [], None, None, None),
+        ("/../secret.txt", "GET", [], None, None, None),
+        ("/css/../../secret.txt", "GET", [], None, None, None),
+        ("/index.html", "POST", [], None, None, None),
+    ],
+)
+async def test_static(
+    make_ctx, sent, directory, path, method, headers, status, body, encoding
+):
+    handler = static(directory, max_file_size=1024)
+    for _ in range(2):
+        sent.clear()
+        ctx = make_ctx(path=path, method=method, headers=headers)
+        _ctx = await handler(end, ctx)
+        match status:
+            case None:
+                assert _ctx is None
+                assert sent == []
+            case _:
+                start, *messages = sent
+                assert start["status"] == status
+                assert dict(start["headers"]).get(b"content-encoding") == encoding
+                assert b"".join(msg.get("body", b"") for msg in messages) == body
+
+
+@pytest.mark.asyncio
+async def test_static_not_modified(make_ctx, sent, directory):
+    handler = static(directory)
+    await handler(end, make_ctx(path="/index.html", headers=[]))
+    etag = dict(sent[0]["headers"])[b"etag"]
+
+    sent.clear()
+    ctx = make_ctx(path="/index.html", headers=[(b"if-none-match", etag)])
+    await handler(end, ctx)
+    assert sent[0]["status"] == 304
+    assert sent[1]["body"] == b""
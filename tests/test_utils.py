@@ -0,0 +1,26 @@
+from moona.utils import LRUCache
+
+
+def test_lru_cache_entries():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_lru_cache_size():
+    cache = LRUCache(10, max_size=10, sizeof=len)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.size == 10
+    cache.put("c", b"1")
+    assert cache.get("a") is None
+    assert cache.size == 6
+    cache.put("d", b"x" * 11)
+    assert cache.get("d") is None
+    assert len(cache) == 2
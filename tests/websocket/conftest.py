@@ -0,0 +1,32 @@
+import pytest
+
+from moona.context import Message
+
+
+@pytest.fixture
+def scope():
+    return {
+        "type": "websocket",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "scheme": "ws",
+        "path": "/chat/",
+        "query_string": b"room=1&room=2",
+        "headers": [[b"Host", b"localhost"], [b"origin", b"http://localhost"]],
+        "client": ("127.0.0.1", 34784),
+        "server": ("127.0.0.1", 8000),
+        "subprotocols": ["json", "msgpack"],
+    }
+
+
+@pytest.fixture
+def sent() -> list[Message]:
+    return []
+
+
+@pytest.fixture
+def send(sent):
+    async def send(msg: Message) -> None:
+        sent.append(msg)
+
+    return send
@@ -0,0 +1,42 @@
+from moona.http.context import ClientInfo, ServerInfo
+from moona.websocket.context import WebsocketContext
+
+
+async def receive():
+    return {"type": "websocket.disconnect"}
+
+
+async def send(_):
+    return None
+
+
+def test_context(scope):
+    ctx = WebsocketContext(scope, receive, send, max_queue=4)
+
+    assert ctx.request_path == "chat"
+    assert ctx.request_headers == {
+        b"host": b"localhost",
+        b"origin": b"http://localhost",
+    }
+    assert ctx.request_query == {"room": ["1", "2"]}
+    assert ctx.subprotocols == ["json", "msgpack"]
+    assert ctx.client == ClientInfo("127.0.0.1", 34784)
+    assert ctx.server == ServerInfo("127.0.0.1", 8000)
+    assert ctx.outbox.maxsize == 4
+    assert not ctx.accepted and not ctx.closed
+
+
+def test_context_without_client(scope):
+    del scope["client"], scope["server"]
+    ctx = WebsocketContext(scope, receive, send)
+
+    assert ctx.client is None
+    assert ctx.server is None
+
+
+def test_state_shared_with_server(scope):
+    state = {}
+    scope["state"] = state
+    ctx = WebsocketContext(scope, receive, send)
+
+    assert ctx.state is state
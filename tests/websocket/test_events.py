@@ -0,0 +1,200 @@
+import asyncio
+
+import pytest
+
+from moona import asgi
+from moona.websocket.context import WebsocketContext
+from moona.websocket.events import (
+    ConnectionClosed,
+    accept,
+    close,
+    iter_messages,
+    message,
+    on_message,
+    send,
+    send_nowait,
+    send_stream,
+)
+from moona.websocket.handlers import end, handle_func_sync
+from moona.websocket.request_route import route, subprotocol
+
+
+def client(*messages):
+    incoming = [{"type": "websocket.connect"}, *messages]
+    sent = []
+
+    async def receive():
+        match incoming:
+            case [msg, *rest]:
+                incoming[:] = rest
+                return msg
+            case []:
+                await asyncio.sleep(0.01)
+                return {"type": "websocket.disconnect", "code": 1001}
+
+    async def send(msg):
+        sent.append(msg)
+
+    return receive, send, sent
+
+
+async def items(*values):
+    for value in values:
+        yield value
+
+
+async def echo(ctx: WebsocketContext, data) -> None:
+    await send(ctx, data)
+
+
+def fail(ctx: WebsocketContext) -> WebsocketContext:
+    raise RuntimeError("failed")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, result",
+    [
+        (
+            route("chat") >> accept() >> on_message(echo),
+            [
+                {"type": "websocket.accept", "subprotocol": None},
+                {"type": "websocket.send", "text": "a"},
+                {"type": "websocket.send", "bytes": b"b"},
+            ],
+        ),
+        (
+            subprotocol("json")
+            >> accept("json", [(b"x-custom", b"1")])
+            >> send_stream(items("a", "b"))
+            >> close(4000, "done"),
+            [
+                {
+                    "type": "websocket.accept",
+                    "subprotocol": "json",
+                    "headers": [(b"x-custom", b"1")],
+                },
+                {"type": "websocket.send", "text": "a"},
+                {"type": "websocket.send", "text": "b"},
+                {"type": "websocket.close", "code": 4000, "reason": "done"},
+            ],
+        ),
+        (
+            accept() >> send_stream(items(b"a")),
+            [
+                {"type": "websocket.accept", "subprotocol": None},
+                {"type": "websocket.send", "bytes": b"a"},
+                {"type": "websocket.close", "code": 1000, "reason": ""},
+            ],
+        ),
+        (
+            route("other") >> accept(),
+            [{"type": "websocket.close", "code": 1000, "reason": ""}],
+        ),
+        (
+            subprotocol("xml") >> accept(),
+            [{"type": "websocket.close", "code": 1000, "reason": ""}],
+        ),
+        (None, [{"type": "websocket.close", "code": 1000, "reason": ""}]),
+    ],
+)
+async def test_asgi(scope, h, result):
+    receive, send, sent = client(
+        {"type": "websocket.receive", "text": "a"},
+        {"type": "websocket.receive", "bytes": b"b"},
+    )
+    app = asgi.create() if h is None else asgi.create(websocket_handler=h)
+    await app(scope, receive, send)
+    assert sent == result
+
+
+@pytest.mark.asyncio
+async def test_asgi_error(scope):
+    receive, send, sent = client()
+    app = asgi.create(websocket_handler=accept() >> handle_func_sync(fail))
+    with pytest.raises(RuntimeError):
+        await app(scope, receive, send)
+    assert sent[-1] == {"type": "websocket.close", "code": 1011, "reason": ""}
+
+
+@pytest.mark.asyncio
+async def test_iter_messages(scope):
+    receive, send, _ = client(
+        {"type": "websocket.receive", "text": "a"},
+        {"type": "websocket.receive", "bytes": b"b"},
+    )
+    ctx = WebsocketContext(scope, receive, send)
+    await receive()
+    assert [data async for data in iter_messages(ctx)] == ["a", b"b"]
+    assert ctx.closed
+    assert ctx.close_code == 1001
+
+
+@pytest.mark.asyncio
+async def test_outbox_is_bounded(scope):
+    receive, _, _ = client()
+    sent = []
+    produced = []
+    released = asyncio.Event()
+
+    async def slow_send(msg):
+        if msg["type"] == "websocket.send":
+            await released.wait()
+        sent.append(msg)
+
+    async def produce():
+        for i in range(10):
+            produced.append(i)
+            yield str(i)
+
+    ctx = WebsocketContext(scope, receive, slow_send, max_queue=2)
+    h = accept() >> send_stream(produce()) >> close()
+    task = asyncio.ensure_future(h(end, ctx))
+    await asyncio.sleep(0.01)
+    assert ctx.outbox.qsize() == 2
+    assert len(produced) < 10
+    assert not send_nowait(ctx, message("x"))
+
+    released.set()
+    await task
+    assert [msg.get("text") for msg in sent[1:-1]] == [str(i) for i in range(10)]
+    assert sent[-1]["type"] == "websocket.close"
+
+
+@pytest.mark.asyncio
+async def test_send_before_accept(scope):
+    receive, send_, _ = client()
+    ctx = WebsocketContext(scope, receive, send_, max_queue=1)
+    with pytest.raises(ConnectionClosed):
+        await send(ctx, "a")
+    with pytest.raises(ConnectionClosed):
+        await send_stream(items("a"))(end, ctx)
+
+
+@pytest.mark.asyncio
+async def test_send_after_client_is_gone(scope):
+    receive, _, _ = client()
+
+    async def broken_send(msg):
+        if msg["type"] == "websocket.send":
+            raise OSError("connection reset")
+
+    ctx = WebsocketContext(scope, receive, broken_send, max_queue=1)
+    await accept()(end, ctx)
+    for data in ["a", "b", "c"]:
+        try:
+            await asyncio.wait_for(send(ctx, data), 0.1)
+        except ConnectionClosed:
+            break
+    else:
+        raise AssertionError("sending to the closed connection did not fail")
+    assert ctx.closed
+
+    await asyncio.wait_for(send_stream(items("d", "e", "f"))(end, ctx), 0.1)
+
+
+def test_message():
+    assert message("a") == {"type": "websocket.send", "text": "a"}
+    assert message(b"a") == {"type": "websocket.send", "bytes": b"a"}
+    with pytest.raises(TypeError):
+        message(1)
@@ -0,0 +1,57 @@
+import pytest
+
+from moona.websocket.context import WebsocketContext
+from moona.websocket.handlers import (
+    WebsocketHandler,
+    choose,
+    end,
+    handle_func_sync,
+    unchain,
+)
+from moona.websocket.request_route import route
+
+
+async def receive():
+    return {"type": "websocket.disconnect"}
+
+
+async def send(_):
+    return None
+
+
+def append(value: str) -> WebsocketHandler:
+    def _append(ctx: WebsocketContext) -> WebsocketContext:
+        ctx.subprotocols.append(value)
+        return ctx
+
+    return handle_func_sync(_append)
+
+
+def close(ctx: WebsocketContext) -> WebsocketContext:
+    ctx.closed = True
+    return ctx
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "h, result",
+    [
+        (append("a"), ["a"]),
+        (append("a") >> (append("b") >> append("c")), ["a", "b", "c"]),
+        (append("a") >> handle_func_sync(close) >> append("b"), ["a"]),
+        (choose([route("other") >> append("a"), append("b")]), ["b"]),
+        (choose([route("chat") >> append("a"), append("b")]), ["a"]),
+        (choose([route("other")]), None),
+    ],
+)
+async def test_compile(scope, h: WebsocketHandler, result):
+    scope["subprotocols"] = []
+    ctx = WebsocketContext(scope, receive, send)
+    _ctx = await h.compile()(ctx)
+    assert (_ctx.subprotocols if _ctx else None) == result
+
+    scope["subprotocols"] = []
+    ctx = WebsocketContext(scope, receive, send)
+    _ctx = await h(end, ctx)
+    assert (_ctx.subprotocols if _ctx else None) == result
+    assert len(unchain(h)) >= 1
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from moona import asgi, http
+from moona.websocket.context import WebsocketContext
+from moona.websocket.events import accept, on_message
+from moona.websocket.handlers import end
+from moona.websocket.hub import Hub, encode, subscribe
+
+
+async def receive():
+    await asyncio.sleep(0.01)
+    return {"type": "websocket.disconnect", "code": 1001}
+
+
+def outbox(ctx: WebsocketContext) -> list:
+    return list(ctx.outbox._queue)
+
+
+@pytest.mark.parametrize(
+    "data, result",
+    [
+        ("a", {"type": "websocket.send", "text": "a"}),
+        (b"a", {"type": "websocket.send", "bytes": b"a"}),
+        ({"a": [1]}, {"type": "websocket.send", "text": '{"a":[1]}'}),
+    ],
+)
+def test_encode(data, result):
+    assert encode(data) == result
+
+
+def test_publish(scope, send):
+    hub = Hub()
+    first, second, other = (WebsocketContext(scope, receive, send) for _ in range(3))
+    hub.subscribe(first, "news")
+    hub.subscribe(second, "news")
+    hub.subscribe(other, "sport")
+
+    assert hub.publish("news", {"title": "moona"}) == 2
+    assert hub.publish("weather", "sunny") == 0
+    [msg] = outbox(first)
+    assert outbox(second)[0] is msg
+    assert outbox(other) == []
+
+    second.closed = True
+    assert hub.publish("news", "again") == 1
+    assert hub.subscribers("news") == 1
+
+    hub.unsubscribe(first, "news")
+    hub.unsubscribe(other)
+    assert hub.subscribers("news") == hub.subscribers("sport") == 0
+
+
+def test_drop_oldest(scope, send):
+    hub = Hub("drop_oldest")
+    ctx = WebsocketContext(scope, receive, send, max_queue=2)
+    hub.subscribe(ctx, "news")
+    for i in range(3):
+        assert hub.publish("news", str(i)) == 1
+
+    assert [msg["text"] for msg in outbox(ctx)] == ["1", "2"]
+    assert hub.dropped == 1
+
+
+def test_disconnect(scope, send):
+    hub = Hub("disconnect")
+    ctx = WebsocketContext(scope, receive, send, max_queue=2)
+    hub.subscribe(ctx, "news")
+    assert [hub.publish("news", str(i)) for i in range(3)] == [1, 1, 0]
+
+    assert outbox(ctx) == [{"type": "websocket.close", "code": 1008, "reason": ""}]
+    assert hub.disconnected == 1
+    assert hub.subscribers("news") == 0
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        Hub("block")
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_closed(scope, send, sent):
+    hub = Hub("disconnect")
+    ctx = WebsocketContext(scope, receive, send, max_queue=1)
+    await accept()(end, ctx)
+    hub.subscribe(ctx, "news")
+    for i in range(3):
+        hub.publish("news", str(i))
+    await ctx.writer
+
+    assert ctx.closed
+    assert ctx.close_code == 1008
+    assert sent[-1] == {"type": "websocket.close", "code": 1008, "reason": ""}
+
+
+@pytest.mark.asyncio
+async def test_publish_from_http(scope, send, sent):
+    hub = Hub()
+
+    async def ignore(ctx, data):
+        return None
+
+    @http.handler
+    async def publish(nxt, ctx):
+        ctx.state["hub"].publish("news", {"title": "moona"})
+        return await nxt(ctx)
+
+    app = asgi.create(
+        http_handler=publish >> http.no_content,
+        websocket_handler=accept() >> subscribe(hub, "news") >> on_message(ignore),
+        state={"hub": hub},
+    )
+
+    ctx_task = asyncio.ensure_future(app(scope, connected(), send))
+    await asyncio.sleep(0)
+    assert hub.subscribers("news") == 1
+
+    http_scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "method": "POST",
+        "path": "/news",
+        "query_string": b"",
+        "headers": [],
+    }
+    await app(http_scope, receive, send)
+    await ctx_task
+
+    assert {"type": "websocket.send", "text": '{"title":"moona"}'} in sent
+    assert hub.subscribers("news") == 0
+
+
+def connected():
+    messages = [{"type": "websocket.connect"}]
+
+    async def _receive():
+        match messages:
+            case [msg]:
+                messages.clear()
+                return msg
+            case []:
+                return await receive()
+
+    return _receive